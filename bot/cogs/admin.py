@@ -8,7 +8,13 @@ from discord import app_commands
 from discord.ext import commands
 
 from services import ProjectService, TaskService, UserService
-from utils import init_database
+from services.custom_field_service import schema_cache
+from services.project_service import channel_project_cache
+from services.saved_view_service import view_results
+from services.task_service import task_cache
+from services.user_service import identity_cache
+from utils import get_pool_stats, init_database
+from utils.embed_cache import task_embed_cache
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +90,52 @@ Cancelled: {task_stats['cancelled']}"""
                 inline=True,
             )
 
+            # Connection pool
+            pool_stats = get_pool_stats()
+            if pool_stats["size"] is not None:
+                occupancy = (
+                    f"Checked out: {pool_stats['checkedout']}/{pool_stats['size']}\n"
+                    f"Overflow: {pool_stats['overflow']}\n"
+                )
+            else:
+                occupancy = f"Pool: {pool_stats['pool_class']}\n"
+            pool_text = (
+                f"{occupancy}"
+                f"Checkouts: {pool_stats['checkouts']}\n"
+                f"Avg wait: {pool_stats['avg_wait_ms']:.1f}ms\n"
+                f"Max wait: {pool_stats['max_wait_ms']:.1f}ms\n"
+                f"Timeouts: {pool_stats['timeouts']}"
+            )
+            embed.add_field(name="🗄️ Connection Pool", value=pool_text, inline=True)
+
+            cache_lines = []
+            for label, cache in (
+                ("Users", identity_cache),
+                ("Tasks", task_cache),
+                ("Channels", channel_project_cache),
+                ("Embeds", task_embed_cache),
+                ("Views", view_results),
+                ("Schemas", schema_cache),
+            ):
+                cache_stats = cache.stats()
+                cache_lines.append(
+                    f"{label}: {cache_stats['size']}/{cache_stats['maxsize']}, "
+                    f"{cache_stats['hit_rate']:.0%} hits"
+                )
+            embed.add_field(name="🧠 Caches", value="\n".join(cache_lines), inline=True)
+
+            histogram = [
+                f"{bucket:>8} {count}"
+                for bucket, count in pool_stats["wait_histogram"].items()
+                if count
+            ]
+            if histogram:
+                embed.add_field(
+                    name="⏳ Checkout Wait",
+                    value="```\n" + "\n".join(histogram) + "\n```",
+                    inline=False,
+                )
+
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
         except Exception as e:
@@ -67,7 +67,7 @@ class CalendarIntegrationCog(commands.Cog):
     ):
         """View upcoming task deadlines."""
         # Get tasks assigned to user with due dates in the next N days
-        tasks = await TaskService.get_tasks_for_user(interaction.user.id)
+        tasks = await TaskService.get_task_rows_for_user(interaction.user.id)
 
         # Filter tasks with due dates in the specified range
         now = datetime.now(timezone.utc)
@@ -128,16 +128,13 @@ class CalendarIntegrationCog(commands.Cog):
     @app_commands.command(name="overdue-tasks", description="View overdue tasks")
     async def overdue_tasks(self, interaction: discord.Interaction):
         """View overdue tasks."""
-        overdue_tasks = await TaskService.get_overdue_tasks()
+        overdue_tasks = await TaskService.get_overdue_task_rows()
 
         # Filter to only tasks assigned to the user
         user_overdue_tasks = [
             task
             for task in overdue_tasks
-            if any(
-                assignee.discord_id == interaction.user.id
-                for assignee in task.assignees
-            )
+            if interaction.user.id in task.assignee_discord_ids
         ]
 
         if not user_overdue_tasks:
@@ -198,7 +195,7 @@ class CalendarIntegrationCog(commands.Cog):
         # Get tasks due today for all users in the guild
         async with interaction.channel.typing():
             # Fetch tasks for today
-            all_today_tasks = await TaskService.get_tasks_by_date_range(
+            all_today_tasks = await TaskService.get_task_rows_by_date_range(
                 start_date=start_of_day, end_date=end_of_day
             )
 
@@ -219,10 +216,10 @@ class CalendarIntegrationCog(commands.Cog):
             # Group tasks by assignee
             tasks_by_assignee = {}
             for task in all_today_tasks:
-                for assignee in task.assignees:
-                    if assignee.discord_id not in tasks_by_assignee:
-                        tasks_by_assignee[assignee.discord_id] = []
-                    tasks_by_assignee[assignee.discord_id].append(task)
+                for discord_id in task.assignee_discord_ids:
+                    if discord_id not in tasks_by_assignee:
+                        tasks_by_assignee[discord_id] = []
+                    tasks_by_assignee[discord_id].append(task)
 
             # Add a field for each user
             for discord_id, tasks in tasks_by_assignee.items():
@@ -315,7 +312,7 @@ class CalendarIntegrationCog(commands.Cog):
 
         # Get all tasks for the week
         async with interaction.channel.typing():
-            weekly_tasks = await TaskService.get_tasks_by_date_range(
+            weekly_tasks = await TaskService.get_task_rows_by_date_range(
                 start_date=start_of_week, end_date=end_of_week
             )
 
@@ -379,9 +376,9 @@ class CalendarIntegrationCog(commands.Cog):
 
                     # Get assignee names
                     assignee_names = []
-                    for assignee in task.assignees:
+                    for discord_id in task.assignee_discord_ids:
                         for member in interaction.guild.members:
-                            if member.id == assignee.discord_id:
+                            if member.id == discord_id:
                                 assignee_names.append(member.display_name)
                                 break
 
@@ -8,8 +8,10 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
+from bot.cogs.tasks import TASKS_PER_PAGE, TaskPageView
 from services import ProjectService, TaskService
 from models import TaskStatus
+from utils import unit_of_work
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +31,14 @@ class ProjectView(discord.ui.View):
             await interaction.response.send_message("❌ Project not found.", ephemeral=True)
             return
             
-        tasks = await TaskService.get_tasks_for_project(self.project_id)
+        project_id = self.project_id
+
+        def fetch_page(cursor: Optional[str]):
+            return TaskService.get_task_rows_for_project(
+                project_id, limit=TASKS_PER_PAGE, cursor=cursor
+            )
+
+        tasks = await fetch_page(None)
         
         if not tasks:
             await interaction.response.send_message(
@@ -38,29 +47,17 @@ class ProjectView(discord.ui.View):
             )
             return
             
-        # Create embed with task list
-        embed = discord.Embed(
-            title=f"📋 Tasks for {project.name}",
-            color=int(project.color.replace('#', ''), 16) if project.color else 0x3498db,
-            timestamp=datetime.now(timezone.utc)
+        view = TaskPageView(
+            f"📋 Tasks for {project.name}",
+            fetch_page,
+            tasks,
+            color=int(project.color.replace('#', ''), 16) if project.color else 0x3498db
+        )
+        await interaction.response.send_message(
+            embed=view.create_embed(),
+            view=view,
+            ephemeral=True
         )
-        
-        for task in tasks[:10]:  # Limit to 10 tasks
-            status_emoji = "✅" if task.status == TaskStatus.DONE.value else "⏳"
-            due_text = ""
-            if task.due_date:
-                due_text = f" (Due: <t:{int(task.due_date.timestamp())}:d>)"
-            
-            embed.add_field(
-                name=f"{status_emoji} {task.title}",
-                value=f"ID: {task.id} | Status: {task.status.replace('_', ' ').title()}{due_text}",
-                inline=False
-            )
-        
-        if len(tasks) > 10:
-            embed.set_footer(text=f"Showing 10 of {len(tasks)} tasks")
-            
-        await interaction.response.send_message(embed=embed, ephemeral=True)
     
     @discord.ui.button(label="Members", style=discord.ButtonStyle.success, emoji="👥")
     async def manage_members(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -130,16 +127,17 @@ class CreateProjectModal(discord.ui.Modal, title="Create New Project"):
             if not color.startswith('#') or len(color) != 7:
                 color = "#3498db"
             
-            # Create project
-            project = await ProjectService.create_project(
-                name=self.project_name.value,
-                description=self.description.value if self.description.value else None,
-                discord_channel_id=interaction.channel_id,
-                color=color
-            )
-            
-            # Add creator as member
-            await ProjectService.add_member_to_project(project.id, interaction.user.id)
+            # Create project and add creator as member in one transaction
+            async with unit_of_work():
+                project = await ProjectService.create_project(
+                    name=self.project_name.value,
+                    description=self.description.value or None,
+                    discord_channel_id=interaction.channel_id,
+                    color=color
+                )
+                await ProjectService.add_member_to_project(
+                    project.id, interaction.user.id
+                )
             
             # Create embed
             embed = create_project_embed(project)
@@ -310,19 +308,18 @@ class ProjectsCog(commands.Cog):
             elif not color:
                 color = "#3498db"
             
-            # Create project
-            project = await ProjectService.create_project(
-                name=name,
-                description=description,
-                discord_channel_id=interaction.channel_id,
-                color=color
-            )
-            
-            # Add creator as member
-            await ProjectService.add_member_to_project(
-                project.id, 
-                interaction.user.id
-            )
+            # Create project and add creator as member in one transaction
+            async with unit_of_work():
+                project = await ProjectService.create_project(
+                    name=name,
+                    description=description,
+                    discord_channel_id=interaction.channel_id,
+                    color=color
+                )
+                await ProjectService.add_member_to_project(
+                    project.id,
+                    interaction.user.id
+                )
             
             # Create embed and view
             embed = create_project_embed(project)
@@ -3,24 +3,57 @@
 import logging
 import re
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Awaitable, Callable, List, Optional
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from models import TaskPriority, TaskStatus
-from services import ProjectService, TaskService
+from services import ProjectService, SavedViewService, TaskService
+from services.recurrence import InvalidRecurrenceError
+from services.saved_view_service import SavedViewError, ViewSpec
+from services.task_service import TaskConflictError
+from services.task_import import MAX_IMPORT_BYTES, TaskImportError, parse_task_file
+from services.task_rows import TaskRow
+from utils.embed_cache import cached_embed, task_embed_key
+from utils.pagination import Page
 
 logger = logging.getLogger(__name__)
 
 
+# Shown when a task changed between being displayed and being updated
+CONFLICT_MESSAGE = (
+    "⚠️ Someone else changed this task in the meantime, so your change was "
+    "not saved. The message now shows the latest version; try again if needed."
+)
+
+
 class TaskView(discord.ui.View):
-    """Interactive view for task management."""
+    """Interactive view for task management.
+
+    ``version`` is the task version shown in the message. Updates made
+    through the view only apply while the task is still at that version.
+    """
 
-    def __init__(self, task_id: int):
+    def __init__(self, task_id: int, version: Optional[int] = None):
         super().__init__(timeout=300)
         self.task_id = task_id
+        self.version = version
+
+    async def show_conflict(self, interaction: discord.Interaction):
+        """Refresh the message with the latest task and explain the conflict."""
+        task = await TaskService.get_task_by_id(self.task_id)
+        if task is None:
+            await interaction.response.edit_message(
+                content="❌ Task not found.", embed=None, view=None
+            )
+            return
+        self.version = task.version
+        await interaction.response.edit_message(
+            embed=create_task_embed(task), view=self
+        )
+        await interaction.followup.send(CONFLICT_MESSAGE, ephemeral=True)
 
     @discord.ui.button(label="Edit", style=discord.ButtonStyle.primary, emoji="✏️")
     async def edit_task(
@@ -35,8 +68,8 @@ class TaskView(discord.ui.View):
             )
             return
 
-        # Create the modal
-        modal = EditTaskModal(self.task_id)
+        # Create the modal; edits apply to the version shown in the modal
+        modal = EditTaskModal(self.task_id, task.version)
 
         # Pre-fill the modal fields with existing task data
         if hasattr(task, "title") and task.title is not None:
@@ -78,8 +111,18 @@ class TaskView(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         """Mark task as complete."""
-        task = await TaskService.update_task(self.task_id, status=TaskStatus.DONE.value)
+        try:
+            task = await TaskService.update_task(
+                self.task_id,
+                expected_version=self.version,
+                status=TaskStatus.DONE.value,
+            )
+        except TaskConflictError:
+            await self.show_conflict(interaction)
+            return
+
         if task:
+            self.version = task.version
             embed = create_task_embed(task)
             await interaction.response.edit_message(embed=embed, view=self)
         else:
@@ -203,14 +246,16 @@ class CreateTaskModal(discord.ui.Modal, title="Create New Task"):
             embed = create_task_embed(task)
             # Convert SQLAlchemy Column to Python int
             task_id = getattr(task, "id")
-            view = TaskView(task_id)
+            view = TaskView(task_id, task.version)
 
             await interaction.response.send_message(embed=embed, view=view)
 
             # Update task with message ID
             message = await interaction.original_response()
             # Convert SQLAlchemy Column to Python int
-            await TaskService.update_task(task_id, discord_message_id=message.id)
+            task = await TaskService.update_task(task_id, discord_message_id=message.id)
+            if task:
+                view.version = task.version
             logger.info(f"Task updated with message ID: {message.id}")
 
         except Exception as e:
@@ -259,9 +304,11 @@ class EditTaskModal(discord.ui.Modal, title="Edit Task"):
         max_length=500,
     )
 
-    def __init__(self, task_id: int):
+    def __init__(self, task_id: int, version: Optional[int] = None):
         super().__init__()
         self.task_id = task_id
+        # Version of the task the modal was opened on
+        self.version = version
         # Populate fields will be handled in callback before the modal is shown
 
     async def on_submit(self, interaction: discord.Interaction):
@@ -287,8 +334,22 @@ class EditTaskModal(discord.ui.Modal, title="Edit Task"):
                     )
                     return
 
+            # Update task; rejected if it changed since the modal was opened
+            try:
+                task = await TaskService.update_task(
+                    task_id=self.task_id,
+                    expected_version=self.version,
+                    title=self.task_title.value,
+                    description=self.description.value,
+                    priority=priority,
+                    due_date=due_date,
+                )
+            except TaskConflictError:
+                await TaskView(self.task_id).show_conflict(interaction)
+                return
+
             # Parse assignees
-            if self.assignees.value:
+            if task and self.assignees.value:
                 mentions = re.findall(r"<@!?(\d+)>", self.assignees.value)
                 if mentions:
                     assignee_discord_ids = [int(uid) for uid in mentions]
@@ -296,21 +357,13 @@ class EditTaskModal(discord.ui.Modal, title="Edit Task"):
                     await TaskService.assign_users_to_task(
                         task_id=self.task_id, user_discord_ids=assignee_discord_ids
                     )
-
-            # Update task
-            task = await TaskService.update_task(
-                task_id=self.task_id,
-                title=self.task_title.value,
-                description=self.description.value,
-                priority=priority,
-                due_date=due_date,
-            )
+                    task = await TaskService.get_task_by_id(self.task_id)
 
             if task:
                 embed = create_task_embed(task)
                 # Convert SQLAlchemy Column to Python int
                 task_id = getattr(task, "id")
-                view = TaskView(task_id)
+                view = TaskView(task_id, task.version)
                 await interaction.response.edit_message(embed=embed, view=view)
             else:
                 msg = "❌ Failed to update task."
@@ -323,7 +376,17 @@ class EditTaskModal(discord.ui.Modal, title="Edit Task"):
 
 
 def create_task_embed(task) -> discord.Embed:
-    """Create Discord embed for a task."""
+    """Create Discord embed for a task, reusing the cached render if current.
+
+    Dates are Discord timestamps that each client shows in its own locale
+    and timezone, so one render serves every viewer.
+    """
+    if task.id is None:
+        return _build_task_embed(task)
+    return cached_embed(task_embed_key(task, "card"), lambda: _build_task_embed(task))
+
+
+def _build_task_embed(task) -> discord.Embed:
     # Status color mapping
     status_colors = {
         TaskStatus.TODO.value: 0x95A5A6,  # Gray
@@ -390,6 +453,156 @@ def create_task_embed(task) -> discord.Embed:
     return embed
 
 
+# Tasks shown per page of a task list
+TASKS_PER_PAGE = 10
+
+
+def create_task_list_embed(
+    title: str, tasks: List[TaskRow], page_number: int = 1, color: int = 0x3498DB
+) -> discord.Embed:
+    """Create Discord embed for one page of a task list."""
+    embed = discord.Embed(
+        title=title, color=color, timestamp=datetime.now(timezone.utc)
+    )
+
+    for task in tasks:
+        status_emoji = "✅" if task.status == TaskStatus.DONE.value else "⏳"
+        due_text = ""
+        if task.due_date is not None:
+            due_text = f" (Due: <t:{int(task.due_date.timestamp())}:d>)"
+
+        status_formatted = str(task.status).replace("_", " ").title()
+        embed.add_field(
+            name=f"{status_emoji} {task.title}",
+            value=f"ID: {task.id} | Status: {status_formatted}{due_text}",
+            inline=False,
+        )
+
+    embed.set_footer(text=f"Page {page_number}")
+    return embed
+
+
+class TaskPageView(discord.ui.View):
+    """Pages through a task list using keyset cursors.
+
+    ``fetch_page`` is called with the cursor of the page to show (None for
+    the first page), so every page costs one indexed query however deep
+    the user pages. Tasks picked in the multi-select can be completed or
+    reassigned together, with one statement for the whole selection.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        fetch_page: Callable[[Optional[str]], Awaitable[Page[TaskRow]]],
+        first_page: Page[TaskRow],
+        color: int = 0x3498DB,
+    ):
+        super().__init__(timeout=300)
+        self.title = title
+        self.fetch_page = fetch_page
+        self.page = first_page
+        self.color = color
+        # Cursor of every page up to the current one, for going back
+        self.cursors: List[Optional[str]] = [None]
+        self.selected_task_ids: List[int] = []
+        self._update_buttons()
+
+    def create_embed(self) -> discord.Embed:
+        """Embed for the current page."""
+        return create_task_list_embed(
+            self.title, self.page, len(self.cursors), self.color
+        )
+
+    def _update_buttons(self):
+        self.previous_page.disabled = len(self.cursors) == 1
+        self.next_page.disabled = self.page.next_cursor is None
+
+        # Selections do not carry over to another page
+        self.selected_task_ids = []
+        self.select_tasks.options = [
+            discord.SelectOption(
+                label=task.title[:100],
+                value=str(task.id),
+                description=f"ID: {task.id} | {str(task.status).replace('_', ' ')}",
+            )
+            for task in self.page
+        ] or [discord.SelectOption(label="No tasks", value="0")]
+        self.select_tasks.max_values = max(len(self.page), 1)
+        self.select_tasks.disabled = not self.page
+        self.complete_selected.disabled = True
+        self.assign_selected.disabled = True
+
+    async def _show(self, interaction: discord.Interaction):
+        self.page = await self.fetch_page(self.cursors[-1])
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.create_embed(), view=self)
+
+    @discord.ui.select(placeholder="Select tasks...", min_values=1, row=0)
+    async def select_tasks(
+        self, interaction: discord.Interaction, select: discord.ui.Select
+    ):
+        """Remember the selected tasks for the bulk actions."""
+        self.selected_task_ids = [int(value) for value in select.values]
+        self.complete_selected.disabled = False
+        self.assign_selected.disabled = False
+        await interaction.response.edit_message(view=self)
+
+    @discord.ui.select(
+        cls=discord.ui.UserSelect,
+        placeholder="Assign selected tasks to...",
+        min_values=1,
+        max_values=10,
+        row=1,
+    )
+    async def assign_selected(
+        self, interaction: discord.Interaction, select: discord.ui.UserSelect
+    ):
+        """Replace the assignees of every selected task."""
+        count = len(self.selected_task_ids)
+        await TaskService.bulk_assign(
+            self.selected_task_ids, [user.id for user in select.values]
+        )
+        await self._show(interaction)
+        mentions = ", ".join(user.mention for user in select.values)
+        await interaction.followup.send(
+            f"✅ Assigned {count} tasks to {mentions}.", ephemeral=True
+        )
+
+    @discord.ui.button(
+        label="Previous", style=discord.ButtonStyle.secondary, emoji="◀️", row=2
+    )
+    async def previous_page(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        """Show the previous page."""
+        self.cursors.pop()
+        await self._show(interaction)
+
+    @discord.ui.button(
+        label="Next", style=discord.ButtonStyle.primary, emoji="▶️", row=2
+    )
+    async def next_page(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        """Show the next page."""
+        self.cursors.append(self.page.next_cursor)
+        await self._show(interaction)
+
+    @discord.ui.button(
+        label="Complete selected", style=discord.ButtonStyle.success, emoji="✅", row=2
+    )
+    async def complete_selected(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        """Mark every selected task as done."""
+        count = await TaskService.bulk_update(
+            self.selected_task_ids, status=TaskStatus.DONE.value
+        )
+        await self._show(interaction)
+        await interaction.followup.send(f"✅ Completed {count} tasks.", ephemeral=True)
+
+
 class TasksCog(commands.Cog):
     """Commands for task management."""
 
@@ -436,7 +649,9 @@ class TasksCog(commands.Cog):
             project = None
             channel_id = interaction.channel_id
             if channel_id is not None:
-                project = await ProjectService.get_project_by_channel(channel_id)
+                project = await ProjectService.get_project_summary_by_channel(
+                    channel_id
+                )
 
             # Set project ID
             project_id = None
@@ -459,13 +674,15 @@ class TasksCog(commands.Cog):
             embed = create_task_embed(task)
             # Convert SQLAlchemy Column to Python int
             task_id = getattr(task, "id")
-            view = TaskView(task_id)
+            view = TaskView(task_id, task.version)
 
             await interaction.response.send_message(embed=embed, view=view)
 
             # Update task with message ID
             message = await interaction.original_response()
-            await TaskService.update_task(task_id, discord_message_id=message.id)
+            task = await TaskService.update_task(task_id, discord_message_id=message.id)
+            if task:
+                view.version = task.version
 
         except Exception as e:
             logger.error(f"Error creating task: {e}")
@@ -488,7 +705,7 @@ class TasksCog(commands.Cog):
         embed = create_task_embed(task)
         # Convert SQLAlchemy Column to Python int
         task_id = getattr(task, "id")
-        view = TaskView(task_id)
+        view = TaskView(task_id, task.version)
 
         await interaction.response.send_message(embed=embed, view=view)
 
@@ -498,9 +715,14 @@ class TasksCog(commands.Cog):
         self, interaction: discord.Interaction, status: Optional[str] = None
     ):
         """View user's assigned tasks."""
-        tasks = await TaskService.get_tasks_for_user(
-            user_discord_id=interaction.user.id, status=status
-        )
+        user_discord_id = interaction.user.id
+
+        def fetch_page(cursor: Optional[str]) -> Awaitable[Page[TaskRow]]:
+            return TaskService.get_task_rows_for_user(
+                user_discord_id, status=status, limit=TASKS_PER_PAGE, cursor=cursor
+            )
+
+        tasks = await fetch_page(None)
 
         if not tasks:
             status_text = f" with status '{status}'" if status else ""
@@ -509,41 +731,125 @@ class TasksCog(commands.Cog):
             )
             return
 
-        # Create embed with task list
-        embed = discord.Embed(
-            title="📋 Your Tasks", color=0x3498DB, timestamp=datetime.now(timezone.utc)
+        view = TaskPageView("📋 Your Tasks", fetch_page, tasks)
+        await interaction.response.send_message(
+            embed=view.create_embed(),
+            view=view,
+            ephemeral=True,
         )
 
-        for task in tasks[:10]:  # Limit to 10 tasks
-            status_emoji = "✅" if str(task.status) == TaskStatus.DONE.value else "⏳"
-            due_text = ""
-            try:
-                if hasattr(task, "due_date") and task.due_date is not None:
-                    due_text = f" (Due: <t:{int(task.due_date.timestamp())}:d>)"
-            except (AttributeError, TypeError) as e:
-                logger.warning(f"Error handling task due date: {e}")
+    @app_commands.command(
+        name="save-view", description="Save a task filter to reopen with /view"
+    )
+    @app_commands.describe(
+        name="Name of the view (saving an existing name replaces it)",
+        status="Only tasks with this status",
+        assignee="Only tasks assigned to this user",
+        due_within_days="Only tasks due within this many days (overdue included)",
+        tags="Comma separated tags",
+        match_all_tags="Require every tag instead of any of them",
+        sort="Order of the tasks",
+        this_project="Only tasks of this channel's project",
+    )
+    @app_commands.choices(
+        status=[
+            app_commands.Choice(
+                name=status.value.replace("_", " ").title(), value=status.value
+            )
+            for status in TaskStatus
+        ],
+        sort=[
+            app_commands.Choice(name="Newest first", value="newest"),
+            app_commands.Choice(name="Due date", value="due"),
+            app_commands.Choice(name="Priority", value="priority"),
+        ],
+    )
+    async def save_view(
+        self,
+        interaction: discord.Interaction,
+        name: str,
+        status: Optional[str] = None,
+        assignee: Optional[discord.Member] = None,
+        due_within_days: Optional[int] = None,
+        tags: Optional[str] = None,
+        match_all_tags: bool = False,
+        sort: str = "newest",
+        this_project: bool = False,
+    ):
+        """Save a filter and sort as a named view."""
+        project_id = None
+        if this_project and interaction.channel_id is not None:
+            project = await ProjectService.get_project_summary_by_channel(
+                interaction.channel_id
+            )
+            if not project:
+                await interaction.response.send_message(
+                    "❌ This channel has no project.", ephemeral=True
+                )
+                return
+            project_id = project.id
 
-            task_id = getattr(task, "id")
-            task_status = str(task.status)
-            task_title = str(task.title)
+        try:
+            spec = ViewSpec(
+                status=status,
+                assignee_discord_id=assignee.id if assignee else None,
+                project_id=project_id,
+                due_within_days=due_within_days,
+                tags=tuple((tags or "").split(",")),
+                match_all_tags=match_all_tags,
+                sort=sort,
+            )
+            view = await SavedViewService.save_view(name, spec, interaction.user.id)
+        except SavedViewError as e:
+            await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+            return
 
-            status_formatted = task_status.replace("_", " ").title()
-            field_value = f"ID: {task_id} | Status: {status_formatted}{due_text}"
+        await interaction.response.send_message(
+            f"✅ Saved view **{view.name}**. Open it with `/view {view.name}`.",
+            ephemeral=True,
+        )
+
+    @app_commands.command(name="view", description="Show a saved task view")
+    @app_commands.describe(name="Name of the saved view")
+    async def show_view(self, interaction: discord.Interaction, name: str):
+        """Show the tasks of a saved view."""
+        tasks = await SavedViewService.run_view(name)
 
-            embed.add_field(
-                name=f"{status_emoji} {task_title}", value=field_value, inline=False
+        if tasks is None:
+            await interaction.response.send_message(
+                f"❌ No saved view named '{name}'.", ephemeral=True
             )
+            return
 
-        if len(tasks) > 10:
-            embed.set_footer(text=f"Showing 10 of {len(tasks)} tasks")
+        if not tasks:
+            await interaction.response.send_message(
+                f"📝 No tasks match the view '{name}'.", ephemeral=True
+            )
+            return
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        # Embeds hold at most 25 fields
+        embed = create_task_list_embed(f"🔎 {name}", tasks[:25])
+        if len(tasks) > 25:
+            embed.set_footer(text=f"Showing 25 of {len(tasks)} tasks")
+        await interaction.response.send_message(embed=embed)
+
+    @show_view.autocomplete("name")
+    async def view_name_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> List[app_commands.Choice[str]]:
+        """Suggest saved view names."""
+        names = await SavedViewService.get_view_names()
+        return [
+            app_commands.Choice(name=name, value=name)
+            for name in names
+            if current.lower() in name.lower()
+        ][:25]
 
     @commands.command(name="task-modal")
     async def create_task_modal(self, ctx):
         """Open task creation modal (prefix command)."""
         # Get project for current channel
-        project = await ProjectService.get_project_by_channel(ctx.channel.id)
+        project = await ProjectService.get_project_summary_by_channel(ctx.channel.id)
 
         project_id = None
         if project:
@@ -577,12 +883,14 @@ class TasksCog(commands.Cog):
         due_date="Due date (YYYY-MM-DD)",
         priority="Task priority",
         end_date="End date for recurring task (YYYY-MM-DD)",
+        rule="Advanced: RRULE such as FREQ=WEEKLY;BYDAY=MO,WE,FR (overrides pattern)",
     )
     @app_commands.choices(
         pattern=[
             app_commands.Choice(name="Daily", value="daily"),
             app_commands.Choice(name="Weekly", value="weekly"),
             app_commands.Choice(name="Monthly", value="monthly"),
+            app_commands.Choice(name="Yearly", value="yearly"),
         ],
         priority=[
             app_commands.Choice(name="Low", value="low"),
@@ -602,6 +910,7 @@ class TasksCog(commands.Cog):
         due_date: Optional[str] = None,
         priority: Optional[str] = "medium",
         end_date: Optional[str] = None,
+        rule: Optional[str] = None,
     ):
         """Create a recurring task."""
         # Parse due date if provided
@@ -645,17 +954,19 @@ class TasksCog(commands.Cog):
                 assignee_discord_ids=assignee_discord_ids,
                 due_date=due_date_obj,
                 discord_channel_id=interaction.channel_id,
-                recurrence_pattern=pattern,
+                recurrence_pattern=rule or pattern,
                 recurrence_frequency=frequency,
                 recurrence_end_date=end_date_obj,
             )
 
             embed = create_task_embed(task)
-            view = TaskView(task.id)
+            view = TaskView(task.id, task.version)
 
             await interaction.response.send_message(
                 "✅ Recurring task created successfully!", embed=embed, view=view
             )
+        except InvalidRecurrenceError as e:
+            await interaction.response.send_message(f"❌ {e}", ephemeral=True)
         except Exception as e:
             logger.error(f"Error creating recurring task: {e}", exc_info=True)
             await interaction.response.send_message(
@@ -737,7 +1048,7 @@ class TasksCog(commands.Cog):
             )
 
             embed = create_task_embed(task)
-            view = TaskView(task.id)
+            view = TaskView(task.id, task.version)
 
             await interaction.response.send_message(
                 "✅ Task created successfully!", embed=embed, view=view
@@ -748,6 +1059,64 @@ class TasksCog(commands.Cog):
                 f"❌ Failed to create task: {str(e)}", ephemeral=True
             )
 
+    @app_commands.command(
+        name="import-tasks", description="Create tasks from a CSV or JSON file"
+    )
+    @app_commands.describe(
+        file="CSV with a header row (title, description, priority, due_date, "
+        "tags, estimated_hours, assignees) or a JSON list of tasks"
+    )
+    async def import_tasks(
+        self, interaction: discord.Interaction, file: discord.Attachment
+    ):
+        """Import a backlog of tasks into the current channel's project."""
+        if file.size > MAX_IMPORT_BYTES:
+            await interaction.response.send_message(
+                f"❌ Import files are limited to {MAX_IMPORT_BYTES // 1024} KB.",
+                ephemeral=True,
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        try:
+            tasks = parse_task_file(file.filename, await file.read())
+        except TaskImportError as e:
+            await interaction.followup.send(f"❌ {e}", ephemeral=True)
+            return
+
+        if not tasks:
+            await interaction.followup.send(
+                "📝 The file contains no tasks.", ephemeral=True
+            )
+            return
+
+        try:
+            project = None
+            if interaction.channel_id is not None:
+                project = await ProjectService.get_project_summary_by_channel(
+                    interaction.channel_id
+                )
+
+            task_ids = await TaskService.create_tasks_bulk(
+                tasks,
+                creator_discord_id=interaction.user.id,
+                project_id=project.id if project else None,
+                discord_channel_id=interaction.channel_id,
+            )
+        except Exception as e:
+            logger.error(f"Error importing tasks: {e}", exc_info=True)
+            await interaction.followup.send(
+                "❌ Failed to import tasks. Nothing was created.", ephemeral=True
+            )
+            return
+
+        project_text = f" into **{project.name}**" if project else ""
+        await interaction.followup.send(
+            f"✅ Imported {len(task_ids)} tasks{project_text}.",
+            ephemeral=True,
+        )
+
 
 async def setup(bot):
     """Setup function for the cog."""
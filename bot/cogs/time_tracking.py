@@ -103,10 +103,11 @@ class TimeTrackingCog(commands.Cog):
             )
             return
         
-        # Save time entry to the database
+        # Save time entry to the database (entries reference the internal user)
+        (db_user_id,) = await UserService.resolve_user_ids([user_id])
         await TimeEntryService.create_time_entry(
             task_id=task_id,
-            user_id=user_id,
+            user_id=db_user_id,
             duration_hours=duration_hours,
             description=description,
             start_time=start_time,
@@ -2,18 +2,111 @@
 
 import asyncio
 import logging
-from typing import Optional
+from typing import Iterable, List, Optional, Union
 
 import discord
+from discord import app_commands
 from discord.ext import commands
 
 from config import settings
 from services.notification_service import NotificationService
-from utils import close_database, init_database
+from utils import close_database, ensure_schema
+from utils.query_log import finish_interaction, start_interaction
 
 logger = logging.getLogger(__name__)
 
 
+# Categories of the /help catalog, in display order
+HELP_CATEGORIES = ("Tasks", "Projects", "Time Tracking", "Calendar", "Admin", "General")
+
+
+def _help_category(name: str) -> str:
+    """Category of the /help catalog a command is listed under."""
+    if "task" in name:
+        return "Tasks"
+    if "project" in name:
+        return "Projects"
+    if "time" in name:
+        return "Time Tracking"
+    if "calendar" in name or "event" in name:
+        return "Calendar"
+    if name in ["admin", "settings", "config"]:
+        return "Admin"
+    return "General"
+
+
+def build_help_embed(
+    commands: Iterable[Union[app_commands.Command, app_commands.Group]],
+) -> discord.Embed:
+    """The /help embed listing ``commands`` by category."""
+    embed = discord.Embed(
+        title="Discord Task Manager Help",
+        description="Use these slash commands to manage tasks and projects.",
+        color=0x3498DB,
+    )
+
+    categories = {category: [] for category in HELP_CATEGORIES}
+    for cmd in commands:
+        categories[_help_category(cmd.name)].append(cmd)
+
+    # Add each category to the embed
+    for category, cmds in categories.items():
+        if cmds:
+            # Format command list with descriptions
+            commands_text = "\n".join(
+                [f"• `/{cmd.name}` - {cmd.description}" for cmd in cmds]
+            )
+            embed.add_field(
+                name=f"{category} Commands", value=commands_text, inline=False
+            )
+
+    embed.set_footer(text="All commands are available as slash commands (/)")
+    return embed
+
+
+class TaskManagerCommandTree(app_commands.CommandTree):
+    """Command tree that counts the statements issued by each slash command.
+
+    It also keeps the /help embed, built from the global commands
+    registered locally. Call :meth:`refresh_help_catalog` once commands
+    are loaded; every :meth:`sync` refreshes it again.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.help_embed = build_help_embed([])
+
+    def refresh_help_catalog(self) -> None:
+        """Rebuild the /help embed from the local command tree."""
+        self.help_embed = build_help_embed(self.get_commands())
+
+    async def sync(
+        self, *, guild: Optional[discord.abc.Snowflake] = None
+    ) -> List[app_commands.AppCommand]:
+        """Sync commands with Discord, then refresh the /help catalog."""
+        synced = await super().sync(guild=guild)
+        self.refresh_help_catalog()
+        return synced
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Start statement counting for the command being invoked."""
+        command = interaction.command
+        command_name = (
+            command.qualified_name if command else interaction.data.get("name", "?")
+        )
+        interaction.extras["query_stats"] = start_interaction(command_name)
+        return True
+
+    async def on_error(
+        self, interaction: discord.Interaction, error: app_commands.AppCommandError
+    ):
+        """Report statement counts for failed commands too."""
+        stats = interaction.extras.pop("query_stats", None)
+        if stats is not None:
+            finish_interaction(stats)
+        await super().on_error(interaction, error)
+
+
 class TaskManagerBot(commands.Bot):
     """Main Discord Task Manager Bot class."""
 
@@ -45,6 +138,7 @@ class TaskManagerBot(commands.Bot):
             description="Discord Task Manager",
             case_insensitive=True,
             application_id=app_id,  # This must be an int or None
+            tree_cls=TaskManagerCommandTree,
         )
 
         # Set up event for when the bot is ready
@@ -54,14 +148,15 @@ class TaskManagerBot(commands.Bot):
         """Setup hook called when bot is starting."""
         logger.info("Setting up Discord Task Manager Bot...")
 
-        # Initialize database
-        await init_database()
+        # Make sure the database schema is at the packaged migration head
+        await ensure_schema()
 
         # Load cogs/extensions
         await self.load_extensions()
 
         # Register core commands
         self.register_core_commands()
+        self.tree.refresh_help_catalog()
 
         logger.info("Bot setup complete")
 
@@ -137,71 +232,7 @@ class TaskManagerBot(commands.Bot):
 
         @self.tree.command(name="help", description="Show help information for the bot")
         async def help_command(interaction: discord.Interaction):
-            # Create a help embed
-            embed = discord.Embed(
-                title="Discord Task Manager Help",
-                description="Use these slash commands to manage tasks and projects.",
-                color=0x3498DB,
-            )
-
-            # Get all commands from the bot's command tree
-            commands = await self.tree.fetch_commands()
-
-            # Create command categories
-            categories = {
-                "Tasks": [],
-                "Projects": [],
-                "Time Tracking": [],
-                "Calendar": [],
-                "Admin": [],
-                "General": [],
-            }
-
-            # Categorize commands
-            for cmd in commands:
-                # Check for task related commands
-                if (
-                    cmd.name.startswith("task")
-                    or cmd.name.endswith("task")
-                    or "task" in cmd.name
-                ):
-                    categories["Tasks"].append(cmd)
-                # Check for project related commands
-                elif (
-                    cmd.name.startswith("project")
-                    or cmd.name.endswith("project")
-                    or "project" in cmd.name
-                ):
-                    categories["Projects"].append(cmd)
-                # Check for time tracking commands
-                elif "time" in cmd.name:
-                    categories["Time Tracking"].append(cmd)
-                # Check for calendar commands
-                elif "calendar" in cmd.name or "event" in cmd.name:
-                    categories["Calendar"].append(cmd)
-                # Check for admin commands
-                elif cmd.name in ["admin", "settings", "config"]:
-                    categories["Admin"].append(cmd)
-                # Default category
-                else:
-                    categories["General"].append(cmd)
-
-            # Add each category to the embed
-            for category, cmds in categories.items():
-                if cmds:
-                    # Format command list with descriptions
-                    commands_text = "\n".join(
-                        [f"• `/{cmd.name}` - {cmd.description}" for cmd in cmds]
-                    )
-                    # Add to embed
-                    embed.add_field(
-                        name=f"{category} Commands", value=commands_text, inline=False
-                    )
-
-            # Add footer with additional info
-            embed.set_footer(text="All commands are available as slash commands (/)")
-
-            await interaction.response.send_message(embed=embed)
+            await interaction.response.send_message(embed=self.tree.help_embed)
 
     async def on_ready(self):
         """Handle bot ready event."""
@@ -219,6 +250,14 @@ class TaskManagerBot(commands.Bot):
         self.notification_service.start()
         logger.info("Started notification service")
 
+    async def on_app_command_completion(
+        self, interaction: discord.Interaction, command: app_commands.Command
+    ):
+        """Report statement counts once a slash command has finished."""
+        stats = interaction.extras.pop("query_stats", None)
+        if stats is not None:
+            finish_interaction(stats)
+
     async def on_error(self, event, *args, **kwargs):
         """Handle bot errors."""
         logger.error(f"Bot error in event {event}", exc_info=True)
@@ -1,7 +1,7 @@
 """Configuration management for Discord Task Manager."""
 
 import os
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -23,11 +23,83 @@ class Settings(BaseSettings):
     # Database Configuration
     database_url: str = Field(..., description="Database connection URL")
     database_name: str = Field("discord_task_manager", description="Database name")
+    database_read_url: Optional[str] = Field(
+        None, description="Read replica connection URL for read-only queries"
+    )
+    database_read_your_writes_seconds: float = Field(
+        10.0,
+        description="Seconds a task's reads stay on the primary after it writes",
+    )
+    database_pool_size: int = Field(
+        5, description="Persistent connections kept in the pool"
+    )
+    database_max_overflow: int = Field(
+        10, description="Extra connections allowed above the pool size"
+    )
+    database_pool_timeout: float = Field(
+        30.0, description="Seconds to wait for a free connection"
+    )
+    database_pool_pre_ping: bool = Field(
+        True, description="Test connections for liveness on checkout"
+    )
+    database_pool_recycle: int = Field(
+        1800, description="Seconds after which connections are replaced"
+    )
+    database_statement_cache_size: int = Field(
+        500,
+        description="Prepared statements cached per asyncpg connection (0 disables)",
+    )
+    database_schema_mode: Literal["check", "upgrade", "create"] = Field(
+        "upgrade",
+        description=(
+            "Startup schema handling: check (fail if behind), upgrade (run "
+            "migrations) or create (create_all, dev/test only)"
+        ),
+    )
+    database_sqlite_profile: Literal["production", "default"] = Field(
+        "production", description="SQLite pragma profile (production or default)"
+    )
 
     # Application Configuration
     debug: bool = Field(False, description="Debug mode")
     log_level: str = Field("INFO", description="Logging level")
+    slow_query_threshold_ms: float = Field(
+        200.0, description="Statements slower than this are logged as slow queries"
+    )
+    interaction_query_warning_count: int = Field(
+        25, description="Warn when one interaction issues this many statements"
+    )
     default_timezone: str = Field("UTC", description="Default timezone")
+    user_cache_size: int = Field(
+        1024, description="Discord users whose identity is cached in memory"
+    )
+    user_cache_ttl: float = Field(
+        600.0, description="Seconds a cached user identity is trusted"
+    )
+    task_cache_size: int = Field(
+        512, description="Tasks kept in memory for /task and timer commands"
+    )
+    task_cache_ttl: float = Field(
+        300.0, description="Seconds a cached task is served without reloading"
+    )
+    project_cache_size: int = Field(
+        1024, description="Channels whose project is cached in memory"
+    )
+    project_cache_ttl: float = Field(
+        600.0, description="Seconds a cached channel project is trusted"
+    )
+    view_cache_size: int = Field(
+        256, description="Saved views whose statement and results are cached"
+    )
+    schema_cache_size: int = Field(
+        256, description="Projects whose custom field schema is cached"
+    )
+    embed_cache_size: int = Field(
+        2048, description="Rendered task embeds kept in memory"
+    )
+    embed_cache_ttl: float = Field(
+        900.0, description="Seconds a rendered task embed is reused"
+    )
 
     # Feature Flags
     enable_nlp: bool = Field(True, description="Enable NLP features")
@@ -7,6 +7,7 @@ from alembic import context
 
 # Import your models base
 from models import Base
+from models.search import include_in_autogenerate
 from config.settings import settings
 
 # this is the Alembic Config object, which provides
@@ -47,6 +48,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_in_autogenerate,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -62,6 +64,19 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # The bot passes its own connection when upgrading at startup
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_in_autogenerate,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
@@ -70,7 +85,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_in_autogenerate,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,40 @@
+"""Index time entries for keyset pagination by creation date
+
+Revision ID: 6178b18d9e3e
+Revises: 6cdd2e6a351c
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "6178b18d9e3e"
+down_revision: Union[str, None] = "6cdd2e6a351c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Pages are read newest first per task or user, so the sort key
+    # follows the filter column and each page is a single index range
+    op.create_index(
+        "ix_time_entries_task_id_created_at",
+        "time_entries",
+        ["task_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_time_entries_user_id_created_at",
+        "time_entries",
+        ["user_id", "created_at", "id"],
+    )
+    op.drop_index("ix_time_entries_task_id", table_name="time_entries")
+    op.drop_index("ix_time_entries_user_id", table_name="time_entries")
+
+
+def downgrade() -> None:
+    op.create_index("ix_time_entries_user_id", "time_entries", ["user_id"])
+    op.create_index("ix_time_entries_task_id", "time_entries", ["task_id"])
+    op.drop_index("ix_time_entries_user_id_created_at", table_name="time_entries")
+    op.drop_index("ix_time_entries_task_id_created_at", table_name="time_entries")
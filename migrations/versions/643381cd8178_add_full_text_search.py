@@ -0,0 +1,86 @@
+"""Add full-text search indexes for tasks and projects
+
+Revision ID: 643381cd8178
+Revises: 6178b18d9e3e
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "643381cd8178"
+down_revision: Union[str, None] = "6178b18d9e3e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match models.search.SEARCH_COLUMNS at this revision
+SEARCH_COLUMNS = {
+    "tasks": ("title", "description"),
+    "projects": ("name", "description"),
+}
+
+
+def _upgrade_postgresql(table: str, primary: str, secondary: str) -> None:
+    # Generated column: PostgreSQL keeps it in sync on insert/update
+    op.execute(
+        f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ("
+        f"setweight(to_tsvector('english', coalesce({primary}, '')), 'A') || "
+        f"setweight(to_tsvector('english', coalesce({secondary}, '')), 'B')"
+        f") STORED"
+    )
+    op.execute(
+        f"CREATE INDEX ix_{table}_search_vector ON {table} USING gin (search_vector)"
+    )
+
+
+def _upgrade_sqlite(table: str, primary: str, secondary: str) -> None:
+    fts = f"{table}_fts"
+    names = f"{primary}, {secondary}"
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {names}) "
+        f"VALUES ('delete', old.id, old.{primary}, old.{secondary});"
+    )
+    insert_new = (
+        f"INSERT INTO {fts}(rowid, {names}) "
+        f"VALUES (new.id, new.{primary}, new.{secondary});"
+    )
+    op.execute(
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{table}', "
+        f"content_rowid='id', tokenize='unicode61')"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} BEGIN {insert_new} END"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} BEGIN {delete_old} END"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_update AFTER UPDATE OF {names} ON {table} "
+        f"BEGIN {delete_old} {insert_new} END"
+    )
+    # Index the rows that already exist
+    op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table, (primary, secondary) in SEARCH_COLUMNS.items():
+        if dialect == "postgresql":
+            _upgrade_postgresql(table, primary, secondary)
+        elif dialect == "sqlite":
+            _upgrade_sqlite(table, primary, secondary)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table in SEARCH_COLUMNS:
+        if dialect == "postgresql":
+            op.execute(f"DROP INDEX ix_{table}_search_vector")
+            op.execute(f"ALTER TABLE {table} DROP COLUMN search_vector")
+        elif dialect == "sqlite":
+            for trigger in ("insert", "delete", "update"):
+                op.execute(f"DROP TRIGGER {table}_fts_{trigger}")
+            op.execute(f"DROP TABLE {table}_fts")
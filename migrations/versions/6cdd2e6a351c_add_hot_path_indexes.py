@@ -0,0 +1,67 @@
+"""Add indexes for hot task, time entry and membership queries
+
+Revision ID: 6cdd2e6a351c
+Revises: 47a6552f8abd
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "6cdd2e6a351c"
+down_revision: Union[str, None] = "47a6552f8abd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match models.OPEN_TASK_PREDICATE
+OPEN_TASK_PREDICATE = sa.text("status != 'done' AND status != 'cancelled'")
+
+
+def upgrade() -> None:
+    # Overdue / date-range queries: open tasks ordered by due date
+    op.create_index(
+        "ix_tasks_open_due_date",
+        "tasks",
+        ["due_date"],
+        postgresql_where=OPEN_TASK_PREDICATE,
+        sqlite_where=OPEN_TASK_PREDICATE,
+    )
+
+    # Project task lists ordered by creation date
+    op.create_index(
+        "ix_tasks_project_id_created_at", "tasks", ["project_id", "created_at"]
+    )
+
+    # Lookups from Discord messages and channels
+    op.create_index("ix_tasks_discord_message_id", "tasks", ["discord_message_id"])
+    op.create_index("ix_tasks_discord_channel_id", "tasks", ["discord_channel_id"])
+    op.create_index(
+        "ix_projects_discord_channel_id", "projects", ["discord_channel_id"]
+    )
+
+    # Time entries by task and by user
+    op.create_index("ix_time_entries_task_id", "time_entries", ["task_id"])
+    op.create_index("ix_time_entries_user_id", "time_entries", ["user_id"])
+
+    # Association tables: the primary keys lead with task_id/project_id
+    op.create_index(
+        "ix_task_assignees_user_id", "task_assignees", ["user_id", "task_id"]
+    )
+    op.create_index(
+        "ix_project_members_user_id", "project_members", ["user_id", "project_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_members_user_id", table_name="project_members")
+    op.drop_index("ix_task_assignees_user_id", table_name="task_assignees")
+    op.drop_index("ix_time_entries_user_id", table_name="time_entries")
+    op.drop_index("ix_time_entries_task_id", table_name="time_entries")
+    op.drop_index("ix_projects_discord_channel_id", table_name="projects")
+    op.drop_index("ix_tasks_discord_channel_id", table_name="tasks")
+    op.drop_index("ix_tasks_discord_message_id", table_name="tasks")
+    op.drop_index("ix_tasks_project_id_created_at", table_name="tasks")
+    op.drop_index("ix_tasks_open_due_date", table_name="tasks")
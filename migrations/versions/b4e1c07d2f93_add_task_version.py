@@ -0,0 +1,29 @@
+"""Add a version column to tasks for optimistic locking
+
+Revision ID: b4e1c07d2f93
+Revises: 643381cd8178
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "b4e1c07d2f93"
+down_revision: Union[str, None] = "643381cd8178"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows start at version 1, like newly created tasks
+    op.add_column(
+        "tasks",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("tasks", "version")
@@ -0,0 +1,95 @@
+"""Persist the next occurrence of recurring tasks
+
+Revision ID: d2a9e5b37c14
+Revises: b4e1c07d2f93
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from datetime import timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from dateutil.relativedelta import relativedelta
+
+revision: str = "d2a9e5b37c14"
+down_revision: Union[str, None] = "b4e1c07d2f93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Steps of the patterns that existed before RRULE support
+_STEPS = {"daily": "days", "weekly": "weeks", "monthly": "months"}
+
+tasks = sa.table(
+    "tasks",
+    sa.column("id", sa.Integer),
+    sa.column("is_recurring", sa.Boolean),
+    sa.column("recurrence_pattern", sa.String),
+    sa.column("recurrence_frequency", sa.Integer),
+    sa.column("last_recurrence_date", sa.DateTime(timezone=True)),
+    sa.column("next_occurrence_at", sa.DateTime(timezone=True)),
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column("next_occurrence_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_tasks_next_occurrence_at",
+        "tasks",
+        ["next_occurrence_at"],
+        postgresql_where=sa.text("next_occurrence_at IS NOT NULL"),
+        sqlite_where=sa.text("next_occurrence_at IS NOT NULL"),
+    )
+    if op.get_bind().dialect.name != "sqlite":
+        # Room for RRULE patterns; SQLite does not enforce string lengths
+        op.alter_column(
+            "tasks",
+            "recurrence_pattern",
+            type_=sa.String(255),
+            existing_type=sa.String(50),
+        )
+
+    # Existing templates recur one step after their last instance, as the
+    # job used to compute on every run
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(
+            tasks.c.id,
+            tasks.c.recurrence_pattern,
+            tasks.c.recurrence_frequency,
+            tasks.c.last_recurrence_date,
+        ).where(
+            tasks.c.is_recurring.is_(True),
+            tasks.c.last_recurrence_date.is_not(None),
+        )
+    )
+    for task_id, pattern, frequency, last_recurrence_date in rows.all():
+        step = _STEPS.get(pattern)
+        if step is None:
+            continue
+        if last_recurrence_date.tzinfo is None:
+            last_recurrence_date = last_recurrence_date.replace(tzinfo=timezone.utc)
+        connection.execute(
+            tasks.update()
+            .where(tasks.c.id == task_id)
+            .values(
+                next_occurrence_at=last_recurrence_date
+                + relativedelta(**{step: frequency or 1})
+            )
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        op.alter_column(
+            "tasks",
+            "recurrence_pattern",
+            type_=sa.String(50),
+            existing_type=sa.String(255),
+        )
+    op.drop_index("ix_tasks_next_occurrence_at", table_name="tasks")
+    op.drop_column("tasks", "next_occurrence_at")
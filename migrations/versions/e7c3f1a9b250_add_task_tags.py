@@ -0,0 +1,108 @@
+"""Add a normalized task_tags table kept in sync with tasks.tags
+
+Revision ID: e7c3f1a9b250
+Revises: d2a9e5b37c14
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e7c3f1a9b250"
+down_revision: Union[str, None] = "d2a9e5b37c14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match models.tags at this revision
+POSTGRESQL_TAG = "left(ltrim(lower(trim(value)), '#'), 100)"
+SQLITE_TAG = "substr(ltrim(lower(trim(value)), '#'), 1, 100)"
+
+
+def _upgrade_postgresql() -> None:
+    op.execute(f"""CREATE FUNCTION sync_task_tags() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        DELETE FROM task_tags WHERE task_id = NEW.id;
+    END IF;
+    INSERT INTO task_tags (task_id, tag)
+    SELECT DISTINCT NEW.id, {POSTGRESQL_TAG}
+    FROM json_array_elements_text(
+        CASE WHEN json_typeof(NEW.tags) = 'array' THEN NEW.tags ELSE '[]' END
+    ) AS value
+    WHERE {POSTGRESQL_TAG} <> '';
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql""")
+    op.execute(
+        "CREATE TRIGGER tasks_sync_tags AFTER INSERT OR UPDATE OF tags ON tasks "
+        "FOR EACH ROW EXECUTE FUNCTION sync_task_tags()"
+    )
+    # Copy the tags of existing tasks
+    op.execute(
+        f"INSERT INTO task_tags (task_id, tag) "
+        f"SELECT DISTINCT tasks.id, {POSTGRESQL_TAG} FROM tasks "
+        f"CROSS JOIN LATERAL json_array_elements_text("
+        f"CASE WHEN json_typeof(tasks.tags) = 'array' THEN tasks.tags ELSE '[]' END"
+        f") AS value WHERE {POSTGRESQL_TAG} <> ''"
+    )
+
+
+def _upgrade_sqlite() -> None:
+    insert_new = (
+        f"INSERT INTO task_tags (task_id, tag) "
+        f"SELECT DISTINCT new.id, {SQLITE_TAG} FROM json_each(new.tags) "
+        f"WHERE {SQLITE_TAG} <> '';"
+    )
+    delete_old = "DELETE FROM task_tags WHERE task_id = old.id;"
+    op.execute(
+        f"CREATE TRIGGER tasks_tags_insert AFTER INSERT ON tasks BEGIN {insert_new} END"
+    )
+    op.execute(
+        f"CREATE TRIGGER tasks_tags_update AFTER UPDATE OF tags ON tasks "
+        f"BEGIN {delete_old} {insert_new} END"
+    )
+    op.execute(
+        f"CREATE TRIGGER tasks_tags_delete AFTER DELETE ON tasks BEGIN {delete_old} END"
+    )
+    # Copy the tags of existing tasks
+    op.execute(
+        f"INSERT INTO task_tags (task_id, tag) "
+        f"SELECT DISTINCT tasks.id, {SQLITE_TAG} FROM tasks, json_each("
+        f"CASE WHEN json_valid(tasks.tags) THEN tasks.tags ELSE '[]' END"
+        f") WHERE {SQLITE_TAG} <> ''"
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_tags",
+        sa.Column(
+            "task_id",
+            sa.Integer(),
+            sa.ForeignKey("tasks.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("tag", sa.String(100), primary_key=True),
+    )
+    op.create_index("ix_task_tags_tag", "task_tags", ["tag", "task_id"])
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        _upgrade_postgresql()
+    elif dialect == "sqlite":
+        _upgrade_sqlite()
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP TRIGGER tasks_sync_tags ON tasks")
+        op.execute("DROP FUNCTION sync_task_tags()")
+    elif dialect == "sqlite":
+        for trigger in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER tasks_tags_{trigger}")
+    op.drop_index("ix_task_tags_tag", table_name="task_tags")
+    op.drop_table("task_tags")
@@ -0,0 +1,126 @@
+"""Add an indexed task_field_values table kept in sync with custom_fields
+
+Revision ID: f3b8d6e1a472
+Revises: e7c3f1a9b250
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "f3b8d6e1a472"
+down_revision: Union[str, None] = "e7c3f1a9b250"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match models.field_values at this revision
+POSTGRESQL_FUNCTION = """CREATE FUNCTION sync_task_field_values() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        DELETE FROM task_field_values WHERE task_id = NEW.id;
+    END IF;
+    INSERT INTO task_field_values (task_id, field_name, value_text, value_number)
+    SELECT DISTINCT
+        NEW.id,
+        field.key,
+        CASE WHEN json_typeof(item.value) = 'string'
+            THEN item.value #>> '{}' END,
+        CASE WHEN json_typeof(item.value) = 'number'
+            THEN (item.value #>> '{}')::double precision END
+    FROM json_each(
+        CASE WHEN json_typeof(NEW.custom_fields) = 'object'
+            THEN NEW.custom_fields ELSE '{}' END
+    ) AS field
+    CROSS JOIN LATERAL json_array_elements(
+        CASE WHEN json_typeof(field.value) = 'array'
+            THEN field.value ELSE json_build_array(field.value) END
+    ) AS item
+    WHERE json_typeof(item.value) IN ('string', 'number')
+        AND length(field.key) <= 100;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql"""
+
+SQLITE_INSERT_NEW = (
+    "INSERT INTO task_field_values "
+    "(task_id, field_name, value_text, value_number) "
+    "SELECT DISTINCT new.id, field.key, "
+    "CASE WHEN item.type = 'text' THEN item.value END, "
+    "CASE WHEN item.type IN ('integer', 'real') THEN item.value END "
+    "FROM json_each(new.custom_fields) AS field, json_each("
+    "CASE WHEN field.type = 'array' THEN field.value "
+    "ELSE json_array(field.value) END) AS item "
+    "WHERE item.type IN ('text', 'integer', 'real') "
+    "AND field.type NOT IN ('true', 'false') "
+    "AND length(field.key) <= 100;"
+)
+SQLITE_DELETE_OLD = "DELETE FROM task_field_values WHERE task_id = old.id;"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_field_values",
+        sa.Column(
+            "task_id",
+            sa.Integer(),
+            sa.ForeignKey("tasks.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("field_name", sa.String(100), nullable=False),
+        sa.Column("value_text", sa.Text(), nullable=True),
+        sa.Column("value_number", sa.Float(), nullable=True),
+    )
+    op.create_index("ix_task_field_values_task_id", "task_field_values", ["task_id"])
+    op.create_index(
+        "ix_task_field_values_text",
+        "task_field_values",
+        ["field_name", "value_text", "task_id"],
+    )
+    op.create_index(
+        "ix_task_field_values_number",
+        "task_field_values",
+        ["field_name", "value_number", "task_id"],
+    )
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(POSTGRESQL_FUNCTION)
+        op.execute(
+            "CREATE TRIGGER tasks_sync_field_values "
+            "AFTER INSERT OR UPDATE OF custom_fields ON tasks "
+            "FOR EACH ROW EXECUTE FUNCTION sync_task_field_values()"
+        )
+    elif dialect == "sqlite":
+        op.execute(
+            f"CREATE TRIGGER tasks_field_values_insert AFTER INSERT ON tasks "
+            f"BEGIN {SQLITE_INSERT_NEW} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER tasks_field_values_update "
+            f"AFTER UPDATE OF custom_fields ON tasks "
+            f"BEGIN {SQLITE_DELETE_OLD} {SQLITE_INSERT_NEW} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER tasks_field_values_delete AFTER DELETE ON tasks "
+            f"BEGIN {SQLITE_DELETE_OLD} END"
+        )
+
+    # Index existing tasks by letting the update trigger run once per row
+    op.execute("UPDATE tasks SET custom_fields = custom_fields")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP TRIGGER tasks_sync_field_values ON tasks")
+        op.execute("DROP FUNCTION sync_task_field_values()")
+    elif dialect == "sqlite":
+        for trigger in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER tasks_field_values_{trigger}")
+    op.drop_index("ix_task_field_values_number", table_name="task_field_values")
+    op.drop_index("ix_task_field_values_text", table_name="task_field_values")
+    op.drop_index("ix_task_field_values_task_id", table_name="task_field_values")
+    op.drop_table("task_field_values")
@@ -12,13 +12,14 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
     Text,
 )
 from sqlalchemy.orm import declarative_base, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 Base = declarative_base()
 
@@ -48,6 +49,43 @@ task_assignees = Table(
     Base.metadata,
     Column("task_id", Integer, ForeignKey("tasks.id"), primary_key=True),
     Column("user_id", Integer, ForeignKey("users.id"), primary_key=True),
+    # The primary key covers lookups by task; this one covers lookups by user
+    Index("ix_task_assignees_user_id", "user_id", "task_id"),
+)
+
+# Normalized, indexed copy of Task.tags, kept in sync by database triggers
+# (see models.tags); write Task.tags, never this table
+task_tags = Table(
+    "task_tags",
+    Base.metadata,
+    Column(
+        "task_id",
+        Integer,
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("tag", String(100), primary_key=True),
+    # The primary key covers tags by task; this one covers tasks by tag
+    Index("ix_task_tags_tag", "tag", "task_id"),
+)
+
+# Indexed copy of Task.custom_fields, one row per task, field and value, kept
+# in sync by database triggers (see models.field_values)
+task_field_values = Table(
+    "task_field_values",
+    Base.metadata,
+    Column(
+        "task_id",
+        Integer,
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("field_name", String(100), nullable=False),
+    Column("value_text", Text),
+    Column("value_number", Float),
+    Index("ix_task_field_values_task_id", "task_id"),
+    Index("ix_task_field_values_text", "field_name", "value_text", "task_id"),
+    Index("ix_task_field_values_number", "field_name", "value_number", "task_id"),
 )
 
 # Association table for project members (many-to-many)
@@ -56,8 +94,16 @@ project_members = Table(
     Base.metadata,
     Column("project_id", Integer, ForeignKey("projects.id"), primary_key=True),
     Column("user_id", Integer, ForeignKey("users.id"), primary_key=True),
+    Index("ix_project_members_user_id", "user_id", "project_id"),
 )
 
+# Predicate of partial indexes that only cover open (not done/cancelled) tasks.
+# Queries must spell the status filter the same way for the index to be used.
+OPEN_TASK_PREDICATE = text("status != 'done' AND status != 'cancelled'")
+
+# Only recurring templates have a next occurrence
+NEXT_OCCURRENCE_PREDICATE = text("next_occurrence_at IS NOT NULL")
+
 
 class User(Base):
     """User model for Discord users."""
@@ -94,6 +140,7 @@ class Project(Base):
     """Project model for organizing tasks."""
 
     __tablename__ = "projects"
+    __table_args__ = (Index("ix_projects_discord_channel_id", "discord_channel_id"),)
 
     id = Column(Integer, primary_key=True)
     name = Column(String(200), nullable=False)
@@ -116,6 +163,25 @@ class Task(Base):
     """Task model for individual tasks."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Overdue and date-range queries only ever look at open tasks
+        Index(
+            "ix_tasks_open_due_date",
+            "due_date",
+            postgresql_where=OPEN_TASK_PREDICATE,
+            sqlite_where=OPEN_TASK_PREDICATE,
+        ),
+        Index("ix_tasks_project_id_created_at", "project_id", "created_at"),
+        Index("ix_tasks_discord_message_id", "discord_message_id"),
+        Index("ix_tasks_discord_channel_id", "discord_channel_id"),
+        # The recurrence job only looks at templates with an occurrence due
+        Index(
+            "ix_tasks_next_occurrence_at",
+            "next_occurrence_at",
+            postgresql_where=NEXT_OCCURRENCE_PREDICATE,
+            sqlite_where=NEXT_OCCURRENCE_PREDICATE,
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     title = Column(String(300), nullable=False)
@@ -158,16 +224,25 @@ class Task(Base):
 
     # Recurring task fields
     is_recurring = Column(Boolean, default=False)
-    recurrence_pattern = Column(String(50))  # daily, weekly, monthly, etc.
+    # daily, weekly, monthly, yearly or an RRULE (see services.recurrence)
+    recurrence_pattern = Column(String(255))
     recurrence_frequency = Column(
         Integer, default=1
     )  # every 1, 2, 3, etc. days/weeks/months
     recurrence_end_date = Column(DateTime(timezone=True))
     last_recurrence_date = Column(DateTime(timezone=True))
+    # When the next instance is due to be created; None once the rule ends
+    next_occurrence_at = Column(DateTime(timezone=True))
+
+    # Optimistic locking: bumped by every update, checked by ORM flushes and
+    # by TaskService.update_task when the caller passes the version it saw
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
 
     # Relationships
     time_entries = relationship("TimeEntry", back_populates="task")
 
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self):
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status}')>"
 
@@ -181,6 +256,10 @@ class TimeEntry(Base):
     """Time tracking entries for tasks."""
 
     __tablename__ = "time_entries"
+    __table_args__ = (
+        Index("ix_time_entries_task_id_created_at", "task_id", "created_at", "id"),
+        Index("ix_time_entries_user_id_created_at", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True)
     description = Column(String(500))
@@ -249,3 +328,33 @@ class TaskTemplate(Base):
 
     def __repr__(self):
         return f"<TaskTemplate(id={self.id}, name='{self.name}')>"
+
+
+class SavedView(Base):
+    """Named task filter and sort shared by the team (see /view)."""
+
+    __tablename__ = "saved_views"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False, unique=True)
+    spec = Column(JSON, nullable=False)  # services.saved_view_service.ViewSpec
+
+    creator_id = Column(Integer, ForeignKey("users.id"))
+    creator = relationship("User")
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<SavedView(id={self.id}, name='{self.name}')>"
+
+
+# Full-text search indexes are created alongside their tables
+from models.search import install_search_ddl  # noqa: E402
+from models.field_values import install_field_values_ddl  # noqa: E402
+from models.tags import install_tag_sync_ddl  # noqa: E402
+
+install_search_ddl(Task.__table__)
+install_search_ddl(Project.__table__)
+install_tag_sync_ddl(task_tags)
+install_field_values_ddl(task_field_values)
@@ -0,0 +1,106 @@
+"""Indexed custom field values of tasks.
+
+``Task.custom_fields`` stays the JSON object keyed by field name; the
+``task_field_values`` table holds one row per task, field and value
+(one per option of a multi-select) with strings in ``value_text`` and
+numbers in ``value_number``, so custom field filters can use indexes.
+Database triggers keep it in sync on every insert and update of
+``tasks``, like ``task_tags``. The DDL runs on ``create_all`` and is
+mirrored by the ``add_task_field_values`` migration.
+"""
+
+from typing import List
+
+from sqlalchemy import DDL, Table, event
+
+# Longest field name indexed; matches CustomField.name
+MAX_FIELD_NAME_LENGTH = 100
+
+
+def postgresql_field_values_ddl() -> List[str]:
+    """Trigger function and trigger copying custom fields into the table."""
+    return [
+        f"""CREATE FUNCTION sync_task_field_values() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        DELETE FROM task_field_values WHERE task_id = NEW.id;
+    END IF;
+    INSERT INTO task_field_values (task_id, field_name, value_text, value_number)
+    SELECT DISTINCT
+        NEW.id,
+        field.key,
+        CASE WHEN json_typeof(item.value) = 'string'
+            THEN item.value #>> '{{}}' END,
+        CASE WHEN json_typeof(item.value) = 'number'
+            THEN (item.value #>> '{{}}')::double precision END
+    FROM json_each(
+        CASE WHEN json_typeof(NEW.custom_fields) = 'object'
+            THEN NEW.custom_fields ELSE '{{}}' END
+    ) AS field
+    CROSS JOIN LATERAL json_array_elements(
+        CASE WHEN json_typeof(field.value) = 'array'
+            THEN field.value ELSE json_build_array(field.value) END
+    ) AS item
+    WHERE json_typeof(item.value) IN ('string', 'number')
+        AND length(field.key) <= {MAX_FIELD_NAME_LENGTH};
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql""",
+        "CREATE TRIGGER tasks_sync_field_values "
+        "AFTER INSERT OR UPDATE OF custom_fields ON tasks "
+        "FOR EACH ROW EXECUTE FUNCTION sync_task_field_values()",
+    ]
+
+
+def sqlite_field_values_ddl() -> List[str]:
+    """Triggers copying custom fields into the table (and deleting them)."""
+    insert_new = (
+        "INSERT INTO task_field_values "
+        "(task_id, field_name, value_text, value_number) "
+        "SELECT DISTINCT new.id, field.key, "
+        "CASE WHEN item.type = 'text' THEN item.value END, "
+        "CASE WHEN item.type IN ('integer', 'real') THEN item.value END "
+        "FROM json_each(new.custom_fields) AS field, json_each("
+        "CASE WHEN field.type = 'array' THEN field.value "
+        "ELSE json_array(field.value) END) AS item "
+        "WHERE item.type IN ('text', 'integer', 'real') "
+        # json_array() turns booleans into integers; PostgreSQL skips them
+        "AND field.type NOT IN ('true', 'false') "
+        f"AND length(field.key) <= {MAX_FIELD_NAME_LENGTH};"
+    )
+    delete_old = "DELETE FROM task_field_values WHERE task_id = old.id;"
+    return [
+        f"CREATE TRIGGER tasks_field_values_insert AFTER INSERT ON tasks "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER tasks_field_values_update "
+        f"AFTER UPDATE OF custom_fields ON tasks "
+        f"BEGIN {delete_old} {insert_new} END",
+        f"CREATE TRIGGER tasks_field_values_delete AFTER DELETE ON tasks "
+        f"BEGIN {delete_old} END",
+    ]
+
+
+def install_field_values_ddl(table: Table) -> None:
+    """Create the sync triggers whenever ``create_all`` creates ``table``."""
+    for statement in postgresql_field_values_ddl():
+        event.listen(
+            table, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
+    for statement in sqlite_field_values_ddl():
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+    for statement in (
+        "DROP TRIGGER IF EXISTS tasks_sync_field_values ON tasks",
+        "DROP FUNCTION IF EXISTS sync_task_field_values()",
+    ):
+        event.listen(
+            table, "after_drop", DDL(statement).execute_if(dialect="postgresql")
+        )
+    for trigger in ("insert", "update", "delete"):
+        event.listen(
+            table,
+            "after_drop",
+            DDL(f"DROP TRIGGER IF EXISTS tasks_field_values_{trigger}").execute_if(
+                dialect="sqlite"
+            ),
+        )
@@ -0,0 +1,94 @@
+"""Full-text search indexes for tasks and projects.
+
+PostgreSQL gets a generated ``search_vector`` tsvector column with a GIN
+index; SQLite gets an external-content FTS5 table kept in sync by
+triggers. Both are maintained by the database on insert/update/delete.
+The DDL runs on ``create_all`` and is mirrored by the
+``add_full_text_search`` migration.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import DDL, Table, event
+
+# Text search configuration for PostgreSQL, which stems query and document
+# alike. SQLite FTS5 does not stem: its porter tokenizer breaks prefix
+# queries ("securi*" would miss "security"), so matching relies on prefixes.
+SEARCH_CONFIG = "english"
+FTS5_TOKENIZER = "unicode61"
+
+# Searchable columns per table, most important first. The first column
+# weighs more when ranking.
+SEARCH_COLUMNS: Dict[str, Tuple[str, str]] = {
+    "tasks": ("title", "description"),
+    "projects": ("name", "description"),
+}
+
+
+def postgresql_search_ddl(table: str) -> List[str]:
+    """Generated tsvector column and GIN index for ``table``."""
+    primary, secondary = SEARCH_COLUMNS[table]
+    return [
+        f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ("
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({primary}, '')), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({secondary}, '')), 'B')"
+        f") STORED",
+        f"CREATE INDEX ix_{table}_search_vector ON {table} USING gin (search_vector)",
+    ]
+
+
+def sqlite_search_ddl(table: str) -> List[str]:
+    """FTS5 table mirroring ``table`` plus the triggers keeping it in sync."""
+    columns = SEARCH_COLUMNS[table]
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    fts = f"{table}_fts"
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    insert_new = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{table}', "
+        f"content_rowid='id', tokenize='{FTS5_TOKENIZER}')",
+        f"CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} BEGIN {delete_old} END",
+        f"CREATE TRIGGER {fts}_update AFTER UPDATE OF {names} ON {table} "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def install_search_ddl(table: Table) -> None:
+    """Create the search index of ``table`` whenever ``create_all`` creates it."""
+    for statement in postgresql_search_ddl(table.name):
+        event.listen(
+            table, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
+    for statement in sqlite_search_ddl(table.name):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(
+        table,
+        "after_drop",
+        DDL(f"DROP TABLE IF EXISTS {table.name}_fts").execute_if(dialect="sqlite"),
+    )
+
+
+def include_in_autogenerate(name: str, type_: str, parent_names: Any) -> bool:
+    """Alembic ``include_name`` hook that hides the search index objects.
+
+    They are created by raw DDL rather than the model metadata, so
+    autogenerate would otherwise propose dropping the FTS5 tables (and
+    their shadow tables), the ``search_vector`` columns and their indexes.
+    """
+    if type_ == "table":
+        return not any(
+            name == f"{table}_fts" or name.startswith(f"{table}_fts_")
+            for table in SEARCH_COLUMNS
+        )
+    if type_ == "column":
+        return name != "search_vector"
+    if type_ == "index":
+        return name not in {f"ix_{table}_search_vector" for table in SEARCH_COLUMNS}
+    return True
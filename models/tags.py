@@ -0,0 +1,102 @@
+"""Normalized task tags.
+
+``Task.tags`` stays the JSON list shown to users; the ``task_tags`` table
+holds one indexed row per task and normalized tag so tag filters and
+facet counts run in SQL. Database triggers keep the two in sync on every
+insert and update of ``tasks``, whichever code path writes them. The DDL
+runs on ``create_all`` and is mirrored by the ``add_task_tags`` migration.
+"""
+
+from typing import List
+
+from sqlalchemy import DDL, Table, event
+
+# Longest tag kept in task_tags; longer tags are truncated
+MAX_TAG_LENGTH = 100
+
+
+def normalize_tag(tag: str) -> str:
+    """Tag as stored in ``task_tags``: trimmed, lowercase, without ``#``.
+
+    Mirrors the SQL of the sync triggers. SQLite's lower() only folds
+    ASCII letters, so non-ASCII tags are matched case-sensitively there.
+    """
+    return tag.strip().lower().lstrip("#")[:MAX_TAG_LENGTH]
+
+
+def _normalized_sql(value: str, dialect: str) -> str:
+    substring = "left({}, {})" if dialect == "postgresql" else "substr({}, 1, {})"
+    return substring.format(f"ltrim(lower(trim({value})), '#')", MAX_TAG_LENGTH)
+
+
+def postgresql_tag_sync_ddl() -> List[str]:
+    """Trigger function and trigger copying ``tasks.tags`` into task_tags."""
+    tag = _normalized_sql("value", "postgresql")
+    return [
+        f"""CREATE FUNCTION sync_task_tags() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        DELETE FROM task_tags WHERE task_id = NEW.id;
+    END IF;
+    INSERT INTO task_tags (task_id, tag)
+    SELECT DISTINCT NEW.id, {tag}
+    FROM json_array_elements_text(
+        CASE WHEN json_typeof(NEW.tags) = 'array' THEN NEW.tags ELSE '[]' END
+    ) AS value
+    WHERE {tag} <> '';
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql""",
+        "CREATE TRIGGER tasks_sync_tags AFTER INSERT OR UPDATE OF tags ON tasks "
+        "FOR EACH ROW EXECUTE FUNCTION sync_task_tags()",
+    ]
+
+
+def sqlite_tag_sync_ddl() -> List[str]:
+    """Triggers copying ``tasks.tags`` into task_tags (and deleting them)."""
+    tag = _normalized_sql("value", "sqlite")
+    insert_new = (
+        f"INSERT INTO task_tags (task_id, tag) "
+        f"SELECT DISTINCT new.id, {tag} FROM json_each(new.tags) "
+        f"WHERE {tag} <> '';"
+    )
+    delete_old = "DELETE FROM task_tags WHERE task_id = old.id;"
+    return [
+        f"CREATE TRIGGER tasks_tags_insert AFTER INSERT ON tasks "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER tasks_tags_update AFTER UPDATE OF tags ON tasks "
+        f"BEGIN {delete_old} {insert_new} END",
+        # Foreign keys (and so ON DELETE CASCADE) are off by default in SQLite
+        f"CREATE TRIGGER tasks_tags_delete AFTER DELETE ON tasks "
+        f"BEGIN {delete_old} END",
+    ]
+
+
+def install_tag_sync_ddl(table: Table) -> None:
+    """Create the sync triggers whenever ``create_all`` creates ``table``.
+
+    ``table`` is task_tags, which is created after (and dropped before)
+    tasks, so the triggers only ever see both tables.
+    """
+    for statement in postgresql_tag_sync_ddl():
+        event.listen(
+            table, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
+    for statement in sqlite_tag_sync_ddl():
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+    for statement in (
+        "DROP TRIGGER IF EXISTS tasks_sync_tags ON tasks",
+        "DROP FUNCTION IF EXISTS sync_task_tags()",
+    ):
+        event.listen(
+            table, "after_drop", DDL(statement).execute_if(dialect="postgresql")
+        )
+    for trigger in ("insert", "update", "delete"):
+        event.listen(
+            table,
+            "after_drop",
+            DDL(f"DROP TRIGGER IF EXISTS tasks_tags_{trigger}").execute_if(
+                dialect="sqlite"
+            ),
+        )
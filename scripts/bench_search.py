@@ -0,0 +1,117 @@
+"""Compare ILIKE substring search with the full-text index at 100k tasks.
+
+Seeds a temporary SQLite database (FTS5 backend) and times the old
+``ilike('%q%')`` query against the ranked full-text query for a few
+search terms.
+
+Usage: python scripts/bench_search.py [--tasks 100000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+from sqlalchemy import desc, or_, select
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_tmp = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'bench.db')}"
+os.environ.setdefault("DISCORD_BOT_TOKEN", "benchmark")
+
+from models import Task  # noqa: E402
+from services.search import search_matches, search_terms  # noqa: E402
+from utils.database import async_engine, close_database, init_database  # noqa: E402
+
+KEYWORDS = (
+    "deploy release review invoice sprint design backend frontend database "
+    "migration customer support bug feature docs meeting planning budget "
+    "report marketing onboarding security audit refactor cache search"
+).split()
+# Filler vocabulary so each keyword appears in a realistic share of tasks
+WORDS = KEYWORDS + [
+    f"{a}{b}{c}"
+    for a in "bdfgklmnprst"
+    for b in ("a", "e", "i", "o", "u")
+    for c in ("lo", "ra", "ven", "tor", "mix", "dal", "pen", "sun")
+]
+QUERIES = ["invoice", "deploy review", "securi", "nonexistent"]
+
+
+async def seed(count):
+    """Insert ``count`` tasks with random titles and descriptions."""
+    rng = random.Random(42)
+    batch = 5_000
+    async with async_engine.begin() as conn:
+        for start in range(0, count, batch):
+            await conn.execute(
+                Task.__table__.insert(),
+                [
+                    {
+                        "title": " ".join(rng.choices(WORDS, k=4)),
+                        "description": " ".join(rng.choices(WORDS, k=20)),
+                        "status": "todo",
+                        "priority": "medium",
+                    }
+                    for _ in range(start, min(start + batch, count))
+                ],
+            )
+
+
+def ilike_query(query):
+    return (
+        select(Task.id)
+        .where(
+            or_(
+                Task.title.ilike(f"%{query}%"),
+                Task.description.ilike(f"%{query}%"),
+            )
+        )
+        .order_by(desc(Task.created_at))
+        .limit(50)
+    )
+
+
+def full_text_query(query):
+    matches = search_matches("tasks", search_terms(query), "sqlite")
+    return select(matches.c.id).order_by(desc(matches.c.score)).limit(50)
+
+
+async def best_ms(statement, repeat):
+    timings = []
+    async with async_engine.connect() as conn:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await conn.execute(statement)
+            timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+async def main():
+    logging.disable(logging.WARNING)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    await init_database()
+    await seed(args.tasks)
+
+    for query in QUERIES:
+        before = await best_ms(ilike_query(query), args.repeat)
+        after = await best_ms(full_text_query(query), args.repeat)
+        print(
+            f"{query!r:>16}: ilike {before:8.2f} ms, "
+            f"full-text {after:8.2f} ms ({before / after:.0f}x)"
+        )
+
+    await close_database()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+    _tmp.cleanup()
@@ -0,0 +1,87 @@
+"""Benchmark concurrent SQLite access with and without the production profile.
+
+Usage: python scripts/bench_sqlite_profile.py [--seconds 5] [--readers 8]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DISCORD_BOT_TOKEN", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from utils.sqlite_profile import SQLITE_PROFILES, install_sqlite_pragmas  # noqa: E402
+
+
+async def run_profile(profile, path, seconds, readers):
+    """Run one writer and ``readers`` readers against a fresh database."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=readers + 1,
+        connect_args={"check_same_thread": False, "timeout": 0},
+    )
+    install_sqlite_pragmas(engine.sync_engine, SQLITE_PROFILES[profile])
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("CREATE TABLE tasks (id INTEGER PRIMARY KEY, title TEXT)")
+        )
+
+    counts = {"writes": 0, "reads": 0, "locked": 0}
+    deadline = time.perf_counter() + seconds
+
+    async def writer():
+        while time.perf_counter() < deadline:
+            try:
+                async with engine.begin() as conn:
+                    await conn.execute(
+                        text("INSERT INTO tasks (title) VALUES ('benchmark')")
+                    )
+                counts["writes"] += 1
+            except OperationalError:
+                counts["locked"] += 1
+
+    async def reader():
+        while time.perf_counter() < deadline:
+            try:
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT count(*) FROM tasks"))
+                counts["reads"] += 1
+            except OperationalError:
+                counts["locked"] += 1
+
+    await asyncio.gather(writer(), *(reader() for _ in range(readers)))
+    await engine.dispose()
+    return counts
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in ("default", "production"):
+            path = os.path.join(tmp, f"{profile}.db")
+            counts = await run_profile(profile, path, args.seconds, args.readers)
+            print(
+                f"{profile:>10}: "
+                f"{counts['writes'] / args.seconds:8.0f} writes/s "
+                f"{counts['reads'] / args.seconds:8.0f} reads/s "
+                f"{counts['locked']:6d} lock errors"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
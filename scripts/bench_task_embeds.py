@@ -0,0 +1,78 @@
+"""Compare rendering task embeds from scratch with the embed payload cache.
+
+Builds 500 tasks in memory (two assignees and a project each) and
+renders all of them, as a full pass through a task list does, once with
+an empty cache every time and once with the cache warm, reporting the
+latency of a pass.
+
+Usage: python scripts/bench_task_embeds.py [--tasks 500] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("DISCORD_BOT_TOKEN", "benchmark")
+
+from bot.cogs.tasks import create_task_embed  # noqa: E402
+from models import Project, Task, User  # noqa: E402
+from utils.embed_cache import task_embed_cache  # noqa: E402
+
+NOW = datetime.now(timezone.utc)
+
+
+def make_tasks(count):
+    """``count`` detached tasks shaped like the ones the bot lists."""
+    creator = User(discord_id=1001, username="u1")
+    assignees = [creator, User(discord_id=1002, username="u2")]
+    project = Project(name="Launch")
+    return [
+        Task(
+            id=i,
+            title=f"Task {i}",
+            description=f"Details of task {i}",
+            status="todo",
+            priority="medium",
+            version=1,
+            created_at=NOW - timedelta(days=1),
+            due_date=NOW + timedelta(hours=i),
+            creator=creator,
+            assignees=assignees,
+            project=project,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def measure(tasks, repeat, cold):
+    """Best-of-``repeat`` milliseconds to render every task once."""
+    timings = []
+    for _ in range(repeat):
+        if cold:
+            task_embed_cache.clear()
+        started = time.perf_counter()
+        for task in tasks:
+            create_task_embed(task)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.tasks)
+    for name, cold in (("Uncached", True), ("Cached", False)):
+        latency = measure(tasks, args.repeat, cold)
+        print(f"{name:>8}: {len(tasks)} embeds in {latency:7.2f} ms")
+    print(f"   Cache: {task_embed_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Measure the Python-side overhead of the hot TaskService queries.
+
+The database round trip is mocked out: the session only compiles each
+statement through SQLAlchemy's compiled cache, the same way a real
+execution would, and returns no rows. The "rebuilt" rows rebuild the
+statement from scratch on every call, as the service used to do.
+
+Usage: python scripts/bench_task_queries.py [--calls 5000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy import and_, asc, desc, select
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.orm import selectinload
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DISCORD_BOT_TOKEN", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+import services.task_service as task_service  # noqa: E402
+from models import Task, User  # noqa: E402
+from services.task_service import OPEN_TASK_FILTER, TaskService  # noqa: E402
+from services.task_service import task_cache  # noqa: E402
+
+
+class _EmptyResult:
+    def scalar_one_or_none(self):
+        return None
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+
+class _CompileOnlySession:
+    """Session stand-in that compiles statements but never hits a database."""
+
+    dialect = PGDialect_asyncpg()
+    compiled_cache = {}
+
+    async def execute(self, statement):
+        statement._compile_w_cache(
+            self.dialect, compiled_cache=self.compiled_cache, column_keys=[]
+        )
+        return _EmptyResult()
+
+
+@asynccontextmanager
+async def _mock_session(read_only=False):
+    yield _CompileOnlySession()
+
+
+async def _mock_user(discord_id):
+    return SimpleNamespace(id=discord_id)
+
+
+async def _rebuilt_task_by_id(task_id):
+    return await _CompileOnlySession().execute(
+        select(Task)
+        .options(
+            selectinload(Task.creator),
+            selectinload(Task.assignees),
+            selectinload(Task.project),
+            selectinload(Task.time_entries),
+        )
+        .where(Task.id == task_id)
+    )
+
+
+async def _rebuilt_tasks_for_user(user_id):
+    return await _CompileOnlySession().execute(
+        select(Task)
+        .options(
+            selectinload(Task.creator),
+            selectinload(Task.assignees),
+            selectinload(Task.project),
+        )
+        .join(Task.assignees)
+        .where(User.id == user_id)
+        .where(Task.status == "todo")
+        .order_by(desc(Task.created_at))
+        .limit(50)
+    )
+
+
+async def _rebuilt_overdue_tasks(_):
+    now = datetime.now(timezone.utc)
+    return await _CompileOnlySession().execute(
+        select(Task)
+        .options(
+            selectinload(Task.creator),
+            selectinload(Task.assignees),
+            selectinload(Task.project),
+        )
+        .where(and_(Task.due_date < now, OPEN_TASK_FILTER))
+        .order_by(asc(Task.due_date))
+    )
+
+
+CASES = [
+    ("get_task_by_id", _rebuilt_task_by_id, TaskService.get_task_by_id),
+    (
+        "get_tasks_for_user",
+        _rebuilt_tasks_for_user,
+        lambda i: TaskService.get_tasks_for_user(i, status="todo"),
+    ),
+    (
+        "get_overdue_tasks",
+        _rebuilt_overdue_tasks,
+        lambda _: TaskService.get_overdue_tasks(),
+    ),
+]
+
+
+async def per_call_us(call, calls):
+    """Average microseconds per call, after one warm-up call."""
+    await call(0)
+    started = time.perf_counter()
+    for i in range(calls):
+        await call(i)
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    task_service.get_async_session = _mock_session
+    task_service.UserService.resolve_user = _mock_user
+    # The mocked session returns no rows, so nothing gets cached and every
+    # get_task_by_id call reaches the statement; start from an empty cache
+    task_cache.clear()
+
+    for name, rebuilt, cached in CASES:
+        before = await per_call_us(rebuilt, args.calls)
+        after = await per_call_us(cached, args.calls)
+        print(
+            f"{name:>20}: rebuilt {before:7.1f} us/call, "
+            f"cached {after:7.1f} us/call ({before / after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
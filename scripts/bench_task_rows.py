@@ -0,0 +1,102 @@
+"""Compare ORM task hydration with TaskRow projections for list views.
+
+Seeds a temporary SQLite database with 10k open tasks (two assignees
+each) and loads them all through both paths, reporting latency and peak
+Python memory.
+
+Usage: python scripts/bench_task_rows.py [--tasks 10000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_tmp = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'bench.db')}"
+os.environ.setdefault("DISCORD_BOT_TOKEN", "benchmark")
+
+from models import Task, User, task_assignees  # noqa: E402
+from services.task_service import TaskService  # noqa: E402
+from utils.database import async_engine, close_database, init_database  # noqa: E402
+
+NOW = datetime.now(timezone.utc)
+START = NOW - timedelta(days=1)
+END = NOW + timedelta(days=30)
+
+
+async def seed(count):
+    """Insert ``count`` tasks due within the next month, two assignees each."""
+    async with async_engine.begin() as conn:
+        await conn.execute(
+            User.__table__.insert(),
+            [{"id": i, "discord_id": 1000 + i, "username": f"u{i}"} for i in (1, 2)],
+        )
+        await conn.execute(
+            Task.__table__.insert(),
+            [
+                {
+                    "id": i,
+                    "title": f"Task {i}",
+                    "status": "todo",
+                    "priority": "medium",
+                    "creator_id": 1,
+                    "due_date": NOW + timedelta(minutes=i),
+                    "discord_channel_id": 42,
+                }
+                for i in range(1, count + 1)
+            ],
+        )
+        await conn.execute(
+            task_assignees.insert(),
+            [
+                {"task_id": i, "user_id": user_id}
+                for i in range(1, count + 1)
+                for user_id in (1, 2)
+            ],
+        )
+
+
+async def measure(load, repeat):
+    """Best-of-``repeat`` latency in ms and peak traced memory in MiB."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = await load()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    rows = await load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(rows), min(timings), peak / (1024 * 1024)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    await init_database()
+    await seed(args.tasks)
+
+    cases = [
+        ("ORM Task", lambda: TaskService.get_tasks_by_date_range(START, END)),
+        ("TaskRow", lambda: TaskService.get_task_rows_by_date_range(START, END)),
+    ]
+    for name, load in cases:
+        count, latency, peak = await measure(load, args.repeat)
+        print(f"{name:>8}: {count} tasks in {latency:7.1f} ms, peak {peak:6.1f} MiB")
+
+    await close_database()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+    _tmp.cleanup()
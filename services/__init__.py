@@ -4,10 +4,14 @@ from .user_service import UserService
 from .task_service import TaskService
 from .project_service import ProjectService
 from .time_entry_service import TimeEntryService
+from .custom_field_service import CustomFieldService
+from .saved_view_service import SavedViewService
 
 __all__ = [
     "UserService",
     "TaskService",
     "ProjectService",
     "TimeEntryService",
+    "CustomFieldService",
+    "SavedViewService",
 ]
\ No newline at end of file
@@ -0,0 +1,268 @@
+"""Custom field definitions and typed filters over task custom fields.
+
+Each project defines its fields with :class:`CustomField`; values live in
+``Task.custom_fields`` and are mirrored row by row into the indexed
+``task_field_values`` table (see ``models.field_values``). Filters are
+validated against the project's schema and compiled to subqueries over
+that table, so they can be combined with any other task query.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import ColumnElement, delete, func, select
+
+from config.settings import settings
+from models import CustomField, Task, task_field_values
+from models.field_values import MAX_FIELD_NAME_LENGTH
+from utils import get_async_session
+from utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Operators each field type supports
+FIELD_OPERATORS: Dict[str, Tuple[str, ...]] = {
+    "text": ("equals", "contains"),
+    "number": ("equals", "range"),
+    "date": ("equals", "range"),
+    "select": ("equals",),
+    "multi_select": ("contains",),
+}
+
+# How long a project's schema is reused before it is read again. Changes
+# made through CustomFieldService invalidate it immediately.
+SCHEMA_TTL_SECONDS = 300.0
+
+
+class CustomFieldError(ValueError):
+    """Raised for invalid custom field definitions or filters."""
+
+
+@dataclass(frozen=True)
+class FieldDefinition:
+    """A custom field of a project as cached in its schema."""
+
+    name: str
+    field_type: str
+    options: Tuple[str, ...] = ()
+    is_required: bool = False
+
+
+@dataclass(frozen=True)
+class FieldFilter:
+    """One condition on a custom field.
+
+    ``value`` is a single value for ``equals``, a substring for text
+    ``contains``, a list of options that must all be set for multi-select
+    ``contains`` and a ``(low, high)`` pair for ``range``, where either
+    bound may be None. Date bounds are inclusive whole days.
+    """
+
+    field: str
+    op: str
+    value: Any
+
+
+# project_id -> fields by name
+schema_cache: LRUCache[int, Dict[str, FieldDefinition]] = LRUCache(
+    settings.schema_cache_size, SCHEMA_TTL_SECONDS
+)
+
+
+class CustomFieldService:
+    """Service for custom field definitions and filters."""
+
+    @staticmethod
+    async def create_field(
+        project_id: int,
+        name: str,
+        field_type: str,
+        options: Optional[Sequence[str]] = None,
+        is_required: bool = False,
+    ) -> CustomField:
+        """Define a new custom field for a project."""
+        name = name.strip()
+        if not name or len(name) > MAX_FIELD_NAME_LENGTH:
+            raise CustomFieldError(
+                f"Field names must be 1 to {MAX_FIELD_NAME_LENGTH} characters"
+            )
+        if field_type not in FIELD_OPERATORS:
+            raise CustomFieldError(
+                f"Unknown field type {field_type!r}; use one of "
+                f"{', '.join(FIELD_OPERATORS)}"
+            )
+        options = [str(option) for option in options or ()]
+        if field_type in ("select", "multi_select") and not options:
+            raise CustomFieldError(f"{field_type} fields need at least one option")
+
+        schema = await CustomFieldService.get_schema(project_id)
+        if name in schema:
+            raise CustomFieldError(f"Field {name!r} already exists in this project")
+
+        async with get_async_session() as session:
+            field = CustomField(
+                project_id=project_id,
+                name=name,
+                field_type=field_type,
+                options=options or None,
+                is_required=is_required,
+            )
+            session.add(field)
+            await session.commit()
+            await session.refresh(field)
+
+        CustomFieldService.invalidate_schema(project_id)
+        return field
+
+    @staticmethod
+    async def delete_field(project_id: int, name: str) -> bool:
+        """Delete a project's custom field; task values are left untouched."""
+        async with get_async_session() as session:
+            result = await session.execute(
+                delete(CustomField).where(
+                    CustomField.project_id == project_id, CustomField.name == name
+                )
+            )
+            await session.commit()
+
+        CustomFieldService.invalidate_schema(project_id)
+        return result.rowcount > 0
+
+    @staticmethod
+    async def get_schema(project_id: int) -> Dict[str, FieldDefinition]:
+        """Custom fields of a project by name, cached for a few minutes.
+
+        Schemas are read from the primary so a lagging replica never
+        caches fields that were just created or deleted.
+        """
+        schema = schema_cache.get(project_id)
+        if schema is not None:
+            return schema
+
+        generation = schema_cache.generation
+        async with get_async_session() as session:
+            result = await session.execute(
+                select(CustomField)
+                .where(CustomField.project_id == project_id)
+                .order_by(CustomField.id)
+            )
+            schema = {
+                field.name: FieldDefinition(
+                    name=field.name,
+                    field_type=field.field_type,
+                    options=tuple(field.options or ()),
+                    is_required=bool(field.is_required),
+                )
+                for field in result.scalars()
+            }
+
+        schema_cache.set(project_id, schema, generation)
+        return schema
+
+    @staticmethod
+    def invalidate_schema(project_id: Optional[int] = None) -> None:
+        """Drop the cached schema of a project, or of all projects."""
+        if project_id is None:
+            schema_cache.clear()
+        else:
+            schema_cache.pop(project_id)
+
+    @staticmethod
+    def compile_filters(
+        schema: Dict[str, FieldDefinition], filters: Sequence[FieldFilter]
+    ) -> List[ColumnElement[bool]]:
+        """WHERE clauses on ``Task`` for ``filters``, validated against ``schema``."""
+        return [_compile_filter(schema, field_filter) for field_filter in filters]
+
+
+def _compile_filter(
+    schema: Dict[str, FieldDefinition], field_filter: FieldFilter
+) -> ColumnElement[bool]:
+    definition = schema.get(field_filter.field)
+    if definition is None:
+        raise CustomFieldError(f"Unknown custom field {field_filter.field!r}")
+    if field_filter.op not in FIELD_OPERATORS.get(definition.field_type, ()):
+        raise CustomFieldError(
+            f"{definition.field_type} field {definition.name!r} does not support "
+            f"{field_filter.op!r}"
+        )
+
+    values = task_field_values.c
+    matching = select(values.task_id).where(values.field_name == definition.name)
+    field_type, op, value = definition.field_type, field_filter.op, field_filter.value
+
+    if field_type == "text" and op == "equals":
+        matching = matching.where(values.value_text == str(value))
+    elif field_type == "text":
+        pattern = str(value).lower()
+        for special in ("\\", "%", "_"):
+            pattern = pattern.replace(special, "\\" + special)
+        matching = matching.where(
+            func.lower(values.value_text).like(f"%{pattern}%", escape="\\")
+        )
+    elif field_type == "number":
+        low, high = (value, value) if op == "equals" else _bounds(value)
+        if low is not None:
+            matching = matching.where(values.value_number >= _number(low))
+        if high is not None:
+            matching = matching.where(values.value_number <= _number(high))
+    elif field_type == "date":
+        low, high = (value, value) if op == "equals" else _bounds(value)
+        # ISO dates and timestamps sort as text; the high bound covers its day
+        if low is not None:
+            matching = matching.where(values.value_text >= _day(low).isoformat())
+        if high is not None:
+            next_day = _day(high) + timedelta(days=1)
+            matching = matching.where(values.value_text < next_day.isoformat())
+    elif field_type == "select":
+        matching = matching.where(values.value_text == _option(definition, value))
+    else:
+        options = value if isinstance(value, (list, tuple, set)) else [value]
+        wanted = sorted({_option(definition, option) for option in options})
+        if not wanted:
+            raise CustomFieldError(f"Choose at least one {definition.name!r} option")
+        matching = (
+            matching.where(values.value_text.in_(wanted))
+            .group_by(values.task_id)
+            .having(func.count() == len(wanted))
+        )
+
+    return Task.id.in_(matching)
+
+
+def _bounds(value: Any) -> Tuple[Any, Any]:
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        raise CustomFieldError("Range filters take a (low, high) pair")
+    if value[0] is None and value[1] is None:
+        raise CustomFieldError("Range filters need at least one bound")
+    return value[0], value[1]
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise CustomFieldError(f"{value!r} is not a number") from None
+
+
+def _day(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.fromisoformat(str(value)).date()
+    except ValueError:
+        raise CustomFieldError(f"{value!r} is not a YYYY-MM-DD date") from None
+
+
+def _option(definition: FieldDefinition, value: Any) -> str:
+    option = str(value)
+    if definition.options and option not in definition.options:
+        raise CustomFieldError(
+            f"{option!r} is not an option of {definition.name!r}; choose from "
+            f"{', '.join(definition.options)}"
+        )
+    return option
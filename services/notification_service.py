@@ -75,7 +75,7 @@ class NotificationService:
             end_of_day = start_of_day + timedelta(days=1)
 
             # Get tasks due today
-            today_tasks = await TaskService.get_tasks_by_date_range(
+            today_tasks = await TaskService.get_task_rows_by_date_range(
                 start_date=start_of_day, end_date=end_of_day
             )
 
@@ -112,10 +112,10 @@ class NotificationService:
                     # Group tasks by assignee
                     tasks_by_assignee = {}
                     for task in tasks:
-                        for assignee in task.assignees:
-                            if assignee.discord_id not in tasks_by_assignee:
-                                tasks_by_assignee[assignee.discord_id] = []
-                            tasks_by_assignee[assignee.discord_id].append(task)
+                        for discord_id in task.assignee_discord_ids:
+                            if discord_id not in tasks_by_assignee:
+                                tasks_by_assignee[discord_id] = []
+                            tasks_by_assignee[discord_id].append(task)
 
                     # Add a field for each assignee
                     for discord_id, user_tasks in tasks_by_assignee.items():
@@ -184,7 +184,7 @@ class NotificationService:
             # We'd need to add a new method to TaskService for this
 
             # Get tasks due tomorrow
-            tomorrow_tasks = await TaskService.get_tasks_by_date_range(
+            tomorrow_tasks = await TaskService.get_task_rows_by_date_range(
                 start_date=start_of_tomorrow, end_date=end_of_tomorrow
             )
 
@@ -221,10 +221,10 @@ class NotificationService:
                     # Group tasks by assignee
                     tasks_by_assignee = {}
                     for task in tasks:
-                        for assignee in task.assignees:
-                            if assignee.discord_id not in tasks_by_assignee:
-                                tasks_by_assignee[assignee.discord_id] = []
-                            tasks_by_assignee[assignee.discord_id].append(task)
+                        for discord_id in task.assignee_discord_ids:
+                            if discord_id not in tasks_by_assignee:
+                                tasks_by_assignee[discord_id] = []
+                            tasks_by_assignee[discord_id].append(task)
 
                     # Add a field for each assignee
                     for discord_id, user_tasks in tasks_by_assignee.items():
@@ -283,7 +283,7 @@ class NotificationService:
 
         try:
             # Get overdue tasks
-            overdue_tasks = await TaskService.get_overdue_tasks()
+            overdue_tasks = await TaskService.get_overdue_task_rows()
 
             if not overdue_tasks:
                 return  # No overdue tasks
@@ -344,8 +344,8 @@ class NotificationService:
 
                         # Format assignees
                         assignee_mentions = []
-                        for assignee in task.assignees:
-                            assignee_mentions.append(f"<@{assignee.discord_id}>")
+                        for discord_id in task.assignee_discord_ids:
+                            assignee_mentions.append(f"<@{discord_id}>")
 
                         assignee_text = (
                             ", ".join(assignee_mentions)
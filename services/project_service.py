@@ -1,18 +1,40 @@
 """Project service for managing projects."""
 
 import logging
+from dataclasses import dataclass
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import desc, select
 from sqlalchemy.orm import selectinload
 
-from models import Project, User
+from config.settings import settings
+from models import Project, project_members
 from utils import get_async_session
+from utils.cache import LRUCache, invalidate_on_commit
+from services.search import search_matches, search_terms
 from services.user_service import UserService
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ProjectSummary:
+    """The project columns commands need to file work under a channel."""
+
+    id: int
+    name: str
+    color: str
+
+
+# Channel ID -> summary of its project, or None for channels without one
+channel_project_cache: LRUCache[int, Optional[ProjectSummary]] = LRUCache(
+    settings.project_cache_size, settings.project_cache_ttl
+)
+
+# Marks a channel that is not cached, as None means "no project"
+_NOT_CACHED = object()
+
+
 class ProjectService:
     """Service for managing projects."""
     
@@ -33,6 +55,10 @@ class ProjectService:
             )
             
             session.add(project)
+            if discord_channel_id is not None:
+                invalidate_on_commit(
+                    session, channel_project_cache, [discord_channel_id]
+                )
             await session.commit()
             await session.refresh(project)
             return project
@@ -40,7 +66,7 @@ class ProjectService:
     @staticmethod
     async def get_project_by_id(project_id: int) -> Optional[Project]:
         """Get project by ID with all related data."""
-        async with get_async_session() as session:
+        async with get_async_session(read_only=True) as session:
             result = await session.execute(
                 select(Project)
                 .options(
@@ -54,7 +80,7 @@ class ProjectService:
     @staticmethod
     async def get_project_by_channel(channel_id: int) -> Optional[Project]:
         """Get project by Discord channel ID."""
-        async with get_async_session() as session:
+        async with get_async_session(read_only=True) as session:
             result = await session.execute(
                 select(Project)
                 .options(
@@ -65,10 +91,42 @@ class ProjectService:
             )
             return result.scalar_one_or_none()
     
+    @staticmethod
+    async def get_project_summary_by_channel(
+        channel_id: int,
+    ) -> Optional[ProjectSummary]:
+        """Get id, name and color of a channel's project, usually from memory.
+
+        Unlike :meth:`get_project_by_channel` no members or tasks are
+        loaded. Channels without a project are cached too. Misses are
+        read from the primary, since a lagging replica could otherwise
+        cache a project that was already moved or deleted.
+        """
+        summary = channel_project_cache.get(channel_id, _NOT_CACHED)
+        if summary is not _NOT_CACHED:
+            return summary
+
+        generation = channel_project_cache.generation
+        async with get_async_session() as session:
+            result = await session.execute(
+                select(Project.id, Project.name, Project.color)
+                .where(Project.discord_channel_id == channel_id)
+                .order_by(Project.id)
+                .limit(1)
+            )
+            row = result.first()
+            cacheable = session.scope_depth == 1
+
+        summary = ProjectSummary(row.id, row.name, row.color) if row else None
+        # Inside a unit of work the project may not be committed yet
+        if cacheable:
+            channel_project_cache.set(channel_id, summary, generation)
+        return summary
+
     @staticmethod
     async def get_all_projects(include_inactive: bool = False) -> List[Project]:
         """Get all projects."""
-        async with get_async_session() as session:
+        async with get_async_session(read_only=True) as session:
             query = select(Project).options(
                 selectinload(Project.members),
                 selectinload(Project.tasks)
@@ -92,11 +150,17 @@ class ProjectService:
             if not project:
                 return None
             
+            # Both the old and a new channel may change hands
+            channel_ids = {project.discord_channel_id}
+
             # Update fields
             for key, value in kwargs.items():
                 if hasattr(project, key):
                     setattr(project, key, value)
             
+            channel_ids.add(project.discord_channel_id)
+            channel_ids.discard(None)
+            invalidate_on_commit(session, channel_project_cache, channel_ids)
             await session.commit()
             await session.refresh(project)
             return project
@@ -150,19 +214,19 @@ class ProjectService:
     @staticmethod
     async def get_projects_for_user(user_discord_id: int) -> List[Project]:
         """Get all projects a user is a member of."""
-        async with get_async_session() as session:
-            user = await UserService.get_user_by_discord_id(user_discord_id)
-            if not user:
-                return []
-            
+        identity = await UserService.resolve_user(user_discord_id)
+        if identity is None:
+            return []
+
+        async with get_async_session(read_only=True) as session:
             result = await session.execute(
                 select(Project)
                 .options(
                     selectinload(Project.members),
                     selectinload(Project.tasks)
                 )
-                .join(Project.members)
-                .where(User.id == user.id)
+                .join(project_members, project_members.c.project_id == Project.id)
+                .where(project_members.c.user_id == identity.id)
                 .where(Project.is_active == True)
             )
             return result.scalars().all()
@@ -178,24 +242,31 @@ class ProjectService:
             
             if project:
                 project.is_active = False
+                if project.discord_channel_id is not None:
+                    invalidate_on_commit(
+                        session, channel_project_cache, [project.discord_channel_id]
+                    )
                 await session.commit()
                 return True
             return False
     
     @staticmethod
     async def search_projects(query: str) -> List[Project]:
-        """Search projects by name or description."""
-        async with get_async_session() as session:
+        """Search projects by name or description, most relevant first."""
+        terms = search_terms(query)
+        if not terms:
+            return []
+
+        async with get_async_session(read_only=True) as session:
+            matches = search_matches("projects", terms, session.bind.dialect.name)
             result = await session.execute(
                 select(Project)
                 .options(
                     selectinload(Project.members),
                     selectinload(Project.tasks)
                 )
-                .where(
-                    (Project.name.ilike(f"%{query}%")) |
-                    (Project.description.ilike(f"%{query}%"))
-                )
+                .join(matches, matches.c.id == Project.id)
                 .where(Project.is_active == True)
+                .order_by(desc(matches.c.score), desc(Project.id))
             )
             return result.scalars().all()
\ No newline at end of file
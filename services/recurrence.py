@@ -0,0 +1,111 @@
+"""Recurrence rules for recurring tasks.
+
+A task's ``recurrence_pattern`` is either one of the simple patterns
+(daily, weekly, monthly, yearly, repeated every ``recurrence_frequency``
+periods) or an iCalendar RRULE such as ``FREQ=WEEKLY;BYDAY=MO,WE,FR``.
+Both are evaluated with ``dateutil.rrule`` from the task's anchor date.
+"""
+
+import re
+from datetime import datetime, timezone
+from itertools import islice
+from typing import List, Optional
+
+from dateutil.rrule import DAILY, MONTHLY, WEEKLY, YEARLY, rrule, rrulestr
+
+SIMPLE_PATTERNS = {
+    "daily": DAILY,
+    "weekly": WEEKLY,
+    "monthly": MONTHLY,
+    "yearly": YEARLY,
+}
+
+# Tasks are materialized by an hourly job, so finer rules make no sense
+_SUB_HOURLY = re.compile(r"FREQ=(MINUTELY|SECONDLY)")
+
+# Most instances created for one task in a single run, e.g. after downtime
+MAX_OCCURRENCES_PER_RUN = 100
+
+
+class InvalidRecurrenceError(ValueError):
+    """Raised when a recurrence pattern cannot be parsed."""
+
+
+def as_utc(value: datetime) -> datetime:
+    """``value`` as an aware datetime; naive values (SQLite) are UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def recurrence_rule(pattern: str, frequency: int, start: datetime) -> rrule:
+    """Rule for ``pattern`` whose first occurrence is ``start``.
+
+    Monthly and yearly patterns anchored on a day that some months lack
+    fall on the last day of those months instead: a task starting on
+    January 31st recurs on February 28th (29th), March 31st, April 30th.
+    ``frequency`` only applies to simple patterns; an RRULE carries its
+    own ``INTERVAL``.
+    """
+    start = as_utc(start)
+    freq = SIMPLE_PATTERNS.get(pattern.strip().lower())
+
+    if freq is not None:
+        if frequency < 1:
+            raise InvalidRecurrenceError("Frequency must be at least 1")
+        if freq in (MONTHLY, YEARLY) and start.day > 28:
+            # The last of the days up to the anchor day that the month has
+            return rrule(
+                freq,
+                interval=frequency,
+                dtstart=start,
+                bymonth=start.month if freq == YEARLY else None,
+                bymonthday=tuple(range(28, start.day + 1)),
+                bysetpos=-1,
+            )
+        return rrule(freq, interval=frequency, dtstart=start)
+
+    text = pattern.strip()
+    if text.upper().startswith("RRULE:"):
+        text = text[len("RRULE:") :]
+    if "FREQ=" not in text.upper():
+        raise InvalidRecurrenceError(
+            f"Unknown recurrence pattern {pattern!r}; use daily, weekly, "
+            f"monthly, yearly or an RRULE like FREQ=WEEKLY;BYDAY=MO,FR"
+        )
+    try:
+        rule = rrulestr(text, dtstart=start)
+    except (TypeError, ValueError) as e:
+        raise InvalidRecurrenceError(f"Invalid RRULE {pattern!r}: {e}") from e
+    if not isinstance(rule, rrule) or _SUB_HOURLY.search(text.upper()):
+        raise InvalidRecurrenceError(
+            f"Invalid RRULE {pattern!r}: a single rule recurring at most hourly "
+            f"is supported"
+        )
+    return rule
+
+
+def next_occurrence(
+    rule: rrule, after: datetime, end: Optional[datetime] = None
+) -> Optional[datetime]:
+    """First occurrence strictly after ``after``, or None once the rule ends."""
+    occurrence = rule.after(as_utc(after))
+    if occurrence is None or (end is not None and occurrence > as_utc(end)):
+        return None
+    return occurrence
+
+
+def occurrences_between(
+    rule: rrule,
+    start: datetime,
+    until: datetime,
+    limit: int = MAX_OCCURRENCES_PER_RUN,
+) -> List[datetime]:
+    """Occurrences in ``[start, until]``, oldest first, at most ``limit``."""
+    until = as_utc(until)
+    occurrences = []
+    for occurrence in islice(rule.xafter(as_utc(start), inc=True), limit):
+        if occurrence > until:
+            break
+        occurrences.append(occurrence)
+    return occurrences
@@ -0,0 +1,271 @@
+"""Saved views: named task filters compiled once and served from a cache.
+
+A view's :class:`ViewSpec` is stored as JSON on :class:`SavedView`. The
+first time a view runs, its spec is compiled into a statement that is
+reused for every later run; results are cached until a commit changes
+the task tables (see ``utils.change_tracking``) or they expire.
+"""
+
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Select, asc, bindparam, case, delete, desc, func, select
+
+from config.settings import settings
+from models import (
+    SavedView,
+    Task,
+    TaskPriority,
+    TaskStatus,
+    User,
+    task_assignees,
+    task_tags,
+)
+from models.tags import normalize_tag
+from services.task_rows import TaskRow, task_rows_query, to_task_row
+from services.user_service import UserService
+from utils import get_async_session
+from utils.cache import LRUCache
+from utils.change_tracking import table_generation
+
+logger = logging.getLogger(__name__)
+
+# Orders a view can be sorted in
+VIEW_SORTS = ("newest", "due", "priority")
+
+# Most tasks a view shows
+MAX_VIEW_TASKS = 100
+
+# Tables whose committed changes invalidate cached view results
+VIEW_TABLES = ("tasks", "task_assignees", "task_tags")
+
+# Cached results are dropped after this long even without writes, which
+# also moves "due within" windows along
+VIEW_RESULT_TTL_SECONDS = 60.0
+
+# Compiled statements only change when their view is saved or deleted
+COMPILED_VIEW_TTL_SECONDS = 3600.0
+
+_STATUSES = {status.value for status in TaskStatus}
+_PRIORITY_RANK = {
+    TaskPriority.URGENT.value: 0,
+    TaskPriority.HIGH.value: 1,
+    TaskPriority.MEDIUM.value: 2,
+    TaskPriority.LOW.value: 3,
+}
+
+
+class SavedViewError(ValueError):
+    """Raised when a saved view definition is invalid."""
+
+
+@dataclass(frozen=True)
+class ViewSpec:
+    """Filter and sort of a saved view; empty filters match everything.
+
+    ``due_within_days`` keeps tasks due before that many days from now,
+    overdue ones included. Tags match case-insensitively, any of them
+    unless ``match_all_tags`` is set.
+    """
+
+    status: Optional[str] = None
+    assignee_discord_id: Optional[int] = None
+    project_id: Optional[int] = None
+    due_within_days: Optional[int] = None
+    tags: Tuple[str, ...] = field(default=())
+    match_all_tags: bool = False
+    sort: str = "newest"
+    limit: int = 25
+
+    def __post_init__(self):
+        if self.status is not None and self.status not in _STATUSES:
+            raise SavedViewError(f"Unknown status {self.status!r}")
+        if self.due_within_days is not None and self.due_within_days < 0:
+            raise SavedViewError("due_within_days cannot be negative")
+        if self.sort not in VIEW_SORTS:
+            raise SavedViewError(
+                f"Unknown sort {self.sort!r}; use one of {', '.join(VIEW_SORTS)}"
+            )
+        if not 1 <= self.limit <= MAX_VIEW_TASKS:
+            raise SavedViewError(f"Views show 1 to {MAX_VIEW_TASKS} tasks")
+        tags = tuple(dict.fromkeys(filter(None, map(normalize_tag, self.tags))))
+        object.__setattr__(self, "tags", tags)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ViewSpec":
+        """Spec stored in ``SavedView.spec``; unknown keys are ignored."""
+        known = {key: data[key] for key in cls.__dataclass_fields__ if key in data}
+        known["tags"] = tuple(known.get("tags") or ())
+        return cls(**known)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible form for ``SavedView.spec``."""
+        data = asdict(self)
+        data["tags"] = list(self.tags)
+        return data
+
+
+def compile_view(spec: ViewSpec) -> Select:
+    """Statement listing the :class:`TaskRow` of a view.
+
+    The due window is a bind parameter (``due_before``) so the statement
+    can be executed again as time passes.
+    """
+    query = task_rows_query()
+
+    if spec.status:
+        query = query.where(Task.status == spec.status)
+
+    if spec.project_id:
+        query = query.where(Task.project_id == spec.project_id)
+
+    if spec.assignee_discord_id:
+        assigned_task_ids = (
+            select(task_assignees.c.task_id)
+            .join(User, User.id == task_assignees.c.user_id)
+            .where(User.discord_id == spec.assignee_discord_id)
+        )
+        query = query.where(Task.id.in_(assigned_task_ids))
+
+    if spec.due_within_days is not None:
+        query = query.where(Task.due_date < bindparam("due_before"))
+
+    if spec.tags:
+        tagged = select(task_tags.c.task_id).where(task_tags.c.tag.in_(spec.tags))
+        if spec.match_all_tags:
+            tagged = tagged.group_by(task_tags.c.task_id).having(
+                func.count() == len(spec.tags)
+            )
+        query = query.where(Task.id.in_(tagged))
+
+    due_last = case((Task.due_date.is_(None), 1), else_=0)
+    if spec.sort == "due":
+        order = (due_last, asc(Task.due_date), asc(Task.id))
+    elif spec.sort == "priority":
+        rank = case(_PRIORITY_RANK, value=Task.priority, else_=len(_PRIORITY_RANK))
+        order = (rank, due_last, asc(Task.due_date), asc(Task.id))
+    else:
+        order = (desc(Task.created_at), desc(Task.id))
+
+    return query.order_by(*order).limit(spec.limit)
+
+
+@dataclass(frozen=True)
+class _CompiledView:
+    spec: ViewSpec
+    statement: Select
+
+
+# View name -> compiled view
+compiled_views: LRUCache[str, _CompiledView] = LRUCache(
+    settings.view_cache_size, COMPILED_VIEW_TTL_SECONDS
+)
+# View name -> (table generation, rows)
+view_results: LRUCache[str, Tuple[int, Tuple[TaskRow, ...]]] = LRUCache(
+    settings.view_cache_size, VIEW_RESULT_TTL_SECONDS
+)
+
+
+class SavedViewService:
+    """Service for saved views."""
+
+    @staticmethod
+    async def save_view(
+        name: str, spec: ViewSpec, creator_discord_id: int
+    ) -> SavedView:
+        """Create a view, or replace the spec of the view with that name."""
+        name = name.strip()
+        if not name or len(name) > 100:
+            raise SavedViewError("View names must be 1 to 100 characters")
+
+        async with get_async_session() as session:
+            result = await session.execute(
+                select(SavedView).where(SavedView.name == name)
+            )
+            view = result.scalar_one_or_none()
+            if view is None:
+                (creator,) = await UserService.bulk_get_or_create([creator_discord_id])
+                view = SavedView(name=name, creator_id=creator.id)
+                session.add(view)
+            view.spec = spec.to_dict()
+            await session.commit()
+            await session.refresh(view)
+
+        SavedViewService.invalidate(name)
+        return view
+
+    @staticmethod
+    async def delete_view(name: str) -> bool:
+        """Delete a saved view."""
+        async with get_async_session() as session:
+            result = await session.execute(
+                delete(SavedView).where(SavedView.name == name)
+            )
+            await session.commit()
+
+        SavedViewService.invalidate(name)
+        return result.rowcount > 0
+
+    @staticmethod
+    async def get_view_names() -> List[str]:
+        """Names of all saved views, alphabetically."""
+        async with get_async_session(read_only=True) as session:
+            result = await session.execute(
+                select(SavedView.name).order_by(SavedView.name)
+            )
+            return list(result.scalars())
+
+    @staticmethod
+    async def run_view(name: str) -> Optional[List[TaskRow]]:
+        """Tasks of a saved view, or None if there is no such view.
+
+        Repeated runs are answered from the cache without touching the
+        database until a task changes. Views are run on the primary: a
+        lagging replica could otherwise cache results that predate the
+        generation they are stored under.
+        """
+        generation = table_generation(*VIEW_TABLES)
+        cached = view_results.get(name)
+        if cached and cached[0] == generation:
+            return list(cached[1])
+
+        # Saving or deleting the view while it runs discards what was read
+        results_generation = view_results.generation
+        compiled = compiled_views.get(name)
+        if compiled is None:
+            compiled_generation = compiled_views.generation
+            async with get_async_session() as session:
+                result = await session.execute(
+                    select(SavedView.spec).where(SavedView.name == name)
+                )
+                data = result.scalar_one_or_none()
+            if data is None:
+                return None
+            spec = ViewSpec.from_dict(data)
+            compiled = _CompiledView(spec, compile_view(spec))
+            compiled_views.set(name, compiled, compiled_generation)
+
+        parameters = {}
+        if compiled.spec.due_within_days is not None:
+            parameters["due_before"] = datetime.now(timezone.utc) + timedelta(
+                days=compiled.spec.due_within_days
+            )
+
+        async with get_async_session() as session:
+            result = await session.execute(compiled.statement, parameters)
+            rows = tuple(to_task_row(row) for row in result)
+
+        view_results.set(name, (generation, rows), results_generation)
+        return list(rows)
+
+    @staticmethod
+    def invalidate(name: Optional[str] = None) -> None:
+        """Forget the compiled statement and results of a view, or of all."""
+        if name is None:
+            compiled_views.clear()
+            view_results.clear()
+        else:
+            compiled_views.pop(name)
+            view_results.pop(name)
@@ -0,0 +1,53 @@
+"""Full-text search queries over the indexes defined in models.search."""
+
+import re
+from typing import List
+
+from sqlalchemy import Subquery, column, func, literal_column, select, table
+
+from models.search import SEARCH_CONFIG
+
+# Ranking weight of the first searchable column relative to the second
+PRIMARY_COLUMN_WEIGHT = 10.0
+
+_TERM = re.compile(r"\w+")
+
+
+def search_terms(query: str) -> List[str]:
+    """Words of a user query; punctuation and search operators are dropped."""
+    return _TERM.findall(query.lower())
+
+
+def search_matches(table_name: str, terms: List[str], dialect_name: str) -> Subquery:
+    """Rows of ``table_name`` matching every term (as a prefix), with a score.
+
+    Returns a subquery with ``id`` and ``score`` columns; higher scores are
+    more relevant. Join it to the searched table on ``id``.
+    """
+    if dialect_name == "postgresql":
+        searched = table(table_name, column("id"), column("search_vector"))
+        tsquery = func.to_tsquery(
+            SEARCH_CONFIG, " & ".join(f"'{term}':*" for term in terms)
+        )
+        return (
+            select(
+                searched.c.id,
+                func.ts_rank_cd(searched.c.search_vector, tsquery).label("score"),
+            )
+            .where(searched.c.search_vector.op("@@")(tsquery))
+            .subquery()
+        )
+
+    # SQLite FTS5: bm25() is lower for better matches
+    fts_name = f"{table_name}_fts"
+    fts = literal_column(fts_name)
+    match = " AND ".join(f'"{term}"*' for term in terms)
+    return (
+        select(
+            literal_column("rowid").label("id"),
+            (-func.bm25(fts, PRIMARY_COLUMN_WEIGHT, 1.0)).label("score"),
+        )
+        .select_from(table(fts_name))
+        .where(fts.op("MATCH")(match))
+        .subquery()
+    )
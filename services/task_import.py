@@ -0,0 +1,142 @@
+"""Parsing of CSV and JSON task imports for TaskService.create_tasks_bulk."""
+
+import csv
+import io
+import json
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from models import TaskPriority
+
+# Largest import accepted in one go
+MAX_IMPORT_ROWS = 1000
+MAX_IMPORT_BYTES = 1024 * 1024
+
+# Columns (CSV) or keys (JSON) read from each row; others are ignored
+IMPORT_FIELDS = (
+    "title",
+    "description",
+    "priority",
+    "due_date",
+    "tags",
+    "estimated_hours",
+    "assignees",
+)
+
+_PRIORITIES = {priority.value for priority in TaskPriority}
+# Tags may contain spaces; user IDs and mentions may be separated by them
+_TAG_SEPARATOR = re.compile(r"[,;]")
+_ASSIGNEE_SEPARATOR = re.compile(r"[,;\s]+")
+_DISCORD_ID = re.compile(r"^(?:<@!?)?(\d+)>?$")
+
+
+class TaskImportError(ValueError):
+    """Raised when an import file cannot be turned into tasks."""
+
+
+def parse_task_file(filename: str, data: bytes) -> List[Dict[str, Any]]:
+    """Tasks of a ``.csv`` or ``.json`` import file.
+
+    CSV files need a header row with a ``title`` column; JSON files hold a
+    list of objects. Rows come back as keyword arguments for
+    :meth:`TaskService.create_tasks_bulk`. Every row is validated before
+    anything is returned, so a bad row never leaves a partial import.
+    """
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise TaskImportError("Import files must be UTF-8 encoded") from e
+
+    extension = filename.rsplit(".", 1)[-1].lower()
+    if extension == "csv":
+        records: Iterable[Any] = csv.DictReader(io.StringIO(text))
+    elif extension == "json":
+        try:
+            records = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise TaskImportError(f"Invalid JSON: {e}") from e
+        if not isinstance(records, list):
+            raise TaskImportError("JSON imports must be a list of tasks")
+    else:
+        raise TaskImportError("Only .csv and .json files can be imported")
+
+    tasks = []
+    for number, record in enumerate(records, start=1):
+        if number > MAX_IMPORT_ROWS:
+            raise TaskImportError(f"Imports are limited to {MAX_IMPORT_ROWS} tasks")
+        tasks.append(parse_task_record(record, number))
+    return tasks
+
+
+def parse_task_record(record: Any, number: int) -> Dict[str, Any]:
+    """Validated task of one CSV row or JSON object (``number`` is 1-based)."""
+    if not isinstance(record, dict):
+        raise TaskImportError(f"Row {number}: expected an object")
+
+    values = {field: _blank_to_none(record.get(field)) for field in IMPORT_FIELDS}
+    title = values["title"]
+    if not isinstance(title, str) or not title.strip():
+        raise TaskImportError(f"Row {number}: title is required")
+    if len(title) > 300:
+        raise TaskImportError(f"Row {number}: title is longer than 300 characters")
+
+    priority = str(values["priority"] or TaskPriority.MEDIUM.value).lower()
+    if priority not in _PRIORITIES:
+        raise TaskImportError(f"Row {number}: unknown priority {priority!r}")
+
+    task: Dict[str, Any] = {
+        "title": title.strip(),
+        "description": values["description"],
+        "priority": priority,
+        "due_date": _parse_due_date(values["due_date"], number),
+        "tags": _split_list(values["tags"], _TAG_SEPARATOR),
+        "estimated_hours": None,
+        "assignee_discord_ids": [
+            _parse_discord_id(item, number)
+            for item in _split_list(values["assignees"], _ASSIGNEE_SEPARATOR)
+        ],
+    }
+    if values["estimated_hours"] is not None:
+        try:
+            task["estimated_hours"] = float(values["estimated_hours"])
+        except (TypeError, ValueError):
+            raise TaskImportError(
+                f"Row {number}: estimated_hours must be a number"
+            ) from None
+    return task
+
+
+def _blank_to_none(value: Any) -> Any:
+    if isinstance(value, str) and not value.strip():
+        return None
+    return value
+
+
+def _split_list(value: Any, separator: "re.Pattern[str]") -> List[str]:
+    """Items of a JSON list or of a string split on ``separator``."""
+    if value is None:
+        return []
+    items = value if isinstance(value, list) else separator.split(str(value))
+    return [str(item).strip() for item in items if str(item).strip()]
+
+
+def _parse_due_date(value: Any, number: int) -> Optional[datetime]:
+    if value is None:
+        return None
+    try:
+        due_date = datetime.fromisoformat(str(value))
+    except ValueError:
+        raise TaskImportError(
+            f"Row {number}: due_date must be YYYY-MM-DD or an ISO timestamp"
+        ) from None
+    if due_date.tzinfo is None:
+        due_date = due_date.replace(tzinfo=timezone.utc)
+    return due_date
+
+
+def _parse_discord_id(value: str, number: int) -> int:
+    match = _DISCORD_ID.match(value)
+    if not match:
+        raise TaskImportError(f"Row {number}: assignee {value!r} is not a user ID")
+    return int(match.group(1))
@@ -0,0 +1,95 @@
+"""Lightweight task projections for list and summary views."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+from models import Task, User, task_assignees
+
+
+@dataclass(frozen=True, slots=True)
+class TaskRow:
+    """The columns list views read from a task, without ORM state."""
+
+    id: int
+    title: str
+    status: str
+    priority: str
+    due_date: Optional[datetime]
+    discord_channel_id: Optional[int]
+    created_at: Optional[datetime]
+    assignee_discord_ids: Tuple[int, ...]
+
+
+class aggregate_ids(FunctionElement):
+    """Aggregate integer ids of a group into one value.
+
+    PostgreSQL returns an array, SQLite a comma separated string; use
+    :func:`parse_ids` to read either.
+    """
+
+    name = "aggregate_ids"
+    inherit_cache = True
+
+
+@compiles(aggregate_ids)
+def _compile_aggregate_ids(element, compiler, **kw):
+    return f"group_concat({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(aggregate_ids, "postgresql")
+def _compile_aggregate_ids_postgresql(element, compiler, **kw):
+    return f"array_agg({compiler.process(element.clauses, **kw)})"
+
+
+def parse_ids(value: Any) -> Tuple[int, ...]:
+    """Read the result of :class:`aggregate_ids`."""
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return tuple(int(part) for part in value.split(","))
+    return tuple(part for part in value if part is not None)
+
+
+def task_rows_query() -> Select:
+    """Select the :class:`TaskRow` columns with aggregated assignee Discord IDs.
+
+    Assignees are aggregated in a correlated subquery rather than with a
+    ``GROUP BY`` so filters and ordering on ``tasks`` can still use its
+    indexes.
+    """
+    assignee_discord_ids = (
+        select(aggregate_ids(User.discord_id))
+        .select_from(task_assignees)
+        .join(User, User.id == task_assignees.c.user_id)
+        .where(task_assignees.c.task_id == Task.id)
+        .scalar_subquery()
+    )
+    return select(
+        Task.id,
+        Task.title,
+        Task.status,
+        Task.priority,
+        Task.due_date,
+        Task.discord_channel_id,
+        Task.created_at,
+        assignee_discord_ids.label("assignee_discord_ids"),
+    )
+
+
+def to_task_row(row: Any) -> TaskRow:
+    """Build a :class:`TaskRow` from a row of :func:`task_rows_query`."""
+    return TaskRow(
+        id=row.id,
+        title=row.title,
+        status=row.status,
+        priority=row.priority,
+        due_date=row.due_date,
+        discord_channel_id=row.discord_channel_id,
+        created_at=row.created_at,
+        assignee_discord_ids=parse_ids(row.assignee_discord_ids),
+    )
@@ -1,19 +1,143 @@
 """Task service for managing tasks."""
 
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
-
-from sqlalchemy import and_, asc, desc, or_, select
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from dateutil.rrule import rrule
+from sqlalchemy import (
+    and_,
+    asc,
+    case,
+    delete,
+    desc,
+    exists,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    or_,
+    select,
+    true,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from models import Project, Task, TaskPriority, TaskStatus, User
+from models import (
+    Project,
+    Task,
+    TaskPriority,
+    TaskStatus,
+    User,
+    task_assignees,
+    task_tags,
+)
+from models.tags import normalize_tag
+from services.custom_field_service import CustomFieldService, FieldFilter
+from services.recurrence import (
+    MAX_OCCURRENCES_PER_RUN,
+    InvalidRecurrenceError,
+    as_utc,
+    next_occurrence,
+    occurrences_between,
+    recurrence_rule,
+)
+from config.settings import settings
+from services.task_rows import TaskRow, task_rows_query, to_task_row
 from services.user_service import UserService
 from utils import get_async_session
+from utils.cache import LRUCache, invalidate_on_commit
+from services.search import search_matches, search_terms
+from utils.pagination import (
+    Page,
+    build_page,
+    decode_cursor,
+    decode_score_cursor,
+    encode_score_cursor,
+    keyset_before,
+    keyset_below,
+)
 
 logger = logging.getLogger(__name__)
 
+# Filter for tasks that are neither done nor cancelled. The statuses are
+# rendered inline so the planner can match models.OPEN_TASK_PREDICATE and
+# use the partial ix_tasks_open_due_date index.
+OPEN_TASK_FILTER = and_(
+    Task.status != literal(TaskStatus.DONE.value, literal_execute=True),
+    Task.status != literal(TaskStatus.CANCELLED.value, literal_execute=True),
+)
+
+
+# Task ID -> task loaded by get_task_by_id with its relationships. Writes
+# drop their tasks on commit; the TTL bounds staleness of related rows
+# (user names, project names) changed elsewhere.
+task_cache: LRUCache[int, Task] = LRUCache(
+    settings.task_cache_size, settings.task_cache_ttl
+)
+
+# Columns update_task and bulk_update may set; id and version are managed
+UPDATABLE_COLUMNS = frozenset(Task.__table__.columns.keys()) - {"id", "version"}
+
+
+class TaskConflictError(RuntimeError):
+    """Raised when a task changed after the version the caller last saw."""
+
+    def __init__(self, task_id: int, expected_version: int):
+        super().__init__(
+            f"Task {task_id} was changed by someone else "
+            f"(expected version {expected_version})"
+        )
+        self.task_id = task_id
+        self.expected_version = expected_version
+
+
+async def _insert_tasks(
+    session: AsyncSession, rows: List[Dict[str, Any]], assignees: List[List[int]]
+) -> List[int]:
+    """Insert task rows and their assignee user ids with multi-row inserts.
+
+    Returns the new task ids in the order of ``rows``.
+    """
+    result = await session.execute(insert(Task).returning(Task.id), rows)
+    # Both backends hand out ids in VALUES order, so ascending ids follow
+    # the input. Asking SQLAlchemy to sort by parameter order instead would
+    # make it insert one row at a time on SQLite.
+    task_ids = sorted(result.scalars())
+
+    assignee_rows = [
+        {"task_id": task_id, "user_id": user_id}
+        for task_id, user_ids in zip(task_ids, assignees)
+        for user_id in user_ids
+    ]
+    if assignee_rows:
+        await session.execute(insert(task_assignees), assignee_rows)
+    return task_ids
+
+
+def _recurrence_rule_of(task: Task) -> rrule:
+    """Recurrence rule of a template, anchored on its due or creation date."""
+    return recurrence_rule(
+        task.recurrence_pattern,
+        task.recurrence_frequency or 1,
+        task.due_date or task.created_at,
+    )
+
+
+def _completed_at_for(status: str) -> Any:
+    """SQL value of ``completed_at`` for a task moving to ``status``.
+
+    Done tasks keep an existing completion time or get the current one;
+    any other status clears it.
+    """
+    if status == TaskStatus.DONE.value:
+        return case(
+            (Task.completed_at.is_(None), datetime.now(timezone.utc)),
+            else_=Task.completed_at,
+        )
+    return None
+
 
 class TaskService:
     """Service for managing tasks."""
@@ -39,16 +163,33 @@ class TaskService:
 
             async with get_async_session() as session:
                 try:
-                    # Get or create creator
+                    # Resolve creator and assignees, from the identity cache
+                    # when possible, else with one statement
                     try:
-                        creator = await UserService.get_or_create_user(
-                            discord_id=creator_discord_id,
-                            username="Unknown",  # Will be updated when we have more info
+                        discord_ids = list(
+                            dict.fromkeys(
+                                [creator_discord_id, *(assignee_discord_ids or [])]
+                            )
+                        )
+                        user_ids = dict(
+                            zip(
+                                discord_ids,
+                                await UserService.resolve_user_ids(discord_ids),
+                            )
+                        )
+                        creator_id = user_ids[creator_discord_id]
+                        assignee_ids = [
+                            user_ids[discord_id]
+                            for discord_id in dict.fromkeys(assignee_discord_ids or [])
+                        ]
+                        logger.info(
+                            f"Creator {creator_id} and assignees "
+                            f"{assignee_discord_ids} fetched/created"
                         )
-                        logger.info(f"Creator user fetched/created: {creator.id}")
                     except Exception as e:
                         logger.error(
-                            f"Failed to get/create creator: {e}", exc_info=True
+                            f"Failed to get/create creator or assignees: {e}",
+                            exc_info=True,
                         )
                         raise
 
@@ -57,7 +198,7 @@ class TaskService:
                         task = Task(
                             title=title,
                             description=description,
-                            creator_id=creator.id,
+                            creator_id=creator_id,
                             project_id=project_id,
                             priority=priority,
                             due_date=due_date,
@@ -75,35 +216,36 @@ class TaskService:
                         )
                         raise
 
-                    # Add task to session and flush
+                    # Add task to session
+                    session.add(task)
+                    logger.info("Task added to session")
+
+                    # Flush to get the task ID
                     try:
-                        session.add(task)
-                        logger.info("Task added to session")
-                        await session.flush()  # Get task ID
+                        await session.flush()
                         logger.info(f"Session flushed, task ID: {task.id}")
                     except Exception as e:
                         logger.error(f"Failed to flush session: {e}", exc_info=True)
                         raise
 
-                    # Add assignees if provided
-                    try:
-                        if assignee_discord_ids:
-                            for discord_id in assignee_discord_ids:
-                                assignee = await UserService.get_or_create_user(
-                                    discord_id=discord_id, username="Unknown"
-                                )
-                                task.assignees.append(assignee)
-                            logger.info(f"Added assignees: {assignee_discord_ids}")
-                    except Exception as e:
-                        logger.error(f"Failed to add assignees: {e}", exc_info=True)
-                        raise
+                    if assignee_ids:
+                        await session.execute(
+                            insert(task_assignees),
+                            [
+                                {"task_id": task.id, "user_id": user_id}
+                                for user_id in assignee_ids
+                            ],
+                        )
 
-                    # Commit and refresh
+                    # Refresh and commit (refreshing first reuses the connection)
                     try:
+                        await session.refresh(
+                            task,
+                            ["created_at", "creator", "assignees", "project"],
+                        )
+                        logger.info(f"Task refreshed: {task.id}")
                         await session.commit()
                         logger.info("Session committed")
-                        await session.refresh(task)
-                        logger.info(f"Task refreshed: {task.id}")
                         return task
                     except Exception as e:
                         logger.error(f"Failed to commit or refresh: {e}", exc_info=True)
@@ -117,26 +259,106 @@ class TaskService:
             logger.error(f"Task creation failed: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    async def create_tasks_bulk(
+        tasks: List[Dict[str, Any]],
+        creator_discord_id: int,
+        project_id: Optional[int] = None,
+        discord_channel_id: Optional[int] = None,
+    ) -> List[int]:
+        """Create many tasks in one transaction with multi-row inserts.
+
+        Each item of ``tasks`` takes the keyword arguments of
+        :meth:`create_task` for a single task: ``title`` plus optionally
+        ``description``, ``priority``, ``due_date``, ``tags``,
+        ``custom_fields``, ``estimated_hours`` and ``assignee_discord_ids``.
+        Creator, project and channel are shared by all of them.
+
+        Users, tasks and assignee rows are written with one statement each
+        (split into batches by the driver if needed), so the cost no longer
+        grows with a flush and commit per task. Returns the new task IDs in
+        the order of ``tasks``.
+        """
+        if not tasks:
+            return []
+
+        logger.info(
+            f"Creating {len(tasks)} tasks in bulk, creator: {creator_discord_id}"
+        )
+        assignee_ids = [
+            list(dict.fromkeys(task.get("assignee_discord_ids") or []))
+            for task in tasks
+        ]
+        discord_ids = list(
+            dict.fromkeys(
+                [creator_discord_id, *(d for ids in assignee_ids for d in ids)]
+            )
+        )
+        user_ids = dict(
+            zip(discord_ids, await UserService.resolve_user_ids(discord_ids))
+        )
+        creator_id = user_ids[creator_discord_id]
+
+        async with get_async_session() as session:
+            task_ids = await _insert_tasks(
+                session,
+                [
+                    {
+                        "title": task["title"],
+                        "description": task.get("description"),
+                        "creator_id": creator_id,
+                        "project_id": project_id,
+                        "priority": task.get("priority") or TaskPriority.MEDIUM.value,
+                        "due_date": task.get("due_date"),
+                        "tags": task.get("tags") or [],
+                        "custom_fields": task.get("custom_fields") or {},
+                        "estimated_hours": task.get("estimated_hours"),
+                        "discord_channel_id": discord_channel_id,
+                        "is_recurring": False,
+                    }
+                    for task in tasks
+                ],
+                [[user_ids[discord_id] for discord_id in ids] for ids in assignee_ids],
+            )
+            await session.commit()
+            return task_ids
+
     @staticmethod
     async def get_task_by_id(task_id: int) -> Optional[Task]:
-        """Get task by ID with all related data."""
+        """Get task by ID with all related data.
+
+        Tasks are served from ``task_cache`` when possible. Cached tasks are
+        detached snapshots shared between callers and must not be modified.
+        Misses are read from the primary: a lagging replica could otherwise
+        cache a version that was already replaced.
+        """
+        task = task_cache.get(task_id)
+        if task is not None:
+            return task
+
+        generation = task_cache.generation
         async with get_async_session() as session:
             result = await session.execute(
-                select(Task)
-                .options(
-                    selectinload(Task.creator),
-                    selectinload(Task.assignees),
-                    selectinload(Task.project),
-                    selectinload(Task.time_entries),
+                lambda_stmt(
+                    lambda: select(Task).options(
+                        selectinload(Task.creator),
+                        selectinload(Task.assignees),
+                        selectinload(Task.project),
+                        selectinload(Task.time_entries),
+                    )
                 )
-                .where(Task.id == task_id)
+                + (lambda s: s.where(Task.id == task_id))
             )
-            return result.scalar_one_or_none()
+            task = result.scalar_one_or_none()
+            # Inside a unit of work the task may carry uncommitted changes
+            if task is not None and session.scope_depth == 1:
+                task_cache.set(task_id, task, generation)
+            return task
 
     @staticmethod
     async def get_task_by_discord_message(message_id: int) -> Optional[Task]:
         """Get task by Discord message ID."""
-        async with get_async_session() as session:
+        async with get_async_session(read_only=True) as session:
             result = await session.execute(
                 select(Task)
                 .options(
@@ -149,52 +371,150 @@ class TaskService:
             return result.scalar_one_or_none()
 
     @staticmethod
-    async def update_task(task_id: int, **kwargs) -> Optional[Task]:
-        """Update task with provided fields."""
+    async def update_task(
+        task_id: int, expected_version: Optional[int] = None, **kwargs
+    ) -> Optional[Task]:
+        """Update task with provided fields in a single UPDATE ... RETURNING.
+
+        Every update bumps ``version``. When ``expected_version`` is given,
+        the update only applies if the task is still at that version;
+        otherwise :class:`TaskConflictError` is raised instead of silently
+        overwriting a concurrent change. Returns None if the task does not
+        exist, else the updated task with its creator, assignees and
+        project loaded.
+        """
+        values: Dict[str, Any] = {
+            key: value for key, value in kwargs.items() if key in UPDATABLE_COLUMNS
+        }
+        if "status" in values:
+            values["completed_at"] = _completed_at_for(values["status"])
+        values["version"] = Task.version + 1
+
+        stmt = (
+            update(Task)
+            .where(Task.id == task_id)
+            .values(values)
+            .returning(Task)
+            .options(
+                selectinload(Task.creator),
+                selectinload(Task.assignees),
+                selectinload(Task.project),
+            )
+        )
+        if expected_version is not None:
+            stmt = stmt.where(Task.version == expected_version)
+
         async with get_async_session() as session:
-            result = await session.execute(select(Task).where(Task.id == task_id))
+            result = await session.execute(
+                stmt, execution_options={"populate_existing": True}
+            )
             task = result.scalar_one_or_none()
 
-            if not task:
-                return None
-
-            # Update fields
-            for key, value in kwargs.items():
-                if hasattr(task, key):
-                    setattr(task, key, value)
-
-            # Handle status change to completed
-            if kwargs.get("status") == TaskStatus.DONE.value and not task.completed_at:
-                task.completed_at = datetime.now(timezone.utc)
-            elif kwargs.get("status") != TaskStatus.DONE.value:
-                task.completed_at = None
+            if task is None and expected_version is not None:
+                # Only a failed update pays for telling the two cases apart
+                if await session.scalar(select(Task.id).where(Task.id == task_id)):
+                    raise TaskConflictError(task_id, expected_version)
 
+            invalidate_on_commit(session, task_cache, [task_id])
             await session.commit()
-            await session.refresh(task)
             return task
 
     @staticmethod
     async def assign_users_to_task(task_id: int, user_discord_ids: List[int]) -> bool:
         """Assign users to a task."""
         async with get_async_session() as session:
-            result = await session.execute(select(Task).where(Task.id == task_id))
+            result = await session.execute(
+                select(Task)
+                .options(selectinload(Task.assignees))
+                .where(Task.id == task_id)
+            )
             task = result.scalar_one_or_none()
 
             if not task:
                 return False
 
-            # Clear existing assignees
-            task.assignees.clear()
+            # Replace existing assignees
+            task.assignees = await UserService.bulk_get_or_create(user_discord_ids)
+
+            invalidate_on_commit(session, task_cache, [task_id])
+            await session.commit()
+            return True
+
+    @staticmethod
+    async def bulk_update(task_ids: List[int], **fields) -> int:
+        """Set the same column values on many tasks in one UPDATE.
+
+        Changing ``status`` keeps the :meth:`update_task` rules for
+        ``completed_at``: it is stamped when a task becomes done (unless it
+        already was) and cleared for any other status. Every task's
+        ``version`` is bumped. Returns the number of tasks updated.
+        """
+        invalid = set(fields) - UPDATABLE_COLUMNS
+        if invalid:
+            raise ValueError(f"Cannot bulk update fields: {sorted(invalid)}")
+        if not task_ids or not fields:
+            return 0
+
+        values: Dict[str, Any] = dict(fields)
+        if "status" in fields:
+            values["completed_at"] = _completed_at_for(fields["status"])
+        values["version"] = Task.version + 1
+
+        async with get_async_session() as session:
+            result = await session.execute(
+                update(Task)
+                .where(Task.id.in_(task_ids))
+                .values(values)
+                .execution_options(synchronize_session=False)
+            )
+            invalidate_on_commit(session, task_cache, task_ids)
+            await session.commit()
+            return result.rowcount
+
+    @staticmethod
+    async def bulk_assign(
+        task_ids: List[int], user_discord_ids: List[int], replace: bool = True
+    ) -> int:
+        """Assign users to many tasks with set-based statements.
+
+        With ``replace`` the tasks end up assigned to exactly these users,
+        like :meth:`assign_users_to_task`; otherwise the users are added to
+        the existing assignees. Returns the number of assignments created.
+        """
+        if not task_ids:
+            return 0
 
-            # Add new assignees
-            for discord_id in user_discord_ids:
-                user = await UserService.get_or_create_user(
-                    discord_id=discord_id, username="Unknown"
+        user_ids = await UserService.resolve_user_ids(user_discord_ids)
+
+        async with get_async_session() as session:
+            if replace:
+                await session.execute(
+                    delete(task_assignees).where(task_assignees.c.task_id.in_(task_ids))
+                )
+
+            created = 0
+            if user_ids:
+                already_assigned = exists().where(
+                    task_assignees.c.task_id == Task.id,
+                    task_assignees.c.user_id == User.id,
+                )
+                result = await session.execute(
+                    insert(task_assignees).from_select(
+                        ["task_id", "user_id"],
+                        select(Task.id, User.id)
+                        .join(User, true())
+                        .where(
+                            Task.id.in_(task_ids),
+                            User.id.in_(user_ids),
+                            ~already_assigned,
+                        ),
+                    )
                 )
-                task.assignees.append(user)
+                created = result.rowcount
 
+            invalidate_on_commit(session, task_cache, task_ids)
             await session.commit()
-            return True
+            return created
 
     @staticmethod
     async def delete_task(task_id: int) -> bool:
@@ -205,6 +525,7 @@ class TaskService:
 
             if task:
                 await session.delete(task)
+                invalidate_on_commit(session, task_cache, [task_id])
                 await session.commit()
                 return True
             return False
@@ -215,42 +536,56 @@ class TaskService:
         status: Optional[str] = None,
         project_id: Optional[int] = None,
         limit: int = 50,
-    ) -> List[Task]:
-        """Get tasks assigned to a user."""
-        async with get_async_session() as session:
-            # Get user
-            user = await UserService.get_user_by_discord_id(user_discord_id)
-            if not user:
-                return []
-
-            query = (
-                select(Task)
+        cursor: Optional[str] = None,
+    ) -> Page[Task]:
+        """Get a page of tasks assigned to a user, newest first."""
+        # Usually answered by the identity cache, so no users join is needed
+        identity = await UserService.resolve_user(user_discord_id)
+        if identity is None:
+            return Page()
+        user_id = identity.id
+
+        async with get_async_session(read_only=True) as session:
+            query = lambda_stmt(
+                lambda: select(Task)
                 .options(
                     selectinload(Task.creator),
                     selectinload(Task.assignees),
                     selectinload(Task.project),
                 )
-                .join(Task.assignees)
-                .where(User.id == user.id)
+                .join(task_assignees, task_assignees.c.task_id == Task.id)
+                .where(task_assignees.c.user_id == user_id)
             )
 
             if status:
-                query = query.where(Task.status == status)
+                query += lambda s: s.where(Task.status == status)
 
             if project_id:
-                query = query.where(Task.project_id == project_id)
+                query += lambda s: s.where(Task.project_id == project_id)
 
-            query = query.order_by(desc(Task.created_at)).limit(limit)
+            if cursor:
+                created_at, task_id = decode_cursor(cursor)
+                query += lambda s: s.where(
+                    keyset_before(Task.created_at, Task.id, created_at, task_id)
+                )
+
+            fetch = limit + 1
+            query += lambda s: s.order_by(desc(Task.created_at), desc(Task.id)).limit(
+                fetch
+            )
 
             result = await session.execute(query)
-            return result.scalars().all()
+            return build_page(result.scalars().all(), limit)
 
     @staticmethod
     async def get_tasks_for_project(
-        project_id: int, status: Optional[str] = None, limit: int = 100
-    ) -> List[Task]:
-        """Get tasks for a project."""
-        async with get_async_session() as session:
+        project_id: int,
+        status: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Page[Task]:
+        """Get a page of tasks for a project, newest first."""
+        async with get_async_session(read_only=True) as session:
             query = (
                 select(Task)
                 .options(
@@ -264,10 +599,17 @@ class TaskService:
             if status:
                 query = query.where(Task.status == status)
 
-            query = query.order_by(desc(Task.created_at)).limit(limit)
+            if cursor:
+                query = query.where(
+                    keyset_before(Task.created_at, Task.id, *decode_cursor(cursor))
+                )
+
+            query = query.order_by(desc(Task.created_at), desc(Task.id)).limit(
+                limit + 1
+            )
 
             result = await session.execute(query)
-            return result.scalars().all()
+            return build_page(result.scalars().all(), limit)
 
     @staticmethod
     async def search_tasks(
@@ -276,28 +618,40 @@ class TaskService:
         project_id: Optional[int] = None,
         status: Optional[str] = None,
         limit: int = 50,
-    ) -> List[Task]:
-        """Search tasks by title and description."""
-        async with get_async_session() as session:
+        cursor: Optional[str] = None,
+    ) -> Page[Task]:
+        """Search tasks by title and description, most relevant first.
+
+        Every word of ``query`` must match a word of the title or
+        description (as a prefix); title matches rank higher.
+        """
+        terms = search_terms(query)
+        if not terms:
+            return Page()
+
+        assignee_id = None
+        if user_discord_id:
+            identity = await UserService.resolve_user(user_discord_id)
+            if identity is None:
+                return Page()
+            assignee_id = identity.id
+
+        async with get_async_session(read_only=True) as session:
+            matches = search_matches("tasks", terms, session.bind.dialect.name)
             sql_query = (
-                select(Task)
+                select(Task, matches.c.score)
                 .options(
                     selectinload(Task.creator),
                     selectinload(Task.assignees),
                     selectinload(Task.project),
                 )
-                .where(
-                    or_(
-                        Task.title.ilike(f"%{query}%"),
-                        Task.description.ilike(f"%{query}%"),
-                    )
-                )
+                .join(matches, matches.c.id == Task.id)
             )
 
-            if user_discord_id:
-                user = await UserService.get_user_by_discord_id(user_discord_id)
-                if user:
-                    sql_query = sql_query.join(Task.assignees).where(User.id == user.id)
+            if assignee_id:
+                sql_query = sql_query.join(
+                    task_assignees, task_assignees.c.task_id == Task.id
+                ).where(task_assignees.c.user_id == assignee_id)
 
             if project_id:
                 sql_query = sql_query.where(Task.project_id == project_id)
@@ -305,32 +659,153 @@ class TaskService:
             if status:
                 sql_query = sql_query.where(Task.status == status)
 
-            sql_query = sql_query.order_by(desc(Task.created_at)).limit(limit)
+            if cursor:
+                sql_query = sql_query.where(
+                    keyset_below(matches.c.score, Task.id, *decode_score_cursor(cursor))
+                )
+
+            sql_query = sql_query.order_by(desc(matches.c.score), desc(Task.id)).limit(
+                limit + 1
+            )
 
             result = await session.execute(sql_query)
-            return result.scalars().all()
+            page = build_page(
+                result.all(),
+                limit,
+                lambda row: encode_score_cursor(row.score, row.Task.id),
+            )
+            return Page([row.Task for row in page], page.next_cursor)
+
+    @staticmethod
+    async def get_tasks_by_tags(
+        tags: List[str],
+        match: Literal["any", "all"] = "any",
+        project_id: Optional[int] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Page[Task]:
+        """Get a page of tasks tagged with any or all of ``tags``, newest first.
+
+        Tags match case-insensitively and with or without a leading ``#``.
+        """
+        if match not in ("any", "all"):
+            raise ValueError(f"match must be 'any' or 'all', not {match!r}")
+        normalized = list(dict.fromkeys(filter(None, map(normalize_tag, tags))))
+        if not normalized:
+            return Page()
+
+        tagged = select(task_tags.c.task_id).where(task_tags.c.tag.in_(normalized))
+        if match == "all":
+            tagged = tagged.group_by(task_tags.c.task_id).having(
+                func.count() == len(normalized)
+            )
+
+        query = (
+            select(Task)
+            .options(
+                selectinload(Task.creator),
+                selectinload(Task.assignees),
+                selectinload(Task.project),
+            )
+            .where(Task.id.in_(tagged))
+        )
+
+        if project_id:
+            query = query.where(Task.project_id == project_id)
+
+        if status:
+            query = query.where(Task.status == status)
+
+        if cursor:
+            query = query.where(
+                keyset_before(Task.created_at, Task.id, *decode_cursor(cursor))
+            )
+
+        query = query.order_by(desc(Task.created_at), desc(Task.id)).limit(limit + 1)
+
+        async with get_async_session(read_only=True) as session:
+            result = await session.execute(query)
+            return build_page(result.scalars().all(), limit)
+
+    @staticmethod
+    async def get_tag_counts(
+        project_id: int, status: Optional[str] = None
+    ) -> List[Tuple[str, int]]:
+        """Number of tasks per tag in a project, most used tags first."""
+        count = func.count().label("count")
+        query = (
+            select(task_tags.c.tag, count)
+            .join(Task, Task.id == task_tags.c.task_id)
+            .where(Task.project_id == project_id)
+            .group_by(task_tags.c.tag)
+            .order_by(desc(count), task_tags.c.tag)
+        )
+
+        if status:
+            query = query.where(Task.status == status)
+
+        async with get_async_session(read_only=True) as session:
+            result = await session.execute(query)
+            return [(tag, count) for tag, count in result]
+
+    @staticmethod
+    async def filter_tasks(
+        project_id: int,
+        filters: List[FieldFilter],
+        status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Page[Task]:
+        """Get a page of a project's tasks matching all custom field ``filters``.
+
+        Filters are checked against the project's field definitions and
+        raise :class:`CustomFieldError` for unknown fields or operators.
+        """
+        schema = await CustomFieldService.get_schema(project_id)
+        conditions = CustomFieldService.compile_filters(schema, filters)
+
+        query = (
+            select(Task)
+            .options(
+                selectinload(Task.creator),
+                selectinload(Task.assignees),
+                selectinload(Task.project),
+            )
+            .where(Task.project_id == project_id, *conditions)
+        )
+
+        if status:
+            query = query.where(Task.status == status)
+
+        if cursor:
+            query = query.where(
+                keyset_before(Task.created_at, Task.id, *decode_cursor(cursor))
+            )
+
+        query = query.order_by(desc(Task.created_at), desc(Task.id)).limit(limit + 1)
+
+        async with get_async_session(read_only=True) as session:
+            result = await session.execute(query)
+            return build_page(result.scalars().all(), limit)
 
     @staticmethod
     async def get_overdue_tasks() -> List[Task]:
         """Get all overdue tasks."""
-        async with get_async_session() as session:
+        async with get_async_session(read_only=True) as session:
             # Get tasks with due dates in the past and not completed or cancelled
             now = datetime.now(timezone.utc)
             result = await session.execute(
-                select(Task)
-                .options(
-                    selectinload(Task.creator),
-                    selectinload(Task.assignees),
-                    selectinload(Task.project),
-                )
-                .where(
-                    and_(
-                        Task.due_date < now,
-                        Task.status != TaskStatus.DONE.value,
-                        Task.status != TaskStatus.CANCELLED.value,
+                lambda_stmt(
+                    lambda: select(Task)
+                    .options(
+                        selectinload(Task.creator),
+                        selectinload(Task.assignees),
+                        selectinload(Task.project),
                     )
+                    .where(and_(Task.due_date < now, OPEN_TASK_FILTER))
+                    .order_by(asc(Task.due_date))
                 )
-                .order_by(asc(Task.due_date))
             )
             return result.scalars().all()
 
@@ -352,12 +827,28 @@ class TaskService:
         discord_channel_id: Optional[int] = None,
         discord_message_id: Optional[int] = None,
     ) -> Task:
-        """Create a new recurring task."""
+        """Create a new recurring task.
+
+        The task itself is the first occurrence; instances for later
+        occurrences are created by :meth:`process_recurring_tasks`.
+        Raises InvalidRecurrenceError for an unknown pattern.
+        """
+        # The rule is anchored on the due date, or the creation time
+        created_at = datetime.now(timezone.utc)
+        anchor = due_date or created_at
+        rule = recurrence_rule(recurrence_pattern, recurrence_frequency, anchor)
+
         async with get_async_session() as session:
-            # Get or create creator
-            creator = await UserService.get_or_create_user(
-                discord_id=creator_discord_id, username="Unknown"
+            # Get or create creator and assignees in one statement
+            users = await UserService.bulk_get_or_create(
+                [creator_discord_id, *(assignee_discord_ids or [])]
             )
+            users_by_discord_id = {user.discord_id: user for user in users}
+            creator = users_by_discord_id[creator_discord_id]
+            assignees = [
+                users_by_discord_id[discord_id]
+                for discord_id in dict.fromkeys(assignee_discord_ids or [])
+            ]
 
             # Create task
             task = Task(
@@ -376,22 +867,18 @@ class TaskService:
                 recurrence_pattern=recurrence_pattern,
                 recurrence_frequency=recurrence_frequency,
                 recurrence_end_date=recurrence_end_date,
-                last_recurrence_date=datetime.now(timezone.utc),
+                last_recurrence_date=anchor,
+                next_occurrence_at=next_occurrence(rule, anchor, recurrence_end_date),
+                created_at=created_at,
+                assignees=assignees,
             )
 
             session.add(task)
-            await session.flush()  # Get task ID
-
-            # Add assignees if provided
-            if assignee_discord_ids:
-                for discord_id in assignee_discord_ids:
-                    assignee = await UserService.get_or_create_user(
-                        discord_id=discord_id, username="Unknown"
-                    )
-                    task.assignees.append(assignee)
-
+            await session.flush()
+            await session.refresh(
+                task, ["created_at", "creator", "assignees", "project"]
+            )
             await session.commit()
-            await session.refresh(task)
             return task
 
     @staticmethod
@@ -402,7 +889,10 @@ class TaskService:
         recurrence_frequency: Optional[int] = None,
         recurrence_end_date: Optional[datetime] = None,
     ) -> Optional[Task]:
-        """Update recurring task settings."""
+        """Update recurring task settings and reschedule the next occurrence.
+
+        Raises InvalidRecurrenceError for an unknown pattern.
+        """
         async with get_async_session() as session:
             task = await session.get(Task, task_id)
             if not task:
@@ -420,6 +910,16 @@ class TaskService:
             if recurrence_end_date is not None:
                 task.recurrence_end_date = recurrence_end_date
 
+            # Reschedule from the last instance created
+            task.next_occurrence_at = None
+            if task.is_recurring and task.recurrence_pattern:
+                task.next_occurrence_at = next_occurrence(
+                    _recurrence_rule_of(task),
+                    task.last_recurrence_date or task.due_date or task.created_at,
+                    task.recurrence_end_date,
+                )
+
+            invalidate_on_commit(session, task_cache, [task_id])
             await session.commit()
             await session.refresh(task)
             return task
@@ -429,7 +929,7 @@ class TaskService:
         start_date: datetime, end_date: datetime, include_no_due_date: bool = False
     ) -> List[Task]:
         """Get tasks with due dates in the specified range."""
-        async with get_async_session() as session:
+        async with get_async_session(read_only=True) as session:
             # Base query
             query = select(Task).options(
                 selectinload(Task.creator),
@@ -445,126 +945,191 @@ class TaskService:
                 date_filter = or_(date_filter, Task.due_date.is_(None))
 
             # Only include active tasks
-            status_filter = and_(
-                Task.status != TaskStatus.DONE.value,
-                Task.status != TaskStatus.CANCELLED.value,
-            )
-
-            # Add filters to query
-            query = query.where(and_(date_filter, status_filter))
+            query = query.where(and_(date_filter, OPEN_TASK_FILTER))
 
             # Execute query
             result = await session.execute(query)
             return result.scalars().all()
 
     @staticmethod
-    async def process_recurring_tasks() -> List[Task]:
-        """Process all recurring tasks and create new instances if needed."""
-        now = datetime.now(timezone.utc)
-        new_tasks = []
+    async def get_task_rows_for_user(
+        user_discord_id: int,
+        status: Optional[str] = None,
+        project_id: Optional[int] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Page[TaskRow]:
+        """Get a page of list rows for tasks assigned to a user, newest first."""
+        identity = await UserService.resolve_user(user_discord_id)
+        if identity is None:
+            return Page()
+
+        assigned_task_ids = select(task_assignees.c.task_id).where(
+            task_assignees.c.user_id == identity.id
+        )
+        query = task_rows_query().where(Task.id.in_(assigned_task_ids))
+
+        if status:
+            query = query.where(Task.status == status)
+
+        if project_id:
+            query = query.where(Task.project_id == project_id)
+
+        if cursor:
+            query = query.where(
+                keyset_before(Task.created_at, Task.id, *decode_cursor(cursor))
+            )
 
-        async with get_async_session() as session:
-            # Get all active recurring tasks
-            result = await session.execute(
-                select(Task)
-                .options(
-                    selectinload(Task.creator),
-                    selectinload(Task.assignees),
-                    selectinload(Task.project),
-                )
-                .where(
-                    and_(
-                        Task.is_recurring.is_(True),
-                        or_(
-                            Task.recurrence_end_date.is_(None),
-                            Task.recurrence_end_date >= now,
-                        ),
-                        Task.status != TaskStatus.CANCELLED.value,
-                    )
+        query = query.order_by(desc(Task.created_at), desc(Task.id)).limit(limit + 1)
+
+        async with get_async_session(read_only=True) as session:
+            result = await session.execute(query)
+            return build_page([to_task_row(row) for row in result], limit)
+
+    @staticmethod
+    async def get_task_rows_for_project(
+        project_id: int,
+        status: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Page[TaskRow]:
+        """Get a page of list rows for tasks in a project, newest first."""
+        query = task_rows_query().where(Task.project_id == project_id)
+
+        if status:
+            query = query.where(Task.status == status)
+
+        if cursor:
+            query = query.where(
+                keyset_before(Task.created_at, Task.id, *decode_cursor(cursor))
+            )
+
+        query = query.order_by(desc(Task.created_at), desc(Task.id)).limit(limit + 1)
+
+        async with get_async_session(read_only=True) as session:
+            result = await session.execute(query)
+            return build_page([to_task_row(row) for row in result], limit)
+
+    @staticmethod
+    async def get_task_rows_by_date_range(
+        start_date: datetime, end_date: datetime
+    ) -> List[TaskRow]:
+        """Get list rows for open tasks due in the specified range."""
+        query = (
+            task_rows_query()
+            .where(
+                and_(
+                    Task.due_date >= start_date,
+                    Task.due_date < end_date,
+                    OPEN_TASK_FILTER,
                 )
             )
-            recurring_tasks = result.scalars().all()
+            .order_by(asc(Task.due_date))
+        )
 
-            for task in recurring_tasks:
-                # Check if it's time to create a new task instance
-                if not task.last_recurrence_date:
-                    continue
+        async with get_async_session(read_only=True) as session:
+            result = await session.execute(query)
+            return [to_task_row(row) for row in result]
 
-                # Calculate next occurrence based on pattern
-                next_date = None
+    @staticmethod
+    async def get_overdue_task_rows() -> List[TaskRow]:
+        """Get list rows for all overdue tasks."""
+        now = datetime.now(timezone.utc)
+        query = (
+            task_rows_query()
+            .where(and_(Task.due_date < now, OPEN_TASK_FILTER))
+            .order_by(asc(Task.due_date))
+        )
 
-                if task.recurrence_pattern == "daily":
-                    next_date = task.last_recurrence_date + timedelta(
-                        days=task.recurrence_frequency
-                    )
-                elif task.recurrence_pattern == "weekly":
-                    next_date = task.last_recurrence_date + timedelta(
-                        weeks=task.recurrence_frequency
-                    )
-                elif task.recurrence_pattern == "monthly":
-                    # Add months (approximate)
-                    next_month = (
-                        task.last_recurrence_date.month + task.recurrence_frequency
-                    )
-                    next_year = task.last_recurrence_date.year + (next_month - 1) // 12
-                    next_month = ((next_month - 1) % 12) + 1
-                    next_date = task.last_recurrence_date.replace(
-                        year=next_year, month=next_month
-                    )
+        async with get_async_session(read_only=True) as session:
+            result = await session.execute(query)
+            return [to_task_row(row) for row in result]
 
-                # If it's time to create a new task instance
-                if next_date and next_date <= now:
-                    # Create new task with same properties
-                    # Calculate new due date based on recurrence pattern if original had a due date
-                    new_due_date = None
-                    if task.due_date:
-                        if task.recurrence_pattern == "daily":
-                            new_due_date = task.due_date + timedelta(
-                                days=task.recurrence_frequency
-                            )
-                        elif task.recurrence_pattern == "weekly":
-                            new_due_date = task.due_date + timedelta(
-                                weeks=task.recurrence_frequency
-                            )
-                        elif task.recurrence_pattern == "monthly":
-                            # Add months (approximate)
-                            next_month = task.due_date.month + task.recurrence_frequency
-                            next_year = task.due_date.year + (next_month - 1) // 12
-                            next_month = ((next_month - 1) % 12) + 1
-                            new_due_date = task.due_date.replace(
-                                year=next_year, month=next_month
-                            )
+    @staticmethod
+    async def process_recurring_tasks(now: Optional[datetime] = None) -> List[int]:
+        """Create the instances of recurring tasks that are due.
 
-                    # Create new task instance
-                    new_task = Task(
-                        title=task.title,
-                        description=task.description,
-                        creator_id=task.creator_id,
-                        project_id=task.project_id,
-                        priority=task.priority,
-                        due_date=new_due_date,
-                        tags=task.tags,
-                        custom_fields=task.custom_fields,
-                        estimated_hours=task.estimated_hours,
-                        discord_channel_id=task.discord_channel_id,
+        Only templates whose indexed ``next_occurrence_at`` has passed are
+        loaded. Every occurrence missed since then (e.g. while the bot was
+        down) gets its own instance, up to ``MAX_OCCURRENCES_PER_RUN`` per
+        template and run; instances and their assignees are inserted with
+        multi-row statements. Returns the ids of the new tasks.
+        """
+        now = now or datetime.now(timezone.utc)
+
+        async with get_async_session() as session:
+            templates = (
+                await session.scalars(
+                    select(Task).where(
+                        Task.next_occurrence_at <= now,
+                        Task.status != TaskStatus.CANCELLED.value,
                     )
+                )
+            ).all()
+            if not templates:
+                return []
 
-                    session.add(new_task)
-                    await session.flush()
+            assignments = await session.execute(
+                select(task_assignees.c.task_id, task_assignees.c.user_id).where(
+                    task_assignees.c.task_id.in_([task.id for task in templates])
+                )
+            )
+            assignees_by_template: Dict[int, List[int]] = {}
+            for task_id, user_id in assignments:
+                assignees_by_template.setdefault(task_id, []).append(user_id)
 
-                    # Add same assignees
-                    for assignee in task.assignees:
-                        new_task.assignees.append(assignee)
+            rows: List[Dict[str, Any]] = []
+            assignees: List[List[int]] = []
+            for template in templates:
+                try:
+                    rule = _recurrence_rule_of(template)
+                except InvalidRecurrenceError as e:
+                    logger.warning(f"Stopping recurring task {template.id}: {e}")
+                    template.next_occurrence_at = None
+                    continue
 
-                    # Update last recurrence date on the original task
-                    task.last_recurrence_date = now
+                end = template.recurrence_end_date
+                until = min(now, as_utc(end)) if end else now
+                occurrences = occurrences_between(
+                    rule, template.next_occurrence_at, until
+                )
+                if len(occurrences) == MAX_OCCURRENCES_PER_RUN:
+                    logger.warning(
+                        f"Recurring task {template.id} is more than "
+                        f"{MAX_OCCURRENCES_PER_RUN} occurrences behind; "
+                        f"catching up over several runs"
+                    )
 
-                    new_tasks.append(new_task)
+                for occurrence in occurrences:
+                    rows.append(
+                        {
+                            "title": template.title,
+                            "description": template.description,
+                            "creator_id": template.creator_id,
+                            "project_id": template.project_id,
+                            "priority": template.priority,
+                            # Instances are due on their occurrence
+                            "due_date": occurrence if template.due_date else None,
+                            "tags": template.tags,
+                            "custom_fields": template.custom_fields,
+                            "estimated_hours": template.estimated_hours,
+                            "discord_channel_id": template.discord_channel_id,
+                            "is_recurring": False,
+                        }
+                    )
+                    assignees.append(assignees_by_template.get(template.id, []))
 
-            if new_tasks:
-                await session.commit()
-                # Refresh all new tasks to get complete data
-                for new_task in new_tasks:
-                    await session.refresh(new_task)
+                if occurrences:
+                    template.last_recurrence_date = occurrences[-1]
+                template.next_occurrence_at = next_occurrence(
+                    rule, occurrences[-1] if occurrences else until, end
+                )
 
-            return new_tasks
+            task_ids = await _insert_tasks(session, rows, assignees) if rows else []
+            invalidate_on_commit(session, task_cache, [task.id for task in templates])
+            await session.commit()
+            logger.info(
+                f"Created {len(task_ids)} recurring task instances "
+                f"for {len(templates)} templates"
+            )
+            return task_ids
@@ -1,14 +1,17 @@
 """Service for managing time tracking entries."""
 
 import logging
-from typing import Optional, List
+from typing import Optional
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import desc, select
 from sqlalchemy.orm import selectinload
 
 from models import TimeEntry
+from services.task_service import task_cache
 from utils import get_async_session
+from utils.cache import invalidate_on_commit
+from utils.pagination import Page, build_page, decode_cursor, keyset_before
 
 logger = logging.getLogger(__name__)
 
@@ -36,42 +39,56 @@ class TimeEntryService:
                 end_time=end_time,
             )
             session.add(entry)
+            # Cached tasks carry their time entries
+            invalidate_on_commit(session, task_cache, [task_id])
             await session.commit()
             await session.refresh(entry)
             return entry
 
     @staticmethod
     async def get_time_entries_for_user(
-        user_id: int, limit: Optional[int] = None, offset: Optional[int] = None
-    ) -> List[TimeEntry]:
-        """Fetch time entries for a specific user with optional pagination."""
-        async with get_async_session() as session:
+        user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Page[TimeEntry]:
+        """Fetch time entries for a specific user, newest first, a page at a time."""
+        async with get_async_session(read_only=True) as session:
             query = (
                 select(TimeEntry)
                 .options(selectinload(TimeEntry.task))
                 .where(TimeEntry.user_id == user_id)
+                .order_by(desc(TimeEntry.created_at), desc(TimeEntry.id))
             )
-            if limit is not None:
-                query = query.limit(limit)
-            if offset is not None:
-                query = query.offset(offset)
-            result = await session.execute(query)
-            return result.scalars()
+            if cursor:
+                query = query.where(
+                    keyset_before(
+                        TimeEntry.created_at, TimeEntry.id, *decode_cursor(cursor)
+                    )
+                )
+            if limit is None:
+                result = await session.execute(query)
+                return Page(result.scalars().all())
+            result = await session.execute(query.limit(limit + 1))
+            return build_page(result.scalars().all(), limit)
 
     @staticmethod
     async def get_time_entries_for_task(
-        task_id: int, limit: Optional[int] = None, offset: Optional[int] = None
-    ) -> List[TimeEntry]:
-        """Fetch time entries for a specific task with optional pagination."""
-        async with get_async_session() as session:
+        task_id: int, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Page[TimeEntry]:
+        """Fetch time entries for a specific task, newest first, a page at a time."""
+        async with get_async_session(read_only=True) as session:
             query = (
                 select(TimeEntry)
                 .options(selectinload(TimeEntry.user))
                 .where(TimeEntry.task_id == task_id)
+                .order_by(desc(TimeEntry.created_at), desc(TimeEntry.id))
             )
-            if limit is not None:
-                query = query.limit(limit)
-            if offset is not None:
-                query = query.offset(offset)
-            result = await session.execute(query)
-            return result.scalars()
+            if cursor:
+                query = query.where(
+                    keyset_before(
+                        TimeEntry.created_at, TimeEntry.id, *decode_cursor(cursor)
+                    )
+                )
+            if limit is None:
+                result = await session.execute(query)
+                return Page(result.scalars().all())
+            result = await session.execute(query.limit(limit + 1))
+            return build_page(result.scalars().all(), limit)
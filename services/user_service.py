@@ -1,17 +1,75 @@
 """User service for managing Discord users."""
 
 import logging
-from typing import Optional, List
+from dataclasses import dataclass
+from typing import Dict, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import event, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, selectinload
 
+from config.settings import settings
 from models import User
 from utils import get_async_session
+from utils.cache import LRUCache, invalidate_on_commit
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class UserIdentity:
+    """What most commands need to know about the user invoking them."""
+
+    id: int
+    discord_id: int
+    timezone: str
+    is_active: bool
+
+
+# Discord ID -> identity of users seen recently (see UserService.resolve_user)
+identity_cache: LRUCache[int, UserIdentity] = LRUCache(
+    settings.user_cache_size, settings.user_cache_ttl
+)
+
+
+def _remember(session: AsyncSession, users: List[User]) -> None:
+    """Cache the identities of users once they are committed.
+
+    Inside a caller's unit of work new users may still be rolled back,
+    so their identities wait for the outer commit. Rows read from a
+    replica may predate a commit and are not cached.
+    """
+    if session.info.get("read_only"):
+        return
+    identities = [_identity_of(user) for user in users]
+    if session.info.get("scope_depth", 1) > 1:
+        session.info.setdefault("pending_identities", []).extend(identities)
+        return
+    for identity in identities:
+        identity_cache.set(identity.discord_id, identity)
+
+
+@event.listens_for(Session, "after_commit")
+def _cache_pending_identities(session: Session) -> None:
+    for identity in session.info.pop("pending_identities", ()):
+        identity_cache.set(identity.discord_id, identity)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_identities(session: Session) -> None:
+    session.info.pop("pending_identities", None)
+
+
+def _identity_of(user: User) -> UserIdentity:
+    return UserIdentity(
+        id=user.id,
+        discord_id=user.discord_id,
+        timezone=user.timezone or settings.default_timezone,
+        is_active=user.is_active is not False,
+    )
+
+
 class UserService:
     """Service for managing users."""
     
@@ -49,21 +107,107 @@ class UserService:
             
             await session.commit()
             await session.refresh(user)
+            _remember(session, [user])
             return user
     
+    @staticmethod
+    async def bulk_get_or_create(discord_ids: List[int]) -> List[User]:
+        """Get or create users for many Discord IDs in a single statement.
+
+        Missing users are created with the placeholder username "Unknown";
+        existing users are returned unchanged. Users come back in the order
+        of ``discord_ids`` with duplicates removed.
+        """
+        unique_ids = list(dict.fromkeys(discord_ids))
+        if not unique_ids:
+            return []
+
+        async with get_async_session() as session:
+            if session.bind.dialect.name == "postgresql":
+                insert = postgresql_insert
+            else:
+                insert = sqlite_insert
+
+            # Sorted so concurrent upserts lock rows in the same order
+            stmt = insert(User).values(
+                [
+                    {"discord_id": discord_id, "username": "Unknown"}
+                    for discord_id in sorted(unique_ids)
+                ]
+            )
+            # A no-op update makes RETURNING include rows that already existed
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[User.discord_id],
+                set_={"discord_id": stmt.excluded.discord_id},
+            ).returning(User)
+
+            result = await session.scalars(
+                stmt, execution_options={"populate_existing": True}
+            )
+            users = {user.discord_id: user for user in result}
+            await session.commit()
+            _remember(session, list(users.values()))
+            return [users[discord_id] for discord_id in unique_ids]
+
+    @staticmethod
+    async def resolve_user(discord_id: int) -> Optional[UserIdentity]:
+        """Identity of an existing user, usually without a query.
+
+        Misses are read from the primary so the result can be cached.
+        """
+        identity = identity_cache.get(discord_id)
+        if identity is not None:
+            return identity
+
+        async with get_async_session() as session:
+            result = await session.execute(
+                select(User).where(User.discord_id == discord_id)
+            )
+            user = result.scalar_one_or_none()
+            if user is None:
+                return None
+            _remember(session, [user])
+            return _identity_of(user)
+
+    @staticmethod
+    async def resolve_user_ids(discord_ids: List[int]) -> List[int]:
+        """Internal IDs for Discord IDs, creating missing users.
+
+        Like :meth:`bulk_get_or_create` (order kept, duplicates removed)
+        but answered from the identity cache where possible; only unknown
+        users cost a statement.
+        """
+        unique_ids = list(dict.fromkeys(discord_ids))
+        user_ids: Dict[int, int] = {}
+        for discord_id in unique_ids:
+            identity = identity_cache.get(discord_id)
+            if identity is not None:
+                user_ids[discord_id] = identity.id
+
+        missing = [
+            discord_id for discord_id in unique_ids if discord_id not in user_ids
+        ]
+        if missing:
+            for user in await UserService.bulk_get_or_create(missing):
+                user_ids[user.discord_id] = user.id
+        return [user_ids[discord_id] for discord_id in unique_ids]
+
     @staticmethod
     async def get_user_by_discord_id(discord_id: int) -> Optional[User]:
         """Get user by Discord ID."""
-        async with get_async_session() as session:
+        async with get_async_session(read_only=True) as session:
             result = await session.execute(
                 select(User).where(User.discord_id == discord_id)
             )
-            return result.scalar_one_or_none()
+            user = result.scalar_one_or_none()
+            if user:
+                _remember(session, [user])
+            return user
     
     @staticmethod
     async def get_user_by_id(user_id: int) -> Optional[User]:
         """Get user by internal ID."""
-        async with get_async_session() as session:
+        async with get_async_session(read_only=True) as session:
             result = await session.execute(
                 select(User).where(User.id == user_id)
             )
@@ -72,7 +216,7 @@ class UserService:
     @staticmethod
     async def search_users(query: str) -> List[User]:
         """Search users by username or display name."""
-        async with get_async_session() as session:
+        async with get_async_session(read_only=True) as session:
             result = await session.execute(
                 select(User).where(
                     (User.username.ilike(f"%{query}%")) |
@@ -84,7 +228,7 @@ class UserService:
     @staticmethod
     async def get_all_users() -> List[User]:
         """Get all active users."""
-        async with get_async_session() as session:
+        async with get_async_session(read_only=True) as session:
             result = await session.execute(
                 select(User).where(User.is_active == True)
             )
@@ -101,6 +245,7 @@ class UserService:
             
             if user:
                 user.timezone = timezone
+                invalidate_on_commit(session, identity_cache, [user.discord_id])
                 await session.commit()
                 return True
             return False
@@ -116,6 +261,7 @@ class UserService:
             
             if user:
                 user.is_active = False
+                invalidate_on_commit(session, identity_cache, [user.discord_id])
                 await session.commit()
                 return True
             return False
\ No newline at end of file
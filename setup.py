@@ -19,6 +19,7 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
+            "aiosqlite>=0.19.0",
             "black>=23.7.0",
             "isort>=5.12.0",
             "flake8>=6.0.0",
@@ -1,11 +1,28 @@
 """Test configuration and fixtures."""
 
+import os
 import pytest
+import pytest_asyncio
 import asyncio
 from unittest.mock import AsyncMock
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from utils.database import AsyncSessionLocal
+# Tests run against an in-memory SQLite database unless configured otherwise.
+# Settings are read when the modules below are imported, hence the late imports.
+os.environ.setdefault("DISCORD_BOT_TOKEN", "test-token")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+import utils.database  # noqa: E402
+from models import Base, Project  # noqa: E402
+from services.project_service import channel_project_cache  # noqa: E402
+from services.task_service import task_cache  # noqa: E402
+from services.user_service import identity_cache  # noqa: E402
+from utils.database import (  # noqa: E402
+    AsyncSessionLocal,
+    UnitOfWorkSession,
+    async_engine,
+)
+from utils.embed_cache import task_embed_cache  # noqa: E402
 
 
 @pytest.fixture(scope="session")
@@ -25,6 +42,40 @@ async def db_session():
     yield mock_session
 
 
+@pytest_asyncio.fixture
+async def database():
+    """Create all tables in the test database and drop them afterwards."""
+    # Cached rows would come from the previous test's database
+    identity_cache.clear()
+    task_cache.clear()
+    channel_project_cache.clear()
+    task_embed_cache.clear()
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_engine
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await async_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def read_replica(database, tmp_path, monkeypatch):
+    """Configure a second SQLite file as read replica holding one project."""
+    engine = utils.database._create_async_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(Project.__table__.insert().values(name="Replica"))
+
+    monkeypatch.setattr(utils.database, "read_engine", engine)
+    monkeypatch.setattr(
+        utils.database,
+        "AsyncReadSessionLocal",
+        async_sessionmaker(engine, class_=UnitOfWorkSession, expire_on_commit=False),
+    )
+    yield engine
+    await engine.dispose()
+
+
 @pytest.fixture
 def mock_discord_user():
     """Mock Discord user for testing."""
@@ -0,0 +1,38 @@
+"""Smoke tests for the benchmark scripts."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+
+
+class TestBenchScripts:
+    """Test cases that run every benchmark with a tiny workload."""
+
+    @pytest.mark.parametrize(
+        "script, args",
+        [
+            ("bench_search.py", ["--tasks", "50", "--repeat", "1"]),
+            ("bench_sqlite_profile.py", ["--seconds", "0.2", "--readers", "2"]),
+            ("bench_task_embeds.py", ["--tasks", "5", "--repeat", "1"]),
+            ("bench_task_queries.py", ["--calls", "5"]),
+            ("bench_task_rows.py", ["--tasks", "20", "--repeat", "1"]),
+        ],
+    )
+    def test_script_runs(self, script, args):
+        """The script finishes and prints its report."""
+        env = dict(os.environ, DATABASE_URL="sqlite:///:memory:")
+        result = subprocess.run(
+            [sys.executable, str(SCRIPTS / script), *args],
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=120,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip()
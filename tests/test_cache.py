@@ -0,0 +1,56 @@
+"""Tests for the in-process LRU cache."""
+
+import pytest
+
+from utils import cache as cache_module
+from utils.cache import LRUCache
+
+
+class TestLRUCache:
+    """Test cases for LRUCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Reading an entry keeps it; the oldest unused one is evicted."""
+        cache = LRUCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert cache.stats() == {
+            "size": 2,
+            "maxsize": 2,
+            "hits": 3,
+            "misses": 1,
+            "evictions": 1,
+            "hit_rate": 0.75,
+        }
+
+    def test_entries_expire(self, monkeypatch):
+        """Entries older than the TTL count as misses and are dropped."""
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = LRUCache(maxsize=10, ttl=5)
+        cache.set("a", 1)
+
+        now[0] += 4
+        assert cache.get("a") == 1
+        now[0] += 1
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_pop_and_clear(self):
+        """Entries can be removed one by one or all at once."""
+        cache = LRUCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        cache.clear()
+        assert len(cache) == 0
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0, ttl=60)
@@ -0,0 +1,180 @@
+"""Tests for custom field definitions and filters."""
+
+import asyncio
+import contextvars
+from datetime import date
+
+import pytest
+
+from services.custom_field_service import (
+    CustomFieldError,
+    CustomFieldService,
+    FieldFilter,
+    schema_cache,
+)
+from services.project_service import ProjectService
+from services.task_service import TaskService
+from utils.query_log import track_interaction
+
+
+@pytest.fixture(autouse=True)
+def fresh_schemas():
+    """Project ids repeat across test databases, so start with no schemas."""
+    CustomFieldService.invalidate_schema()
+    yield
+    CustomFieldService.invalidate_schema()
+
+
+async def _project_with_fields():
+    project = await ProjectService.create_project(name="CRM")
+    await CustomFieldService.create_field(project.id, "Customer", "text")
+    await CustomFieldService.create_field(project.id, "Points", "number")
+    await CustomFieldService.create_field(project.id, "Launch", "date")
+    await CustomFieldService.create_field(
+        project.id, "Stage", "select", options=["lead", "won"]
+    )
+    await CustomFieldService.create_field(
+        project.id, "Teams", "multi_select", options=["web", "ios", "ops"]
+    )
+    return project
+
+
+class TestCustomFieldService:
+    """Test cases for CustomFieldService."""
+
+    @pytest.mark.asyncio
+    async def test_schema_is_cached_until_changed(self, database):
+        """The schema is read once and invalidated by field changes."""
+        project = await _project_with_fields()
+
+        with track_interaction("schema") as stats:
+            first = await CustomFieldService.get_schema(project.id)
+            second = await CustomFieldService.get_schema(project.id)
+        assert stats.statement_count == 1
+        assert first is second
+        assert first["Teams"].options == ("web", "ios", "ops")
+
+        assert await CustomFieldService.delete_field(project.id, "Teams")
+        assert "Teams" not in await CustomFieldService.get_schema(project.id)
+
+    @pytest.mark.asyncio
+    async def test_schema_is_read_from_primary(self, read_replica):
+        """A replica that lags behind never fills the schema cache."""
+        project = await ProjectService.create_project(name="CRM")
+        await CustomFieldService.create_field(project.id, "Customer", "text")
+
+        # A request that has not written itself, whose reads use the replica
+        schema = await asyncio.create_task(
+            CustomFieldService.get_schema(project.id), context=contextvars.Context()
+        )
+
+        assert list(schema) == ["Customer"]
+        assert schema_cache.get(project.id) is schema
+
+    @pytest.mark.asyncio
+    async def test_invalid_definitions(self, database):
+        """Unknown types, option-less selects and duplicates are rejected."""
+        project = await _project_with_fields()
+
+        with pytest.raises(CustomFieldError):
+            await CustomFieldService.create_field(project.id, "Size", "colour")
+        with pytest.raises(CustomFieldError):
+            await CustomFieldService.create_field(project.id, "Size", "select")
+        with pytest.raises(CustomFieldError):
+            await CustomFieldService.create_field(project.id, "Points", "number")
+
+
+class TestFilterTasks:
+    """Test cases for TaskService.filter_tasks."""
+
+    @pytest.mark.asyncio
+    async def test_typed_filters(self, database):
+        """Each field type filters through task_field_values."""
+        project = await _project_with_fields()
+        await TaskService.create_tasks_bulk(
+            [
+                {
+                    "title": "Acme",
+                    "custom_fields": {
+                        "Customer": "Acme Corp",
+                        "Points": 8,
+                        "Launch": "2026-03-01",
+                        "Stage": "won",
+                        "Teams": ["web", "ios"],
+                    },
+                },
+                {
+                    "title": "Globex",
+                    "custom_fields": {
+                        "Customer": "Globex",
+                        "Points": 3.5,
+                        "Launch": "2026-03-15T09:30:00",
+                        "Stage": "lead",
+                        "Teams": ["web"],
+                    },
+                },
+                {"title": "Blank"},
+            ],
+            creator_discord_id=1,
+            project_id=project.id,
+        )
+
+        async def titles(*filters):
+            tasks = await TaskService.filter_tasks(project.id, list(filters))
+            return sorted(task.title for task in tasks)
+
+        assert await titles(FieldFilter("Customer", "contains", "CORP")) == ["Acme"]
+        assert await titles(FieldFilter("Customer", "equals", "Globex")) == ["Globex"]
+        assert await titles(FieldFilter("Points", "range", (3, 5))) == ["Globex"]
+        assert await titles(FieldFilter("Points", "equals", 8)) == ["Acme"]
+        assert await titles(FieldFilter("Launch", "equals", date(2026, 3, 15))) == [
+            "Globex"
+        ]
+        assert await titles(FieldFilter("Launch", "range", (None, "2026-03-15"))) == [
+            "Acme",
+            "Globex",
+        ]
+        assert await titles(FieldFilter("Stage", "equals", "won")) == ["Acme"]
+        assert await titles(FieldFilter("Teams", "contains", ["web"])) == [
+            "Acme",
+            "Globex",
+        ]
+        assert await titles(
+            FieldFilter("Teams", "contains", ["ios", "web"]),
+            FieldFilter("Points", "range", (5, None)),
+        ) == ["Acme"]
+
+    @pytest.mark.asyncio
+    async def test_values_follow_task_changes(self, database):
+        """Updating or deleting a task updates its indexed values."""
+        project = await _project_with_fields()
+        task = await TaskService.create_task(
+            title="Acme",
+            creator_discord_id=1,
+            project_id=project.id,
+            custom_fields={"Stage": "lead"},
+        )
+        won = [FieldFilter("Stage", "equals", "won")]
+
+        assert await TaskService.filter_tasks(project.id, won) == []
+        await TaskService.update_task(task.id, custom_fields={"Stage": "won"})
+        assert [t.id for t in await TaskService.filter_tasks(project.id, won)] == [
+            task.id
+        ]
+        await TaskService.delete_task(task.id)
+        assert await TaskService.filter_tasks(project.id, won) == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_filters(self, database):
+        """Filters are validated against the project's schema."""
+        project = await _project_with_fields()
+
+        for field_filter in (
+            FieldFilter("Missing", "equals", 1),
+            FieldFilter("Stage", "range", ("a", "b")),
+            FieldFilter("Stage", "equals", "lost"),
+            FieldFilter("Points", "range", (None, None)),
+            FieldFilter("Launch", "equals", "soon"),
+        ):
+            with pytest.raises(CustomFieldError):
+                await TaskService.filter_tasks(project.id, [field_filter])
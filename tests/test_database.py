@@ -0,0 +1,176 @@
+"""Tests for database session management."""
+
+import asyncio
+import contextvars
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, func, select, text
+
+import utils.database
+from config.settings import settings
+from models import Project, User
+from services.project_service import ProjectService
+from services.task_service import TaskService
+from utils.database import (
+    async_engine,
+    get_async_session,
+    unit_of_work,
+    use_primary,
+)
+
+
+class _EngineCounter:
+    """Count connection checkouts and commits on the async engine."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.commits = 0
+
+    def _on_checkout(self, *args):
+        self.checkouts += 1
+
+    def _on_commit(self, *args):
+        self.commits += 1
+
+    def __enter__(self):
+        event.listen(async_engine.sync_engine, "checkout", self._on_checkout)
+        event.listen(async_engine.sync_engine, "commit", self._on_commit)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(async_engine.sync_engine, "checkout", self._on_checkout)
+        event.remove(async_engine.sync_engine, "commit", self._on_commit)
+
+
+class TestUnitOfWork:
+    """Test cases for session propagation across services."""
+
+    @pytest.mark.asyncio
+    async def test_nested_sessions_are_shared(self, database):
+        """Nested scopes join the session of the outermost scope."""
+        async with get_async_session() as outer:
+            async with get_async_session() as inner:
+                assert inner is outer
+                assert outer.scope_depth == 2
+            assert outer.scope_depth == 1
+
+        async with get_async_session() as fresh:
+            assert fresh is not outer
+
+    @pytest.mark.asyncio
+    async def test_create_task_uses_one_transaction(self, database):
+        """Resolving assignees does not open extra connections or commits."""
+        with _EngineCounter() as counter:
+            task = await TaskService.create_task(
+                title="Ship it",
+                creator_discord_id=1,
+                assignee_discord_ids=[2, 3, 4],
+            )
+
+        assert counter.checkouts == 1
+        assert counter.commits == 1
+        assert sorted(u.discord_id for u in task.assignees) == [2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_unit_of_work_commits_once(self, database):
+        """Service calls inside a unit of work commit together at the end."""
+        with _EngineCounter() as counter:
+            async with unit_of_work():
+                project = await ProjectService.create_project(name="Launch")
+                await ProjectService.add_member_to_project(project.id, 42)
+
+        assert counter.commits == 1
+        assert [member.discord_id for member in project.members] == [42]
+
+    @pytest.mark.asyncio
+    async def test_unit_of_work_rolls_back_on_error(self, database):
+        """An exception discards everything written in the unit of work."""
+        with pytest.raises(RuntimeError):
+            async with unit_of_work():
+                await ProjectService.create_project(name="Doomed")
+                raise RuntimeError("boom")
+
+        async with get_async_session() as session:
+            projects = await session.scalar(select(func.count(Project.id)))
+            users = await session.scalar(select(func.count(User.id)))
+
+        assert projects == 0
+        assert users == 0
+
+
+async def _project_names():
+    return [project.name for project in await ProjectService.get_all_projects()]
+
+
+class TestReadReplica:
+    """Test cases for read replica routing."""
+
+    @pytest.mark.asyncio
+    async def test_reads_use_replica(self, read_replica):
+        """Read-only service methods are served by the replica."""
+        assert await _project_names() == ["Replica"]
+
+    @pytest.mark.asyncio
+    async def test_reads_after_write_use_primary(self, read_replica):
+        """A task that has written reads its own writes from the primary."""
+        await ProjectService.create_project(name="Primary")
+
+        assert await _project_names() == ["Primary"]
+
+        # Other requests are not pinned and keep using the replica
+        other_request = asyncio.create_task(
+            _project_names(), context=contextvars.Context()
+        )
+        assert await other_request == ["Replica"]
+
+    @pytest.mark.asyncio
+    async def test_pin_expires(self, read_replica, monkeypatch):
+        """Long-lived tasks return to the replica once the pin window passes."""
+        now = [100.0]
+        monkeypatch.setattr(
+            utils.database, "time", SimpleNamespace(monotonic=lambda: now[0])
+        )
+        await ProjectService.create_project(name="Primary")
+        assert await _project_names() == ["Primary"]
+
+        now[0] += settings.database_read_your_writes_seconds + 1
+        assert await _project_names() == ["Replica"]
+
+    @pytest.mark.asyncio
+    async def test_use_primary(self, read_replica):
+        """Reads can be pinned to the primary explicitly."""
+        async with use_primary():
+            assert await _project_names() == []
+        assert await _project_names() == ["Replica"]
+
+    @pytest.mark.asyncio
+    async def test_writes_never_join_replica_session(self, read_replica):
+        """A write nested in a read-only scope gets a primary session."""
+        async with get_async_session(read_only=True) as read_session:
+            async with get_async_session() as write_session:
+                assert write_session is not read_session
+                assert not write_session.read_only
+            assert read_session.read_only
+
+
+class TestSQLiteProfile:
+    """Test cases for the SQLite pragma profile."""
+
+    @pytest.mark.asyncio
+    async def test_file_database_uses_production_pragmas(self, tmp_path):
+        """File databases run in WAL mode with the tuned pragmas."""
+        engine = utils.database._create_async_engine(
+            f"sqlite:///{tmp_path / 'profile.db'}"
+        )
+        try:
+            async with engine.connect() as conn:
+                journal_mode = await conn.scalar(text("PRAGMA journal_mode"))
+                synchronous = await conn.scalar(text("PRAGMA synchronous"))
+                busy_timeout = await conn.scalar(text("PRAGMA busy_timeout"))
+        finally:
+            await engine.dispose()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert busy_timeout == 5000
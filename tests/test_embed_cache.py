@@ -0,0 +1,83 @@
+"""Tests for the rendered task embed cache."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from bot.cogs.tasks import create_task_embed
+from models import Project, Task, User
+from utils.embed_cache import task_embed_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_embed_cache():
+    """Start every test without cached embeds."""
+    task_embed_cache.clear()
+
+
+def make_task(**overrides):
+    """A detached task with a creator, an assignee and a project."""
+    values = dict(
+        id=1,
+        title="Write docs",
+        description="For the release",
+        status="todo",
+        priority="high",
+        version=1,
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        creator=User(discord_id=100, username="alice"),
+        assignees=[User(discord_id=200, username="bob")],
+        project=Project(name="Docs"),
+    )
+    values.update(overrides)
+    return Task(**values)
+
+
+class TestTaskEmbedCache:
+    """Test cases for cached task embeds."""
+
+    def test_repeated_renders_reuse_payload(self):
+        """A task is formatted once; later renders rebuild the cached payload."""
+        task = make_task()
+
+        first = create_task_embed(task)
+        second = create_task_embed(task)
+
+        assert first is not second
+        assert first.to_dict() == second.to_dict()
+        assert second.footer.text == "Task ID: 1"
+        assert task_embed_cache.stats()["misses"] == 1
+        assert task_embed_cache.stats()["hits"] == 1
+
+    def test_changes_render_again(self):
+        """Updates, reassignments and project renames are never served stale."""
+        task = make_task()
+        assert create_task_embed(task).title == "📋 Write docs"
+
+        task.title, task.version = "Write more docs", 2
+        assert create_task_embed(task).title == "📋 Write more docs"
+
+        task.assignees = [User(discord_id=300, username="carol")]
+        assert "<@300>" in create_task_embed(task).fields[3].value
+
+        task.project.name = "Handbook"
+        assert create_task_embed(task).fields[2].value == "Handbook"
+
+    def test_callers_cannot_change_cached_payload(self):
+        """Fields added to a returned embed are not part of the next one."""
+        task = make_task()
+
+        create_task_embed(task).add_field(name="Extra", value="x")
+        embed = create_task_embed(task)
+        embed.set_field_at(0, name="Changed", value="y")
+
+        assert [field.name for field in create_task_embed(task).fields][:1] == [
+            "Status"
+        ]
+        assert "Extra" not in [field.name for field in embed.fields]
+
+    def test_unsaved_tasks_are_not_cached(self):
+        """Tasks without an id are rendered every time."""
+        create_task_embed(make_task(id=None))
+
+        assert len(task_embed_cache) == 0
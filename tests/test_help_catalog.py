@@ -0,0 +1,62 @@
+"""Tests for the cached /help command catalog."""
+
+import discord
+import pytest
+from discord import app_commands
+
+from bot.main import TaskManagerCommandTree
+
+
+async def noop(interaction: discord.Interaction):
+    """Callback of the test commands."""
+
+
+def add_command(tree, name, description):
+    """Register a global slash command on ``tree``."""
+    tree.add_command(
+        app_commands.Command(name=name, description=description, callback=noop)
+    )
+
+
+@pytest.fixture
+def tree():
+    """An empty command tree of an unconnected client."""
+    client = discord.Client(intents=discord.Intents.none())
+    return TaskManagerCommandTree(client)
+
+
+class TestHelpCatalog:
+    """Test cases for TaskManagerCommandTree.help_embed."""
+
+    def test_catalog_groups_local_commands(self, tree):
+        """Commands are listed by category from the local tree."""
+        add_command(tree, "create-task", "Create a task")
+        add_command(tree, "create-project", "Create a project")
+        add_command(tree, "start-timer", "Start a timer")
+        add_command(tree, "help", "Show help")
+
+        tree.refresh_help_catalog()
+
+        fields = {field.name: field.value for field in tree.help_embed.fields}
+        assert list(fields) == [
+            "Tasks Commands",
+            "Projects Commands",
+            "Time Tracking Commands",
+            "General Commands",
+        ]
+        assert fields["Tasks Commands"] == "• `/create-task` - Create a task"
+
+    @pytest.mark.asyncio
+    async def test_sync_refreshes_catalog(self, tree, monkeypatch):
+        """Commands added later only show up once the tree is synced."""
+
+        async def fake_sync(self, *, guild=None):
+            return []
+
+        monkeypatch.setattr(app_commands.CommandTree, "sync", fake_sync)
+        tree.refresh_help_catalog()
+        add_command(tree, "create-task", "Create a task")
+
+        assert tree.help_embed.fields == []
+        await tree.sync()
+        assert [field.name for field in tree.help_embed.fields] == ["Tasks Commands"]
@@ -0,0 +1,147 @@
+"""Tests for keyset pagination."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.cogs.projects import ProjectView
+from bot.cogs.tasks import TasksCog
+from services.project_service import ProjectService
+from services.task_service import TaskService
+from services.time_entry_service import TimeEntryService
+from utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def _interaction(user_discord_id):
+    """Interaction mock that records what the command sends."""
+    interaction = MagicMock()
+    interaction.user.id = user_discord_id
+    interaction.response.send_message = AsyncMock()
+    return interaction
+
+
+async def _collect_pages(fetch_page):
+    """Follow next cursors until the last page, returning every page."""
+    pages = [await fetch_page(None)]
+    while pages[-1].next_cursor:
+        pages.append(await fetch_page(pages[-1].next_cursor))
+    return pages
+
+
+class TestCursor:
+    """Test cases for cursor encoding."""
+
+    def test_round_trip(self):
+        """A cursor decodes to the sort key it was built from."""
+        created_at = datetime(2026, 1, 2, 3, 4, 5, 6)
+
+        assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+    @pytest.mark.parametrize("cursor", ["", "not a cursor", "bm9waXBl"])
+    def test_invalid_cursor(self, cursor):
+        """Tampered cursors raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+
+class TestKeysetPagination:
+    """Test cases for paging through services."""
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_every_task_once(self, database):
+        """Tasks created in the same second are neither skipped nor repeated."""
+        for i in range(25):
+            await TaskService.create_task(
+                title=f"Task {i}", creator_discord_id=1, assignee_discord_ids=[2]
+            )
+
+        pages = await _collect_pages(
+            lambda cursor: TaskService.get_tasks_for_user(2, limit=10, cursor=cursor)
+        )
+        row_pages = await _collect_pages(
+            lambda cursor: TaskService.get_task_rows_for_user(
+                2, limit=10, cursor=cursor
+            )
+        )
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        ids = [task.id for page in pages for task in page]
+        assert ids == sorted(ids, reverse=True) and len(set(ids)) == 25
+        assert [row.id for page in row_pages for row in page] == ids
+
+    @pytest.mark.asyncio
+    async def test_project_and_search_pages(self, database):
+        """Project listings and search results page the same way."""
+        project = await ProjectService.create_project(name="Reports")
+        for i in range(5):
+            await TaskService.create_task(
+                title=f"Report {i}", creator_discord_id=1, project_id=project.id
+            )
+
+        project_pages = await _collect_pages(
+            lambda cursor: TaskService.get_tasks_for_project(
+                project.id, limit=2, cursor=cursor
+            )
+        )
+        search_pages = await _collect_pages(
+            lambda cursor: TaskService.search_tasks("Report", limit=2, cursor=cursor)
+        )
+
+        assert [len(page) for page in project_pages] == [2, 2, 1]
+        assert [len(page) for page in search_pages] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_task_page_views_follow_cursors(self, database, monkeypatch):
+        """The views of /my-tasks and a project's tasks fetch every page."""
+        monkeypatch.setattr("bot.cogs.tasks.TASKS_PER_PAGE", 2)
+        monkeypatch.setattr("bot.cogs.projects.TASKS_PER_PAGE", 2)
+        project = await ProjectService.create_project(name="Paged")
+        for i in range(5):
+            await TaskService.create_task(
+                title=f"Paged {i}",
+                creator_discord_id=1,
+                assignee_discord_ids=[2],
+                project_id=project.id,
+            )
+
+        cog = TasksCog(MagicMock())
+        interaction = _interaction(2)
+        await cog.my_tasks.callback(cog, interaction)
+        user_view = interaction.response.send_message.call_args.kwargs["view"]
+
+        interaction = _interaction(2)
+        project_view = ProjectView(project.id)
+        await project_view.view_tasks.callback(interaction)
+        task_view = interaction.response.send_message.call_args.kwargs["view"]
+
+        for view in (user_view, task_view):
+            pages = await _collect_pages(view.fetch_page)
+            assert [len(page) for page in pages] == [2, 2, 1]
+            assert len({row.id for page in pages for row in page}) == 5
+
+    @pytest.mark.asyncio
+    async def test_time_entries_page_without_offset(self, database):
+        """Time entries page through a cursor instead of OFFSET."""
+        task = await TaskService.create_task(title="Timed", creator_discord_id=1)
+        for hours in range(7):
+            await TimeEntryService.create_time_entry(
+                task_id=task.id, user_id=task.creator_id, duration_hours=hours
+            )
+
+        pages = await _collect_pages(
+            lambda cursor: TimeEntryService.get_time_entries_for_task(
+                task.id, limit=3, cursor=cursor
+            )
+        )
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert [entry.duration_hours for page in pages for entry in page] == [
+            6,
+            5,
+            4,
+            3,
+            2,
+            1,
+            0,
+        ]
@@ -0,0 +1,118 @@
+"""Tests for connection pool metrics."""
+
+import asyncio
+import sqlite3
+
+import aiosqlite
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import QueuePool
+
+from utils.pool_metrics import MeteredAsyncQueuePool, PoolMetrics
+
+
+class TestPoolMetrics:
+    """Test cases for PoolMetrics."""
+
+    def test_wait_histogram_buckets(self):
+        """Waits land in the first bucket whose bound they do not exceed."""
+        metrics = PoolMetrics(buckets_ms=(1, 10, 100))
+
+        for wait_ms in (0.2, 1, 7, 150):
+            metrics.observe_wait(wait_ms)
+
+        assert metrics.histogram() == {
+            "<=1ms": 2,
+            "<=10ms": 1,
+            "<=100ms": 0,
+            ">100ms": 1,
+        }
+        assert metrics.checkouts == 4
+        assert metrics.max_wait_ms == 150
+
+    def test_snapshot_reports_pool_occupancy(self):
+        """Snapshot includes checked-out and overflow counts from the pool."""
+        pool = QueuePool(lambda: sqlite3.connect(":memory:"), pool_size=1)
+        metrics = PoolMetrics()
+        metrics.observe_wait(4)
+        metrics.observe_timeout()
+
+        first = pool.connect()
+        second = pool.connect()
+        stats = metrics.snapshot(pool)
+        first.close()
+        second.close()
+
+        assert stats["size"] == 1
+        assert stats["checkedout"] == 2
+        assert stats["overflow"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["avg_wait_ms"] == 4
+
+    def test_snapshot_without_queue_pool(self):
+        """Pools without sizing information report None for occupancy."""
+        stats = PoolMetrics().snapshot(None)
+
+        assert stats["size"] is None
+        assert stats["checkedout"] is None
+        assert stats["checkouts"] == 0
+
+
+class TestMeteredAsyncQueuePool:
+    """Test cases for MeteredAsyncQueuePool."""
+
+    @staticmethod
+    def _engine(tmp_path, metrics, connect_delay=0.0):
+        async def connect():
+            await asyncio.sleep(connect_delay)
+            return await aiosqlite.connect(str(tmp_path / "pool.db"))
+
+        engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            async_creator=connect,
+            poolclass=MeteredAsyncQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=5,
+        )
+        engine.pool.metrics = metrics
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_connection_setup_is_not_wait(self, tmp_path):
+        """Opening a new connection is not counted as waiting in the queue."""
+        metrics = PoolMetrics()
+        engine = self._engine(tmp_path, metrics, connect_delay=0.2)
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        await engine.dispose()
+
+        assert metrics.checkouts == 2
+        assert metrics.max_wait_ms < 100
+
+    @pytest.mark.asyncio
+    async def test_contention_is_wait(self, tmp_path):
+        """A checkout blocked behind a busy pool records the time it waited."""
+        metrics = PoolMetrics()
+        engine = self._engine(tmp_path, metrics)
+        held = asyncio.Event()
+
+        async def hold():
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                held.set()
+                await asyncio.sleep(0.2)
+
+        holder = asyncio.create_task(hold())
+        await held.wait()
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        await holder
+        await engine.dispose()
+
+        assert metrics.checkouts == 2
+        assert metrics.max_wait_ms >= 150
@@ -1,8 +1,16 @@
+import asyncio
+import contextvars
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from services.project_service import ProjectService
+from services.project_service import (
+    ProjectService,
+    ProjectSummary,
+    channel_project_cache,
+)
 from models import Project, User
+from utils.query_log import track_interaction
 
 
 class TestProjectService:
@@ -34,3 +42,55 @@ class TestProjectService:
             assert fake_user in fake_project.members
             session_mock.commit.assert_awaited_once()
 
+
+class TestChannelProjectCache:
+    """Test cases for ProjectService.get_project_summary_by_channel."""
+
+    @pytest.mark.asyncio
+    async def test_summary_is_cached_without_collections(self, database):
+        """Only id, name and color are read, once per channel."""
+        project = await ProjectService.create_project(
+            name="Web", discord_channel_id=10, color="#ff0000"
+        )
+
+        with track_interaction("create-task") as stats:
+            for _ in range(3):
+                summary = await ProjectService.get_project_summary_by_channel(10)
+            assert await ProjectService.get_project_summary_by_channel(11) is None
+            assert await ProjectService.get_project_summary_by_channel(11) is None
+
+        assert summary == ProjectSummary(project.id, "Web", "#ff0000")
+        assert stats.statement_count == 2
+        assert not any("FROM tasks" in s for s, _ in stats.repeated(minimum=1))
+
+    @pytest.mark.asyncio
+    async def test_project_changes_invalidate(self, database):
+        """Creating, updating and deleting projects refresh the cached channels."""
+        assert await ProjectService.get_project_summary_by_channel(10) is None
+        project = await ProjectService.create_project(name="Web", discord_channel_id=10)
+        summary = await ProjectService.get_project_summary_by_channel(10)
+        assert summary.id == project.id
+
+        await ProjectService.update_project(project.id, name="Site")
+        assert (await ProjectService.get_project_summary_by_channel(10)).name == "Site"
+
+        await ProjectService.update_project(project.id, discord_channel_id=20)
+        assert await ProjectService.get_project_summary_by_channel(10) is None
+        assert (await ProjectService.get_project_summary_by_channel(20)).name == "Site"
+
+        assert await ProjectService.delete_project(project.id)
+        assert channel_project_cache.get(20) is None
+
+    @pytest.mark.asyncio
+    async def test_misses_read_primary(self, read_replica):
+        """A replica that lags behind never fills the cache."""
+        project = await ProjectService.create_project(name="Web", discord_channel_id=10)
+
+        # A request that has not written itself, whose reads use the replica
+        summary = await asyncio.create_task(
+            ProjectService.get_project_summary_by_channel(10),
+            context=contextvars.Context(),
+        )
+
+        assert summary.id == project.id
+        assert channel_project_cache.get(10) == summary
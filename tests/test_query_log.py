@@ -0,0 +1,82 @@
+"""Tests for slow-query logging and per-interaction statement counts."""
+
+import logging
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from config.settings import settings
+from services.task_service import TaskService, task_cache
+from utils.query_log import fingerprint, install_query_logging, track_interaction
+
+
+class TestFingerprint:
+    """Test cases for statement normalization."""
+
+    def test_literals_and_parameters_are_replaced(self):
+        """Statements differing only in values share a fingerprint."""
+        first = fingerprint("SELECT * FROM tasks WHERE id = 1 AND title = 'a'")
+        second = fingerprint("SELECT *  FROM tasks\nWHERE id = 42 AND title = 'it''s'")
+
+        assert first == second == "SELECT * FROM tasks WHERE id = ? AND title = ?"
+
+    def test_value_lists_collapse(self):
+        """IN lists and multi-row VALUES collapse regardless of length."""
+        assert fingerprint("SELECT 1 FROM users WHERE id IN (?, ?, ?)") == fingerprint(
+            "SELECT 1 FROM users WHERE id IN (%(id_1)s)"
+        )
+        assert fingerprint("INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4)") == (
+            "INSERT INTO t (a, b) VALUES (...)"
+        )
+
+
+class TestInteractionTracking:
+    """Test cases for per-interaction statement counts."""
+
+    @pytest.mark.asyncio
+    async def test_statements_are_counted(self, database):
+        """Statements issued inside an interaction are attributed to it."""
+        task = await TaskService.create_task(title="Count me", creator_discord_id=1)
+
+        with track_interaction("active-timers") as stats:
+            for _ in range(3):
+                # Bypass the task cache so every lookup reaches the database
+                task_cache.clear()
+                await TaskService.get_task_by_id(task.id)
+
+        assert stats.statement_count >= 3
+        statement, count = stats.repeated()[0]
+        assert count >= 3
+        assert "FROM tasks" in statement
+
+    @pytest.mark.asyncio
+    async def test_slow_queries_name_the_command(self, database, caplog, monkeypatch):
+        """Slow statements are logged with the originating slash command."""
+        monkeypatch.setattr(settings, "slow_query_threshold_ms", 0.0)
+        monkeypatch.setattr(settings, "interaction_query_warning_count", 1)
+
+        with caplog.at_level(logging.WARNING, logger="utils.query_log"):
+            with track_interaction("my-tasks"):
+                await TaskService.get_overdue_tasks()
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert any(m.startswith("Slow query") and "/my-tasks" in m for m in messages)
+        assert any(m.startswith("/my-tasks issued 1 statements") for m in messages)
+
+
+class TestQueryTiming:
+    """Test cases for statement timing."""
+
+    def test_failed_statement_releases_start_time(self):
+        """A statement that fails does not leave its start time behind."""
+        engine = create_engine("sqlite://")
+        install_query_logging(engine)
+
+        with engine.connect() as conn:
+            for _ in range(3):
+                with pytest.raises(exc.OperationalError):
+                    conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+
+            assert conn.info["query_start_time"] == []
+        engine.dispose()
@@ -0,0 +1,147 @@
+"""EXPLAIN-based checks that hot queries keep using their indexes."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from services.custom_field_service import CustomFieldService, FieldFilter
+from services.project_service import ProjectService
+from services.task_service import TaskService
+from services.time_entry_service import TimeEntryService
+from services.user_service import UserService
+from utils.database import async_engine
+
+NOW = datetime.now(timezone.utc)
+
+
+async def _filter_tasks():
+    """Filter on a custom field that exists, so the filter is compiled."""
+    await CustomFieldService.create_field(1, "Points", "number")
+    try:
+        return await TaskService.filter_tasks(1, [FieldFilter("Points", "equals", 1)])
+    finally:
+        CustomFieldService.invalidate_schema()
+
+
+async def _tasks_for_user():
+    """Look up tasks for a user that exists, so the task query is issued."""
+    await UserService.get_or_create_user(discord_id=1, username="tester")
+    return await TaskService.get_tasks_for_user(1)
+
+
+async def _task_rows_for_user():
+    """List rows of a user that exists, so the task query is issued."""
+    await UserService.get_or_create_user(discord_id=1, username="tester")
+    return await TaskService.get_task_rows_for_user(1)
+
+
+# (service call, FROM clause of the statement to check, expected index)
+HOT_QUERIES = [
+    (lambda: TaskService.get_overdue_tasks(), "FROM tasks", "ix_tasks_open_due_date"),
+    (
+        lambda: TaskService.get_tasks_by_date_range(NOW, NOW + timedelta(days=7)),
+        "FROM tasks",
+        "ix_tasks_open_due_date",
+    ),
+    (
+        lambda: TaskService.get_tasks_for_project(1),
+        "FROM tasks",
+        "ix_tasks_project_id_created_at",
+    ),
+    (
+        lambda: TaskService.get_task_by_discord_message(1),
+        "FROM tasks",
+        "ix_tasks_discord_message_id",
+    ),
+    (
+        _tasks_for_user,
+        "FROM tasks",
+        "ix_task_assignees_user_id",
+    ),
+    (
+        _task_rows_for_user,
+        "FROM tasks",
+        "ix_task_assignees_user_id",
+    ),
+    (
+        lambda: TaskService.get_task_rows_by_date_range(NOW, NOW + timedelta(days=7)),
+        "FROM tasks",
+        "ix_tasks_open_due_date",
+    ),
+    (
+        lambda: TaskService.process_recurring_tasks(),
+        "FROM tasks",
+        "ix_tasks_next_occurrence_at",
+    ),
+    (
+        lambda: TaskService.get_tasks_by_tags(["backend"]),
+        "FROM task_tags",
+        "ix_task_tags_tag",
+    ),
+    (
+        _filter_tasks,
+        "FROM task_field_values",
+        "ix_task_field_values_number",
+    ),
+    (
+        lambda: ProjectService.get_project_by_channel(1),
+        "FROM projects",
+        "ix_projects_discord_channel_id",
+    ),
+    (
+        lambda: ProjectService.get_project_summary_by_channel(1),
+        "FROM projects",
+        "ix_projects_discord_channel_id",
+    ),
+    (
+        lambda: TimeEntryService.get_time_entries_for_task(1),
+        "FROM time_entries",
+        "ix_time_entries_task_id_created_at",
+    ),
+    (
+        lambda: TimeEntryService.get_time_entries_for_user(1),
+        "FROM time_entries",
+        "ix_time_entries_user_id_created_at",
+    ),
+]
+
+
+async def _capture_statement(call, from_clause):
+    """Run a service call and return the first statement with the FROM clause."""
+    statements = []
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _on_execute)
+    try:
+        await call()
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", _on_execute)
+
+    for statement, parameters in statements:
+        if from_clause in statement:
+            return statement, parameters
+    raise AssertionError(f"No statement {from_clause!r} in {statements}")
+
+
+@pytest.mark.skipif(
+    async_engine.dialect.name != "sqlite", reason="query plans checked on SQLite"
+)
+class TestQueryPlans:
+    """Each hot query must be answered through its dedicated index."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("call, from_clause, index_name", HOT_QUERIES)
+    async def test_query_uses_index(self, database, call, from_clause, index_name):
+        """EXPLAIN QUERY PLAN mentions the expected index."""
+        statement, parameters = await _capture_statement(call, from_clause)
+
+        async with async_engine.connect() as conn:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+            plan = "\n".join(row[-1] for row in result)
+
+        assert index_name in plan, f"{index_name} not used:\n{statement}\n{plan}"
@@ -0,0 +1,94 @@
+"""Tests for recurrence rules."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from services.recurrence import (
+    InvalidRecurrenceError,
+    next_occurrence,
+    occurrences_between,
+    recurrence_rule,
+)
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestRecurrenceRule:
+    """Test cases for recurrence_rule."""
+
+    def test_month_end_is_clamped_without_drift(self):
+        """The 31st falls back to shorter months' last day and returns."""
+        rule = recurrence_rule("monthly", 1, _utc(2024, 1, 31, 9))
+
+        assert list(rule[:5]) == [
+            _utc(2024, 1, 31, 9),
+            _utc(2024, 2, 29, 9),
+            _utc(2024, 3, 31, 9),
+            _utc(2024, 4, 30, 9),
+            _utc(2024, 5, 31, 9),
+        ]
+
+    def test_leap_day_yearly(self):
+        """A February 29th anchor recurs on February 28th in common years."""
+        rule = recurrence_rule("yearly", 1, _utc(2024, 2, 29))
+
+        assert list(rule[:3]) == [
+            _utc(2024, 2, 29),
+            _utc(2025, 2, 28),
+            _utc(2026, 2, 28),
+        ]
+
+    def test_frequency_and_rrule(self):
+        """Simple patterns use the frequency; RRULEs their own parts."""
+        every_other_week = recurrence_rule("Weekly", 2, _utc(2026, 1, 1))
+        weekdays = recurrence_rule(
+            "RRULE:FREQ=WEEKLY;BYDAY=MO,WE", 5, _utc(2026, 1, 1, 8)
+        )
+
+        assert every_other_week[1] == _utc(2026, 1, 15)
+        assert list(weekdays[:3]) == [
+            _utc(2026, 1, 5, 8),
+            _utc(2026, 1, 7, 8),
+            _utc(2026, 1, 12, 8),
+        ]
+
+    @pytest.mark.parametrize(
+        "pattern, frequency",
+        [
+            ("fortnightly", 1),
+            ("daily", 0),
+            ("FREQ=SOMETIMES", 1),
+            ("FREQ=MINUTELY", 1),
+        ],
+    )
+    def test_invalid_patterns(self, pattern, frequency):
+        """Unknown patterns and too fine rules are rejected."""
+        with pytest.raises(InvalidRecurrenceError):
+            recurrence_rule(pattern, frequency, _utc(2026, 1, 1))
+
+
+class TestOccurrences:
+    """Test cases for occurrence lookups."""
+
+    def test_occurrences_between_is_inclusive_and_capped(self):
+        """The start counts; at most ``limit`` occurrences come back."""
+        rule = recurrence_rule("daily", 1, _utc(2026, 1, 1))
+
+        assert occurrences_between(rule, _utc(2026, 1, 2), _utc(2026, 1, 4)) == [
+            _utc(2026, 1, 2),
+            _utc(2026, 1, 3),
+            _utc(2026, 1, 4),
+        ]
+        assert (
+            len(occurrences_between(rule, _utc(2026, 1, 1), _utc(2027, 1, 1), 5)) == 5
+        )
+
+    def test_next_occurrence_respects_end(self):
+        """Nothing follows the end date; naive datetimes are read as UTC."""
+        rule = recurrence_rule("daily", 1, datetime(2026, 1, 1))
+
+        assert next_occurrence(rule, _utc(2026, 1, 1)) == _utc(2026, 1, 2)
+        assert next_occurrence(rule, _utc(2026, 1, 1), _utc(2026, 1, 1, 12)) is None
@@ -0,0 +1,170 @@
+"""Tests for saved views."""
+
+import asyncio
+import contextvars
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from services.saved_view_service import (
+    SavedViewError,
+    SavedViewService,
+    ViewSpec,
+    view_results,
+)
+from services.task_service import TaskService
+from utils.query_log import track_interaction
+
+
+@pytest.fixture(autouse=True)
+def fresh_views():
+    """View names repeat across test databases, so start with empty caches."""
+    SavedViewService.invalidate()
+    yield
+    SavedViewService.invalidate()
+
+
+class TestViewSpec:
+    """Test cases for ViewSpec."""
+
+    def test_round_trip_and_validation(self):
+        """Specs survive JSON storage and reject invalid values."""
+        spec = ViewSpec(status="todo", tags=("#Backend", "backend", " "), sort="due")
+
+        assert spec.tags == ("backend",)
+        assert ViewSpec.from_dict(spec.to_dict()) == spec
+        for invalid in ({"status": "open"}, {"sort": "random"}, {"limit": 0}):
+            with pytest.raises(SavedViewError):
+                ViewSpec(**invalid)
+
+
+class TestSavedViewService:
+    """Test cases for SavedViewService."""
+
+    @pytest.mark.asyncio
+    async def test_filters_and_sorts(self, database):
+        """Views combine status, assignee, due window and tags."""
+        now = datetime.now(timezone.utc)
+        await TaskService.create_tasks_bulk(
+            [
+                {
+                    "title": "Soon",
+                    "priority": "low",
+                    "due_date": now + timedelta(days=1),
+                    "tags": ["backend"],
+                    "assignee_discord_ids": [7],
+                },
+                {
+                    "title": "Overdue",
+                    "priority": "urgent",
+                    "due_date": now - timedelta(days=1),
+                    "tags": ["backend"],
+                    "assignee_discord_ids": [7],
+                },
+                {
+                    "title": "Later",
+                    "due_date": now + timedelta(days=30),
+                    "tags": ["backend"],
+                    "assignee_discord_ids": [7],
+                },
+                {"title": "Other", "tags": ["backend"], "assignee_discord_ids": [8]},
+            ],
+            creator_discord_id=1,
+        )
+        await SavedViewService.save_view(
+            "My week",
+            ViewSpec(
+                status="todo",
+                assignee_discord_id=7,
+                due_within_days=7,
+                tags=("Backend",),
+                sort="due",
+            ),
+            creator_discord_id=7,
+        )
+        await SavedViewService.save_view(
+            "Urgent first", ViewSpec(sort="priority"), creator_discord_id=7
+        )
+
+        week = await SavedViewService.run_view("My week")
+        by_priority = await SavedViewService.run_view("Urgent first")
+
+        assert [task.title for task in week] == ["Overdue", "Soon"]
+        assert [task.title for task in by_priority][:2] == ["Overdue", "Later"]
+        assert await SavedViewService.run_view("Missing") is None
+        assert await SavedViewService.get_view_names() == ["My week", "Urgent first"]
+
+    @pytest.mark.asyncio
+    async def test_results_cached_until_tasks_change(self, database):
+        """Repeated runs skip the database; task writes invalidate them."""
+        task = await TaskService.create_task(title="First", creator_discord_id=1)
+        await SavedViewService.save_view(
+            "Todo", ViewSpec(status="todo"), creator_discord_id=1
+        )
+        assert len(await SavedViewService.run_view("Todo")) == 1
+
+        with track_interaction("view") as stats:
+            assert len(await SavedViewService.run_view("Todo")) == 1
+        assert stats.statement_count == 0
+
+        await TaskService.bulk_update([task.id], status="done")
+        assert await SavedViewService.run_view("Todo") == []
+
+        await TaskService.create_task(title="Second", creator_discord_id=1)
+        assert [t.title for t in await SavedViewService.run_view("Todo")] == ["Second"]
+
+    @pytest.mark.asyncio
+    async def test_result_cache_is_bounded(self, database, monkeypatch):
+        """The least recently run view is evicted once the cache is full."""
+        monkeypatch.setattr(view_results, "maxsize", 2)
+        for name in ("A", "B", "C"):
+            await SavedViewService.save_view(name, ViewSpec(), creator_discord_id=1)
+            await SavedViewService.run_view(name)
+
+        assert len(view_results) == 2
+        assert view_results.stats()["evictions"] >= 1
+        assert view_results.get("A") is None
+
+    @pytest.mark.asyncio
+    async def test_assignment_changes_invalidate(self, database):
+        """Writes to task_assignees alone also invalidate cached results."""
+        task = await TaskService.create_task(title="Task", creator_discord_id=1)
+        await SavedViewService.save_view(
+            "Mine", ViewSpec(assignee_discord_id=5), creator_discord_id=5
+        )
+        assert await SavedViewService.run_view("Mine") == []
+
+        await TaskService.bulk_assign([task.id], [5])
+        assert [t.id for t in await SavedViewService.run_view("Mine")] == [task.id]
+
+    @pytest.mark.asyncio
+    async def test_saving_replaces_and_deleting_removes(self, database):
+        """Saving under an existing name replaces the cached definition."""
+        await TaskService.create_task(title="Task", creator_discord_id=1)
+        await SavedViewService.save_view(
+            "Done", ViewSpec(status="done"), creator_discord_id=1
+        )
+        assert await SavedViewService.run_view("Done") == []
+
+        await SavedViewService.save_view(
+            "Done", ViewSpec(status="todo"), creator_discord_id=1
+        )
+        assert len(await SavedViewService.run_view("Done")) == 1
+
+        assert await SavedViewService.delete_view("Done")
+        assert await SavedViewService.run_view("Done") is None
+
+    @pytest.mark.asyncio
+    async def test_views_run_on_primary(self, read_replica):
+        """A replica that lags behind never fills the result cache."""
+        await TaskService.create_task(title="Fresh", creator_discord_id=1)
+        await SavedViewService.save_view(
+            "Todo", ViewSpec(status="todo"), creator_discord_id=1
+        )
+
+        # A request that has not written itself, whose reads use the replica
+        rows = await asyncio.create_task(
+            SavedViewService.run_view("Todo"), context=contextvars.Context()
+        )
+
+        assert [row.title for row in rows] == ["Fresh"]
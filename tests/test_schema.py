@@ -0,0 +1,181 @@
+"""Tests for the startup schema version check."""
+
+import pytest
+import pytest_asyncio
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import event, inspect, text
+
+from models import Base
+from models.search import include_in_autogenerate
+from utils.database import async_engine
+from utils.schema import (
+    BASELINE_REVISION,
+    SchemaVersionError,
+    _alembic_config,
+    ensure_schema,
+    get_database_revision,
+    packaged_head,
+)
+
+
+@pytest_asyncio.fixture
+async def empty_database():
+    """An empty database, wiped again after the test."""
+    yield async_engine
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+
+
+def _downgrade_to(revision):
+    def _run(sync_conn):
+        config = _alembic_config()
+        config.attributes["connection"] = sync_conn
+        command.downgrade(config, revision)
+
+    return _run
+
+
+def _autogenerate_diff(sync_conn):
+    context = MigrationContext.configure(
+        sync_conn, opts={"include_name": include_in_autogenerate}
+    )
+    return compare_metadata(context, Base.metadata)
+
+
+def _index_names(sync_conn, table):
+    return {index["name"] for index in inspect(sync_conn).get_indexes(table)}
+
+
+class TestEnsureSchema:
+    """Test cases for ensure_schema."""
+
+    @pytest.mark.asyncio
+    async def test_check_fails_fast_on_unversioned_database(self, empty_database):
+        """Check mode refuses to start against a database behind the head."""
+        with pytest.raises(SchemaVersionError):
+            await ensure_schema("check")
+
+    @pytest.mark.asyncio
+    async def test_upgrade_creates_empty_database(self, empty_database):
+        """An empty database is created and stamped at the head."""
+        await ensure_schema("upgrade")
+
+        assert await get_database_revision() == packaged_head()
+
+    @pytest.mark.asyncio
+    async def test_up_to_date_database_costs_one_query(self, empty_database):
+        """Startup against a current schema issues a single statement."""
+        await ensure_schema("create")
+        statements = []
+
+        def _on_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", _on_execute)
+        try:
+            await ensure_schema("check")
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", _on_execute)
+
+        assert statements == ["SELECT version_num FROM alembic_version"]
+
+    @pytest.mark.asyncio
+    async def test_upgrade_runs_pending_migrations(self, empty_database):
+        """A database at an older revision is migrated to the head."""
+        await ensure_schema("create")
+        async with async_engine.begin() as conn:
+            await conn.run_sync(_downgrade_to("47a6552f8abd"))
+            assert "ix_tasks_open_due_date" not in await conn.run_sync(
+                _index_names, "tasks"
+            )
+
+        await ensure_schema("upgrade")
+
+        assert await get_database_revision() == packaged_head()
+        async with async_engine.connect() as conn:
+            assert "ix_tasks_open_due_date" in await conn.run_sync(
+                _index_names, "tasks"
+            )
+
+    @pytest.mark.asyncio
+    async def test_autogenerate_keeps_search_index(self, empty_database):
+        """A migrated database autogenerates no changes, search tables included."""
+        await ensure_schema("create")
+
+        async with async_engine.connect() as conn:
+            assert await conn.run_sync(_autogenerate_diff) == []
+
+    @pytest.mark.asyncio
+    async def test_upgrade_stamps_unversioned_baseline(self, empty_database):
+        """Databases built by create_all before revisions existed are adopted."""
+        await ensure_schema("create")
+        async with async_engine.begin() as conn:
+            await conn.run_sync(_downgrade_to(BASELINE_REVISION))
+            await conn.execute(text("DROP TABLE alembic_version"))
+
+        await ensure_schema("upgrade")
+
+        assert await get_database_revision() == packaged_head()
+        async with async_engine.connect() as conn:
+            assert "ix_tasks_open_due_date" in await conn.run_sync(
+                _index_names, "tasks"
+            )
+
+    @pytest.mark.asyncio
+    async def test_upgrade_refuses_unversioned_tables(self, empty_database):
+        """Tables without a revision need a manual stamp first."""
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        with pytest.raises(SchemaVersionError, match="alembic stamp"):
+            await ensure_schema("upgrade")
+
+    @pytest.mark.asyncio
+    async def test_task_tags_backfill(self, empty_database):
+        """Tags of tasks created before task_tags existed are copied over."""
+        await ensure_schema("create")
+        async with async_engine.begin() as conn:
+            await conn.run_sync(_downgrade_to("d2a9e5b37c14"))
+            await conn.execute(
+                text(
+                    "INSERT INTO tasks (title, tags, version) "
+                    'VALUES (\'Old\', \'["#Ops", "ops", "db"]\', 1)'
+                )
+            )
+
+        await ensure_schema("upgrade")
+
+        async with async_engine.connect() as conn:
+            rows = await conn.execute(text("SELECT tag FROM task_tags ORDER BY tag"))
+            assert [tag for (tag,) in rows] == ["db", "ops"]
+
+    @pytest.mark.asyncio
+    async def test_task_field_values_backfill(self, empty_database):
+        """Custom fields of existing tasks are indexed by the migration."""
+        await ensure_schema("create")
+        async with async_engine.begin() as conn:
+            await conn.run_sync(_downgrade_to("e7c3f1a9b250"))
+            await conn.execute(
+                text(
+                    "INSERT INTO tasks (title, custom_fields, version) "
+                    'VALUES (\'Old\', \'{"Points": 5, "Teams": ["web", "ios"]}\', 1)'
+                )
+            )
+
+        await ensure_schema("upgrade")
+
+        async with async_engine.connect() as conn:
+            rows = await conn.execute(
+                text(
+                    "SELECT field_name, value_text, value_number "
+                    "FROM task_field_values ORDER BY field_name, value_text"
+                )
+            )
+            assert [tuple(row) for row in rows] == [
+                ("Points", None, 5.0),
+                ("Teams", "ios", None),
+                ("Teams", "web", None),
+            ]
@@ -0,0 +1,91 @@
+"""Tests for full-text task and project search."""
+
+import pytest
+
+from services.project_service import ProjectService
+from services.search import search_terms
+from services.task_service import TaskService
+
+
+class TestSearchTerms:
+    """Test cases for query parsing."""
+
+    def test_operators_are_dropped(self):
+        """Search syntax in user input cannot break the query."""
+        assert search_terms('Fix "login" -bug* OR NEAR(') == [
+            "fix",
+            "login",
+            "bug",
+            "or",
+            "near",
+        ]
+
+
+class TestTaskSearch:
+    """Test cases for TaskService.search_tasks."""
+
+    @pytest.mark.asyncio
+    async def test_results_are_ranked(self, database):
+        """Title matches rank above description-only matches."""
+        await TaskService.create_task(
+            title="Update docs", creator_discord_id=1, description="deploy notes"
+        )
+        await TaskService.create_task(title="Deploy release", creator_discord_id=1)
+        await TaskService.create_task(title="Unrelated", creator_discord_id=1)
+
+        results = await TaskService.search_tasks("deploy")
+
+        assert [task.title for task in results] == ["Deploy release", "Update docs"]
+
+    @pytest.mark.asyncio
+    async def test_prefixes_match(self, database):
+        """Partial words and plurals find the task by prefix."""
+        await TaskService.create_task(title="Reviewing invoices", creator_discord_id=1)
+
+        assert len(await TaskService.search_tasks("invoice")) == 1
+        assert len(await TaskService.search_tasks("rev inv")) == 1
+        assert len(await TaskService.search_tasks("rev payroll")) == 0
+        assert len(await TaskService.search_tasks("!!!")) == 0
+
+    @pytest.mark.asyncio
+    async def test_index_follows_updates_and_deletes(self, database):
+        """Edits and deletions are reflected in search results."""
+        task = await TaskService.create_task(title="Old name", creator_discord_id=1)
+
+        await TaskService.update_task(task.id, title="Fresh name")
+        assert await TaskService.search_tasks("old") == []
+        assert [t.id for t in await TaskService.search_tasks("fresh")] == [task.id]
+
+        await TaskService.delete_task(task.id)
+        assert await TaskService.search_tasks("fresh") == []
+
+    @pytest.mark.asyncio
+    async def test_ranked_pages(self, database):
+        """Ranked results page through score cursors without repeats."""
+        for i in range(5):
+            await TaskService.create_task(
+                title=f"Sprint {i}", creator_discord_id=1, description="sprint " * i
+            )
+
+        first = await TaskService.search_tasks("sprint", limit=3)
+        second = await TaskService.search_tasks(
+            "sprint", limit=3, cursor=first.next_cursor
+        )
+
+        ids = [task.id for task in first + second]
+        assert len(ids) == len(set(ids)) == 5
+        assert second.next_cursor is None
+
+
+class TestProjectSearch:
+    """Test cases for ProjectService.search_projects."""
+
+    @pytest.mark.asyncio
+    async def test_search_projects(self, database):
+        """Active projects match on name and description."""
+        await ProjectService.create_project(name="Website", description="marketing")
+        await ProjectService.create_project(name="Marketing plan")
+
+        results = await ProjectService.search_projects("marketing")
+
+        assert [project.name for project in results] == ["Marketing plan", "Website"]
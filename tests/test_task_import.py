@@ -0,0 +1,65 @@
+"""Tests for parsing task import files."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from services.task_import import MAX_IMPORT_ROWS, TaskImportError, parse_task_file
+
+
+class TestParseTaskFile:
+    """Test cases for parse_task_file."""
+
+    def test_csv(self):
+        """CSV rows become bulk-create keyword arguments."""
+        data = (
+            "title,priority,due_date,tags,estimated_hours,assignees\n"
+            "Write docs,HIGH,2026-03-01,docs; needs review,1.5,<@12> 34\n"
+            "Plan sprint,,,,,\n"
+        ).encode()
+
+        first, second = parse_task_file("backlog.csv", data)
+
+        assert first == {
+            "title": "Write docs",
+            "description": None,
+            "priority": "high",
+            "due_date": datetime(2026, 3, 1, tzinfo=timezone.utc),
+            "tags": ["docs", "needs review"],
+            "estimated_hours": 1.5,
+            "assignee_discord_ids": [12, 34],
+        }
+        assert second["priority"] == "medium" and second["tags"] == []
+
+    def test_json(self):
+        """JSON imports are a list of objects with the same keys."""
+        data = b'[{"title": "Ship", "tags": ["release"], "assignees": [5]}]'
+
+        (task,) = parse_task_file("backlog.JSON", data)
+
+        assert task["tags"] == ["release"]
+        assert task["assignee_discord_ids"] == [5]
+
+    @pytest.mark.parametrize(
+        "filename, data, message",
+        [
+            ("tasks.txt", b"title\nA\n", "Only .csv and .json"),
+            ("tasks.json", b'{"title": "A"}', "must be a list"),
+            ("tasks.json", b"[", "Invalid JSON"),
+            ("tasks.csv", b"title\nA\n \n", "Row 2: title is required"),
+            ("tasks.csv", b"title,priority\nA,asap\n", "unknown priority"),
+            ("tasks.csv", b"title,due_date\nA,soon\n", "due_date must be"),
+            ("tasks.csv", b"title,assignees\nA,@bob\n", "is not a user ID"),
+        ],
+    )
+    def test_invalid_files(self, filename, data, message):
+        """Bad files are rejected with the offending row."""
+        with pytest.raises(TaskImportError, match=message):
+            parse_task_file(filename, data)
+
+    def test_row_limit(self):
+        """Imports larger than MAX_IMPORT_ROWS are rejected."""
+        data = "title\n" + "Task\n" * (MAX_IMPORT_ROWS + 1)
+
+        with pytest.raises(TaskImportError, match="limited"):
+            parse_task_file("tasks.csv", data.encode())
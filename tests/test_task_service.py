@@ -1,10 +1,20 @@
 """Tests for task service."""
 
+import asyncio
+import contextvars
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
-from services.task_service import TaskService
+from services.project_service import ProjectService
+from services.recurrence import InvalidRecurrenceError
+from services.task_service import TaskConflictError, TaskService, task_cache
+from services.time_entry_service import TimeEntryService
+from services.user_service import UserService
 from models import TaskStatus, TaskPriority
+from utils.database import unit_of_work
+from utils.query_log import track_interaction
 
 
 class TestTaskService:
@@ -48,4 +58,524 @@ class TestTaskService:
         assert TaskPriority.LOW.value == "low"
         assert TaskPriority.MEDIUM.value == "medium"
         assert TaskPriority.HIGH.value == "high"
-        assert TaskPriority.URGENT.value == "urgent"
\ No newline at end of file
+        assert TaskPriority.URGENT.value == "urgent"
+
+
+class TestCachedStatements:
+    """Cached hot-path statements must bind fresh values on every call."""
+
+    @pytest.mark.asyncio
+    async def test_get_task_by_id_binds_each_id(self, database):
+        """Repeated lookups return the task that was asked for."""
+        first = await TaskService.create_task(title="First", creator_discord_id=1)
+        second = await TaskService.create_task(title="Second", creator_discord_id=1)
+
+        assert (await TaskService.get_task_by_id(first.id)).title == "First"
+        assert (await TaskService.get_task_by_id(second.id)).title == "Second"
+        assert await TaskService.get_task_by_id(second.id + 1) is None
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_for_user_optional_filters(self, database):
+        """Optional filters only apply when given, in any call order."""
+        await TaskService.create_task(
+            title="Todo", creator_discord_id=1, assignee_discord_ids=[2]
+        )
+        done = await TaskService.create_task(
+            title="Done", creator_discord_id=1, assignee_discord_ids=[2]
+        )
+        await TaskService.update_task(done.id, status=TaskStatus.DONE.value)
+
+        todo = await TaskService.get_tasks_for_user(2, status=TaskStatus.TODO.value)
+        everything = await TaskService.get_tasks_for_user(2)
+        limited = await TaskService.get_tasks_for_user(2, limit=1)
+
+        assert [task.title for task in todo] == ["Todo"]
+        assert sorted(task.title for task in everything) == ["Done", "Todo"]
+        assert len(limited) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_overdue_tasks_uses_current_time(self, database):
+        """The cutoff is the time of the call, not of the first call."""
+        now = datetime.now(timezone.utc)
+        await TaskService.create_task(
+            title="Soon", creator_discord_id=1, due_date=now + timedelta(seconds=1)
+        )
+        assert await TaskService.get_overdue_tasks() == []
+
+        with patch("services.task_service.datetime") as mock_datetime:
+            mock_datetime.now.return_value = now + timedelta(days=1)
+            overdue = await TaskService.get_overdue_tasks()
+
+        assert [task.title for task in overdue] == ["Soon"]
+
+
+class TestTaskRows:
+    """Test cases for the lightweight list projections."""
+
+    @pytest.mark.asyncio
+    async def test_rows_aggregate_assignees(self, database):
+        """Each task comes back once with all of its assignees."""
+        await TaskService.create_task(
+            title="Pair", creator_discord_id=1, assignee_discord_ids=[2, 3]
+        )
+        await TaskService.create_task(
+            title="Solo", creator_discord_id=1, assignee_discord_ids=[2]
+        )
+
+        rows = await TaskService.get_task_rows_for_user(2)
+
+        assert [row.title for row in rows] == ["Solo", "Pair"]
+        assert sorted(rows[1].assignee_discord_ids) == [2, 3]
+        assert rows[0].assignee_discord_ids == (2,)
+        assert not hasattr(rows[0], "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_date_range_and_overdue_rows(self, database):
+        """Summary rows cover open tasks only, unassigned ones included."""
+        now = datetime.now(timezone.utc)
+        await TaskService.create_task(
+            title="Late", creator_discord_id=1, due_date=now - timedelta(hours=1)
+        )
+        done = await TaskService.create_task(
+            title="Finished", creator_discord_id=1, due_date=now - timedelta(hours=2)
+        )
+        await TaskService.update_task(done.id, status=TaskStatus.DONE.value)
+
+        in_range = await TaskService.get_task_rows_by_date_range(
+            now - timedelta(days=1), now
+        )
+        overdue = await TaskService.get_overdue_task_rows()
+
+        assert [row.title for row in in_range] == ["Late"]
+        assert [row.title for row in overdue] == ["Late"]
+        assert overdue[0].assignee_discord_ids == ()
+
+
+class TestBulkCreate:
+    """Test cases for TaskService.create_tasks_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_creates_tasks_and_assignees(self, database):
+        """Tasks come back in input order with their assignees and defaults."""
+        task_ids = await TaskService.create_tasks_bulk(
+            [
+                {"title": "First", "assignee_discord_ids": [2, 3, 2]},
+                {"title": "Second", "priority": TaskPriority.HIGH.value},
+                {"title": "Third", "tags": ["backlog"], "assignee_discord_ids": [3]},
+            ],
+            creator_discord_id=1,
+            discord_channel_id=99,
+        )
+
+        tasks = [await TaskService.get_task_by_id(task_id) for task_id in task_ids]
+        assert [task.title for task in tasks] == ["First", "Second", "Third"]
+        assert sorted(user.discord_id for user in tasks[0].assignees) == [2, 3]
+        assert tasks[1].assignees == [] and tasks[1].priority == "high"
+        assert tasks[2].tags == ["backlog"]
+        assert {task.status for task in tasks} == {TaskStatus.TODO.value}
+        assert {task.creator.discord_id for task in tasks} == {1}
+        assert {task.discord_channel_id for task in tasks} == {99}
+
+    @pytest.mark.asyncio
+    async def test_statement_count_is_constant(self, database):
+        """Hundreds of tasks cost a handful of statements, not one per task."""
+        tasks = [
+            {"title": f"Item {i}", "assignee_discord_ids": [i % 7 + 2]}
+            for i in range(300)
+        ]
+
+        with track_interaction("import-tasks") as stats:
+            task_ids = await TaskService.create_tasks_bulk(tasks, creator_discord_id=1)
+
+        assert len(set(task_ids)) == 300
+        assert stats.statement_count <= 5
+        assert await TaskService.create_tasks_bulk([], creator_discord_id=1) == []
+
+
+class TestBulkChanges:
+    """Test cases for TaskService.bulk_update and bulk_assign."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_completed_at(self, database):
+        """Completing stamps completed_at once; reopening clears it."""
+        done = await TaskService.create_task(title="Done", creator_discord_id=1)
+        done = await TaskService.update_task(done.id, status=TaskStatus.DONE.value)
+        todo = await TaskService.create_task(title="Todo", creator_discord_id=1)
+        ids = [done.id, todo.id]
+
+        with track_interaction("bulk") as stats:
+            count = await TaskService.bulk_update(ids, status=TaskStatus.DONE.value)
+
+        assert count == 2 and stats.statement_count == 1
+        first, second = [await TaskService.get_task_by_id(i) for i in ids]
+        assert first.completed_at == done.completed_at
+        assert second.completed_at is not None
+
+        await TaskService.bulk_update(ids, priority=TaskPriority.URGENT.value)
+        assert (await TaskService.get_task_by_id(todo.id)).completed_at is not None
+
+        await TaskService.bulk_update(ids, status=TaskStatus.IN_PROGRESS.value)
+        reopened = await TaskService.get_task_by_id(done.id)
+        assert reopened.completed_at is None
+        assert reopened.priority == TaskPriority.URGENT.value
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_rejects_unknown_fields(self, database):
+        """Only task columns other than the primary key can be set."""
+        with pytest.raises(ValueError, match="assignees"):
+            await TaskService.bulk_update([1], assignees=[])
+        with pytest.raises(ValueError, match="id"):
+            await TaskService.bulk_update([1], id=2)
+
+    @pytest.mark.asyncio
+    async def test_bulk_assign(self, database):
+        """Assignees are replaced or added across all tasks at once."""
+        ids = await TaskService.create_tasks_bulk(
+            [
+                {"title": "A", "assignee_discord_ids": [2]},
+                {"title": "B", "assignee_discord_ids": [3]},
+            ],
+            creator_discord_id=1,
+        )
+
+        async def assignees():
+            tasks = [await TaskService.get_task_by_id(i) for i in ids]
+            return [sorted(u.discord_id for u in task.assignees) for task in tasks]
+
+        assert await TaskService.bulk_assign(ids, [3], replace=False) == 1
+        assert await assignees() == [[2, 3], [3]]
+
+        assert await TaskService.bulk_assign(ids + [999], [4, 5]) == 4
+        assert await assignees() == [[4, 5], [4, 5]]
+
+        assert await TaskService.bulk_assign(ids, []) == 0
+        assert await assignees() == [[], []]
+
+
+class TestUserLookupQueries:
+    """Lookups by Discord ID join users instead of fetching the user first."""
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_for_user(self, database):
+        """The task query itself resolves the user; only eager loads follow."""
+        await TaskService.create_task(
+            title="Mine", creator_discord_id=1, assignee_discord_ids=[2]
+        )
+
+        with track_interaction("my-tasks") as stats:
+            tasks = await TaskService.get_tasks_for_user(2)
+        with track_interaction("my-tasks") as unknown:
+            assert await TaskService.get_tasks_for_user(999) == []
+
+        assert [task.title for task in tasks] == ["Mine"]
+        # Tasks, then selectin loads of creator and assignees (no project)
+        assert stats.statement_count == 3
+        assert unknown.statement_count == 1
+
+    @pytest.mark.asyncio
+    async def test_search_tasks_for_user(self, database):
+        """Searching a user's tasks is one statement before eager loads."""
+        await TaskService.create_task(
+            title="Report mine", creator_discord_id=1, assignee_discord_ids=[2]
+        )
+        await TaskService.create_task(title="Report other", creator_discord_id=1)
+
+        with track_interaction("search") as stats:
+            tasks = await TaskService.search_tasks("report", user_discord_id=2)
+        with track_interaction("search") as unknown:
+            assert await TaskService.search_tasks("report", user_discord_id=9) == []
+
+        assert [task.title for task in tasks] == ["Report mine"]
+        assert stats.statement_count == 3
+        assert unknown.statement_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_projects_for_user(self, database):
+        """Projects of a member come from one statement plus eager loads."""
+        project = await ProjectService.create_project(name="Apollo")
+        await ProjectService.add_member_to_project(project.id, 2)
+
+        with track_interaction("projects") as stats:
+            projects = await ProjectService.get_projects_for_user(2)
+        with track_interaction("projects") as unknown:
+            assert await ProjectService.get_projects_for_user(999) == []
+
+        assert [p.name for p in projects] == ["Apollo"]
+        # Projects, then selectin loads of members and tasks
+        assert stats.statement_count == 3
+        assert unknown.statement_count == 1
+
+
+class TestOptimisticLocking:
+    """Test cases for versioned updates."""
+
+    @pytest.mark.asyncio
+    async def test_update_returns_loaded_task(self, database):
+        """One UPDATE ... RETURNING plus eager loads; the version goes up."""
+        task = await TaskService.create_task(
+            title="Draft", creator_discord_id=1, assignee_discord_ids=[2]
+        )
+        assert task.version == 1
+
+        with track_interaction("edit") as stats:
+            updated = await TaskService.update_task(
+                task.id, expected_version=1, title="Final", unknown="ignored"
+            )
+
+        assert updated.title == "Final" and updated.version == 2
+        assert updated.creator.discord_id == 1
+        assert [user.discord_id for user in updated.assignees] == [2]
+        assert stats.statement_count == 3
+
+    @pytest.mark.asyncio
+    async def test_stale_version_conflicts(self, database):
+        """The second of two edits made from the same version is rejected."""
+        task = await TaskService.create_task(title="Shared", creator_discord_id=1)
+
+        await TaskService.update_task(
+            task.id, expected_version=task.version, status=TaskStatus.DONE.value
+        )
+        with pytest.raises(TaskConflictError) as conflict:
+            await TaskService.update_task(
+                task.id, expected_version=task.version, status=TaskStatus.REVIEW.value
+            )
+
+        assert conflict.value.task_id == task.id
+        current = await TaskService.get_task_by_id(task.id)
+        assert current.status == TaskStatus.DONE.value and current.version == 2
+        assert await TaskService.update_task(999, expected_version=1) is None
+
+    @pytest.mark.asyncio
+    async def test_completed_at_kept_on_unrelated_edits(self, database):
+        """Editing other fields of a done task keeps its completion time."""
+        task = await TaskService.create_task(title="Closed", creator_discord_id=1)
+        done = await TaskService.update_task(task.id, status=TaskStatus.DONE.value)
+
+        edited = await TaskService.update_task(task.id, title="Closed (renamed)")
+
+        assert done.completed_at is not None
+        assert edited.completed_at == done.completed_at
+
+    @pytest.mark.asyncio
+    async def test_orm_and_bulk_updates_bump_version(self, database):
+        """Other write paths advance the version too."""
+        task = await TaskService.create_task(title="Repeat", creator_discord_id=1)
+
+        await TaskService.update_recurring_task_settings(task.id, is_recurring=True)
+        await TaskService.bulk_update([task.id], priority=TaskPriority.LOW.value)
+
+        assert (await TaskService.get_task_by_id(task.id)).version == 3
+
+
+class TestRecurringTasks:
+    """Test cases for the recurrence job."""
+
+    @pytest.mark.asyncio
+    async def test_missed_occurrences_are_created(self, database):
+        """Every missed occurrence gets an instance, with month-end dates."""
+        template = await TaskService.create_recurring_task(
+            title="Invoice",
+            creator_discord_id=1,
+            recurrence_pattern="monthly",
+            assignee_discord_ids=[2, 3],
+            due_date=datetime(2026, 1, 31, 9, tzinfo=timezone.utc),
+        )
+        assert template.next_occurrence_at.replace(tzinfo=timezone.utc) == datetime(
+            2026, 2, 28, 9, tzinfo=timezone.utc
+        )
+
+        now = datetime(2026, 5, 1, tzinfo=timezone.utc)
+        with track_interaction("recurrence") as stats:
+            task_ids = await TaskService.process_recurring_tasks(now)
+
+        instances = [await TaskService.get_task_by_id(i) for i in task_ids]
+        assert [task.due_date.day for task in instances] == [28, 31, 30]
+        assert all(not task.is_recurring for task in instances)
+        assert [sorted(u.discord_id for u in task.assignees) for task in instances] == [
+            [2, 3]
+        ] * 3
+        # Templates, assignees, instances, instance assignees, template update
+        assert stats.statement_count == 5
+
+        assert await TaskService.process_recurring_tasks(now) == []
+        template = await TaskService.get_task_by_id(template.id)
+        assert template.next_occurrence_at.day == 31
+
+    @pytest.mark.asyncio
+    async def test_end_date_and_rrule(self, database):
+        """RRULE templates stop creating instances after their end date."""
+        template = await TaskService.create_recurring_task(
+            title="Standup notes",
+            creator_discord_id=1,
+            recurrence_pattern="FREQ=WEEKLY;BYDAY=MO,FR",
+            due_date=datetime(2026, 1, 2, 9, tzinfo=timezone.utc),
+            recurrence_end_date=datetime(2026, 1, 13, tzinfo=timezone.utc),
+        )
+
+        task_ids = await TaskService.process_recurring_tasks(
+            datetime(2026, 2, 1, tzinfo=timezone.utc)
+        )
+
+        instances = [await TaskService.get_task_by_id(i) for i in task_ids]
+        assert [task.due_date.day for task in instances] == [5, 9, 12]
+        assert (
+            await TaskService.get_task_by_id(template.id)
+        ).next_occurrence_at is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_pattern_is_rejected(self, database):
+        """Unknown patterns fail before anything is written."""
+        with pytest.raises(InvalidRecurrenceError):
+            await TaskService.create_recurring_task(
+                title="Never", creator_discord_id=1, recurrence_pattern="sometimes"
+            )
+
+
+class TestTags:
+    """Test cases for tag filters and facets."""
+
+    @pytest.mark.asyncio
+    async def test_tags_are_normalized_and_kept_in_sync(self, database):
+        """Inserts, edits, bulk paths and deletes all update task_tags."""
+        first = await TaskService.create_task(
+            title="API", creator_discord_id=1, tags=["#Backend", " api ", "backend"]
+        )
+        (second,) = await TaskService.create_tasks_bulk(
+            [{"title": "UI", "tags": ["frontend"]}], creator_discord_id=1
+        )
+
+        assert [t.id for t in await TaskService.get_tasks_by_tags(["BACKEND"])] == [
+            first.id
+        ]
+
+        await TaskService.update_task(first.id, tags=["frontend"])
+        await TaskService.bulk_update([second], tags=["frontend", "design"])
+        frontend = await TaskService.get_tasks_by_tags(["#frontend"])
+        assert [task.id for task in frontend] == [second, first.id]
+        assert await TaskService.get_tasks_by_tags(["backend"]) == []
+
+        await TaskService.delete_task(second)
+        assert await TaskService.get_tasks_by_tags(["design"]) == []
+
+    @pytest.mark.asyncio
+    async def test_any_all_and_facets(self, database):
+        """Any/all filters and per-project counts are computed in SQL."""
+        project = await ProjectService.create_project(name="Web")
+        await TaskService.create_tasks_bulk(
+            [
+                {"title": "Both", "tags": ["backend", "urgent"]},
+                {"title": "Backend", "tags": ["backend"]},
+                {"title": "Untagged"},
+            ],
+            creator_discord_id=1,
+            project_id=project.id,
+        )
+        await TaskService.create_task(
+            title="Elsewhere", creator_discord_id=1, tags=["backend"]
+        )
+
+        any_tasks = await TaskService.get_tasks_by_tags(
+            ["backend", "urgent"], project_id=project.id
+        )
+        all_tasks = await TaskService.get_tasks_by_tags(
+            ["backend", "urgent"], match="all"
+        )
+
+        assert [task.title for task in any_tasks] == ["Backend", "Both"]
+        assert [task.title for task in all_tasks] == ["Both"]
+        assert await TaskService.get_tag_counts(project.id) == [
+            ("backend", 2),
+            ("urgent", 1),
+        ]
+        with pytest.raises(ValueError):
+            await TaskService.get_tasks_by_tags(["backend"], match="some")
+
+
+class TestTaskCache:
+    """Test cases for the read-through cache of get_task_by_id."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_are_cached(self, database):
+        """Only the first read of a task reaches the database."""
+        task = await TaskService.create_task(
+            title="Cached", creator_discord_id=1, assignee_discord_ids=[2]
+        )
+        first = await TaskService.get_task_by_id(task.id)
+
+        with track_interaction("active-timers") as stats:
+            for _ in range(3):
+                assert await TaskService.get_task_by_id(task.id) is first
+        assert stats.statement_count == 0
+        assert [user.discord_id for user in first.assignees] == [2]
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate(self, database):
+        """Updates, assignments, time entries and deletes drop the snapshot."""
+        task = await TaskService.create_task(title="Draft", creator_discord_id=1)
+        await TaskService.get_task_by_id(task.id)
+
+        await TaskService.update_task(task.id, title="Final")
+        assert (await TaskService.get_task_by_id(task.id)).title == "Final"
+
+        await TaskService.assign_users_to_task(task.id, [3])
+        cached = await TaskService.get_task_by_id(task.id)
+        assert [user.discord_id for user in cached.assignees] == [3]
+
+        await TaskService.bulk_update([task.id], status="review")
+        assert (await TaskService.get_task_by_id(task.id)).status == "review"
+
+        (user_id,) = await UserService.resolve_user_ids([3])
+        await TimeEntryService.create_time_entry(
+            task_id=task.id, user_id=user_id, duration_hours=2
+        )
+        cached = await TaskService.get_task_by_id(task.id)
+        assert [entry.duration_hours for entry in cached.time_entries] == [2]
+
+        other = await TaskService.create_task(title="Other", creator_discord_id=1)
+        await TaskService.get_task_by_id(other.id)
+        await TaskService.delete_task(other.id)
+        assert await TaskService.get_task_by_id(other.id) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidated_on_outer_commit(self, database):
+        """Inside a unit of work the snapshot is kept until the commit."""
+        task = await TaskService.create_task(title="Draft", creator_discord_id=1)
+        await TaskService.get_task_by_id(task.id)
+
+        with pytest.raises(RuntimeError):
+            async with unit_of_work():
+                await TaskService.update_task(task.id, title="Doomed")
+                raise RuntimeError("boom")
+        assert task_cache.get(task.id).title == "Draft"
+
+        async with unit_of_work():
+            await TaskService.update_task(task.id, title="Final")
+            assert task_cache.get(task.id).title == "Draft"
+        assert task_cache.get(task.id) is None
+
+    @pytest.mark.asyncio
+    async def test_time_entries_invalidate_on_outer_commit(self, database):
+        """Logging time in a unit of work keeps the snapshot until the commit."""
+        task = await TaskService.create_task(title="Timed", creator_discord_id=1)
+        (user_id,) = await UserService.resolve_user_ids([1])
+        await TaskService.get_task_by_id(task.id)
+
+        async with unit_of_work():
+            await TimeEntryService.create_time_entry(
+                task_id=task.id, user_id=user_id, duration_hours=1
+            )
+            assert task_cache.get(task.id).time_entries == []
+        assert task_cache.get(task.id) is None
+
+    @pytest.mark.asyncio
+    async def test_misses_read_primary(self, read_replica):
+        """A replica that lags behind never fills the cache."""
+        task = await TaskService.create_task(title="Fresh", creator_discord_id=1)
+
+        # A request that has not written itself, whose reads use the replica
+        other_request = asyncio.create_task(
+            TaskService.get_task_by_id(task.id), context=contextvars.Context()
+        )
+
+        assert (await other_request).title == "Fresh"
+        assert task_cache.get(task.id).title == "Fresh"
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 
+from services.task_service import task_cache
 from services.time_entry_service import TimeEntryService
 from models import TimeEntry
 
@@ -13,6 +14,7 @@ class TestTimeEntryService:
         session_mock.commit = AsyncMock()
         session_mock.refresh = AsyncMock()
         session_mock.add = MagicMock()
+        session_mock.info = {}
 
         with patch("services.time_entry_service.get_async_session") as session_cm:
             session_cm.return_value.__aenter__.return_value = session_mock
@@ -33,4 +35,5 @@ class TestTimeEntryService:
             session_mock.add.assert_called_once()
             session_mock.commit.assert_awaited_once()
             session_mock.refresh.assert_awaited_once_with(entry)
+            assert session_mock.info["cache_invalidations"] == [(task_cache, 1)]
 
@@ -0,0 +1,193 @@
+"""Tests for user service."""
+
+import asyncio
+import contextvars
+
+import pytest
+from sqlalchemy import event
+
+from models import User
+from services.project_service import ProjectService
+from services.task_service import TaskService
+from services.user_service import UserService, identity_cache
+from utils.database import async_engine, unit_of_work
+
+
+class _StatementCounter:
+    """Count statements sent to the database."""
+
+    def __init__(self):
+        self.statements = []
+
+    def _on_execute(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(
+            async_engine.sync_engine, "before_cursor_execute", self._on_execute
+        )
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(
+            async_engine.sync_engine, "before_cursor_execute", self._on_execute
+        )
+
+
+class TestUserService:
+    """Test cases for UserService."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_get_or_create_single_statement(self, database):
+        """Resolving many users costs one INSERT ... ON CONFLICT."""
+        with _StatementCounter() as counter:
+            users = await UserService.bulk_get_or_create([5, 3, 4, 3, 1, 2])
+
+        assert [user.discord_id for user in users] == [5, 3, 4, 1, 2]
+        assert all(user.id is not None for user in users)
+        assert len(counter.statements) == 1
+        assert "ON CONFLICT" in counter.statements[0]
+
+    @pytest.mark.asyncio
+    async def test_bulk_get_or_create_keeps_existing_users(self, database):
+        """Existing users are returned as-is, with their stored username."""
+        existing = await UserService.get_or_create_user(discord_id=10, username="alice")
+
+        users = await UserService.bulk_get_or_create([10, 11])
+
+        assert users[0].id == existing.id
+        assert users[0].username == "alice"
+        assert users[1].username == "Unknown"
+
+    @pytest.mark.asyncio
+    async def test_bulk_get_or_create_empty(self, database):
+        """No IDs means no query at all."""
+        with _StatementCounter() as counter:
+            assert await UserService.bulk_get_or_create([]) == []
+
+        assert counter.statements == []
+
+    @pytest.mark.asyncio
+    async def test_assign_users_to_task_resolves_in_bulk(self, database):
+        """Assigning five people upserts them in one statement."""
+        task = await TaskService.create_task(title="Plan", creator_discord_id=1)
+
+        with _StatementCounter() as counter:
+            assert await TaskService.assign_users_to_task(task.id, [2, 3, 4, 5, 6])
+
+        user_statements = [s for s in counter.statements if "INTO users" in s]
+        assert len(user_statements) == 1
+        assert not any(s.startswith("SELECT users") for s in counter.statements)
+
+
+class TestIdentityCache:
+    """Test cases for the Discord ID to user identity cache."""
+
+    @pytest.mark.asyncio
+    async def test_team_lookups_hit_the_cache(self, database):
+        """Once a 10-user team is known, identity lookups cost no statements."""
+        team = list(range(100, 110))
+        user_ids = await UserService.resolve_user_ids(team)
+
+        with _StatementCounter() as counter:
+            assert await UserService.resolve_user_ids(team) == user_ids
+            for discord_id, user_id in zip(team, user_ids):
+                identity = await UserService.resolve_user(discord_id)
+                assert (identity.id, identity.timezone) == (user_id, "UTC")
+            await TaskService.create_task(
+                title="Standup", creator_discord_id=100, assignee_discord_ids=team
+            )
+
+        # Only the task's creator and assignees are loaded, by internal id
+        lookups = [
+            statement
+            for statement in counter.statements
+            if "INTO users" in statement or "users.discord_id =" in statement
+        ]
+        assert lookups == []
+
+    @pytest.mark.asyncio
+    async def test_user_lists_resolve_through_cache(self, database):
+        """Task and project lists of a known user do not look the user up."""
+        project = await ProjectService.create_project(name="Apollo")
+        await ProjectService.add_member_to_project(project.id, 2)
+        await TaskService.create_task(
+            title="Report", creator_discord_id=1, assignee_discord_ids=[2]
+        )
+
+        with _StatementCounter() as counter:
+            assert len(await TaskService.get_task_rows_for_user(2)) == 1
+            assert len(await TaskService.get_tasks_for_user(2)) == 1
+            assert len(await TaskService.search_tasks("report", user_discord_id=2)) == 1
+            assert len(await ProjectService.get_projects_for_user(2)) == 1
+
+        lookups = [
+            statement
+            for statement in counter.statements
+            if "users.discord_id =" in statement
+        ]
+        assert lookups == []
+        assert await TaskService.get_task_rows_for_user(3) == []
+
+    @pytest.mark.asyncio
+    async def test_updates_invalidate(self, database):
+        """Timezone changes and deactivation are visible immediately."""
+        user = await UserService.get_or_create_user(discord_id=7, username="bob")
+        assert (await UserService.resolve_user(7)).timezone == "UTC"
+
+        await UserService.update_user_timezone(user.id, "Europe/Paris")
+        assert (await UserService.resolve_user(7)).timezone == "Europe/Paris"
+
+        await UserService.deactivate_user(user.id)
+        assert not (await UserService.resolve_user(7)).is_active
+        assert await UserService.resolve_user(8) is None
+
+    @pytest.mark.asyncio
+    async def test_updates_invalidate_on_outer_commit(self, database):
+        """Inside a unit of work the cached identity is kept until the commit."""
+        user = await UserService.get_or_create_user(discord_id=7, username="bob")
+
+        async with unit_of_work():
+            await UserService.update_user_timezone(user.id, "Europe/Paris")
+            await UserService.deactivate_user(user.id)
+            assert identity_cache.get(7).timezone == "UTC"
+        assert identity_cache.get(7) is None
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_users_are_not_cached(self, database):
+        """Users created in a unit of work are cached only once it commits."""
+        with pytest.raises(RuntimeError):
+            async with unit_of_work():
+                await UserService.resolve_user_ids([20])
+                raise RuntimeError("boom")
+        assert identity_cache.get(20) is None
+
+        async with unit_of_work():
+            (user_id,) = await UserService.resolve_user_ids([21])
+            assert identity_cache.get(21) is None
+        assert identity_cache.get(21).id == user_id
+
+    @pytest.mark.asyncio
+    async def test_replica_reads_are_not_cached(self, read_replica):
+        """Identities are only cached from the primary, never a lagging replica."""
+        async with read_replica.begin() as conn:
+            await conn.execute(
+                User.__table__.insert().values(
+                    discord_id=7, username="bob", timezone="UTC"
+                )
+            )
+        user = await UserService.get_or_create_user(discord_id=7, username="bob")
+        await UserService.update_user_timezone(user.id, "Europe/Paris")
+        identity_cache.clear()
+
+        async def other_request():
+            stale = await UserService.get_user_by_discord_id(7)
+            assert stale.timezone == "UTC"
+            assert identity_cache.get(7) is None
+            return await UserService.resolve_user(7)
+
+        identity = await asyncio.create_task(
+            other_request(), context=contextvars.Context()
+        )
+        assert identity.timezone == "Europe/Paris"
+        assert identity_cache.get(7) == identity
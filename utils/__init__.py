@@ -5,13 +5,22 @@ from .database import (
     get_sync_session, 
     init_database, 
     close_database,
+    get_pool_stats,
+    unit_of_work,
+    use_primary,
     AsyncSessionLocal
 )
+from .schema import SchemaVersionError, ensure_schema
 
 __all__ = [
     "get_async_session",
     "get_sync_session", 
     "init_database",
     "close_database",
-    "AsyncSessionLocal"
+    "get_pool_stats",
+    "unit_of_work",
+    "use_primary",
+    "AsyncSessionLocal",
+    "SchemaVersionError",
+    "ensure_schema",
 ]
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""Bounded in-process caches with expiry and hit/miss counters."""
+
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Least recently used cache whose entries also expire after ``ttl`` seconds.
+
+    Entries are evicted oldest-used first once ``maxsize`` is reached.
+    Values should be immutable (frozen dataclasses, tuples), since the
+    same object is handed to every caller. Not thread-safe; the bot
+    only uses it from the event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Bumped by every pop or clear; see set()
+        self.generation = 0
+        # key -> (expires at, value), least recently used first
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """Cached value of ``key``, or ``default`` if missing or expired.
+
+        Pass a sentinel ``default`` to cache None values, e.g. "no match".
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, generation: Optional[int] = None) -> None:
+        """Cache ``value`` under ``key``, evicting the least recently used.
+
+        Read-through callers pass the :attr:`generation` seen before
+        loading ``value``; if anything was invalidated meanwhile the value
+        may predate that change and is not cached.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove ``key`` and return its value, if cached."""
+        self.generation += 1
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry else None
+
+    def clear(self) -> None:
+        """Remove every entry; the counters are kept."""
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Size and hit/miss counters, for /admin-stats and logs."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def invalidate_on_commit(session: Session, cache: LRUCache, keys: Iterable) -> None:
+    """Drop ``keys`` from ``cache`` once the transaction of ``session`` commits.
+
+    Call it before committing. Inside a unit of work the keys are dropped
+    when the outer transaction commits, so other tasks keep reading the
+    committed values until then. ``session`` may be an ``AsyncSession``.
+    """
+    pending = session.info.setdefault("cache_invalidations", [])
+    pending.extend((cache, key) for key in keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_invalidations(session: Session) -> None:
+    for cache, key in session.info.pop("cache_invalidations", ()):
+        cache.pop(key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session: Session) -> None:
+    session.info.pop("cache_invalidations", None)
@@ -0,0 +1,66 @@
+"""Per-table change counters for caches of query results.
+
+A cache remembers :func:`table_generation` of the tables a result was
+read from, taken before the query runs, and treats the result as stale
+once the generation has moved on. Generations are bumped after every
+session commit that wrote to a table, whether through the ORM (flushed
+objects) or DML statements run with ``session.execute``. Writes from
+bare connections, triggers or other processes are not seen, so caches
+should still expire their entries after a while.
+"""
+
+from collections import Counter
+from typing import Any, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# Commits that wrote to each table since startup
+_generations: Counter = Counter()
+
+
+def table_generation(*tables: str) -> int:
+    """Combined generation of ``tables``; it grows whenever one changes."""
+    return sum(_generations[table] for table in tables)
+
+
+def _changed_tables(session: Session) -> Set[str]:
+    return session.info.setdefault("changed_tables", set())
+
+
+def _record_flush(session: Session, flush_context: Any, instances: Any) -> None:
+    changed = _changed_tables(session)
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        state = inspect(obj)
+        changed.add(state.mapper.local_table.name)
+        # Collections backed by association tables, e.g. Task.assignees
+        for relationship in state.mapper.relationships:
+            if (
+                relationship.secondary is not None
+                and state.attrs[relationship.key].history.has_changes()
+            ):
+                changed.add(relationship.secondary.name)
+
+
+def _record_statement(execute_state: ORMExecuteState) -> None:
+    if execute_state.is_insert or execute_state.is_update or execute_state.is_delete:
+        table = getattr(execute_state.statement, "table", None)
+        if table is not None:
+            _changed_tables(execute_state.session).add(table.name)
+
+
+def _bump_generations(session: Session) -> None:
+    for table in session.info.pop("changed_tables", ()):
+        _generations[table] += 1
+
+
+def _forget_changes(session: Session) -> None:
+    session.info.pop("changed_tables", None)
+
+
+def install_change_tracking(session_class: type) -> None:
+    """Count committed writes of every session of ``session_class``."""
+    event.listen(session_class, "before_flush", _record_flush)
+    event.listen(session_class, "do_orm_execute", _record_statement)
+    event.listen(session_class, "after_commit", _bump_generations)
+    event.listen(session_class, "after_rollback", _forget_changes)
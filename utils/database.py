@@ -1,37 +1,157 @@
 """Database connection and session management."""
 
 import logging
-from typing import AsyncGenerator
+import math
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Optional
 
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
 
 from config.settings import settings
 from models import Base
+from utils.change_tracking import install_change_tracking
+from utils.pool_metrics import MeteredAsyncQueuePool, PoolMetrics
+from utils.query_log import install_query_logging
+from utils.sqlite_profile import SQLITE_PROFILES, PragmaValue, install_sqlite_pragmas
 
 logger = logging.getLogger(__name__)
 
+
+def _sqlite_pragmas(database_url: str) -> Dict[str, PragmaValue]:
+    """Get the pragmas of the configured SQLite profile."""
+    pragmas = dict(SQLITE_PROFILES[settings.database_sqlite_profile])
+    if ":memory:" in database_url:
+        # In-memory databases have no journal file to switch to WAL
+        pragmas.pop("journal_mode", None)
+    return pragmas
+
+
+def _create_async_engine(
+    database_url: str, metrics: Optional[PoolMetrics] = None
+) -> AsyncEngine:
+    """Create an async engine for a sync-style database URL."""
+    if database_url.startswith("sqlite"):
+        # For SQLite
+        engine_options: Dict[str, Any] = {}
+        if ":memory:" not in database_url:
+            # File databases get a pool so WAL readers can run concurrently
+            engine_options = {
+                "poolclass": MeteredAsyncQueuePool,
+                "pool_size": settings.database_pool_size,
+                "max_overflow": settings.database_max_overflow,
+                "pool_timeout": settings.database_pool_timeout,
+            }
+        engine = create_async_engine(
+            database_url.replace("sqlite:///", "sqlite+aiosqlite:///"),
+            echo=settings.debug,
+            future=True,
+            connect_args={"check_same_thread": False},
+            **engine_options,
+        )
+        install_sqlite_pragmas(engine.sync_engine, _sqlite_pragmas(database_url))
+    else:
+        # For PostgreSQL
+        engine = create_async_engine(
+            database_url.replace("postgresql://", "postgresql+asyncpg://"),
+            echo=settings.debug,
+            future=True,
+            poolclass=MeteredAsyncQueuePool,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout,
+            pool_pre_ping=settings.database_pool_pre_ping,
+            pool_recycle=settings.database_pool_recycle,
+            connect_args={
+                "prepared_statement_cache_size": (
+                    settings.database_statement_cache_size
+                )
+            },
+        )
+
+    if isinstance(engine.pool, MeteredAsyncQueuePool):
+        engine.pool.metrics = metrics
+    install_query_logging(engine.sync_engine)
+    return engine
+
+
+# Checkout metrics for the async engine pool (reported by /admin-stats)
+pool_metrics = PoolMetrics()
+
 # Create async engine
-if settings.database_url.startswith("sqlite"):
-    # For SQLite
-    async_engine = create_async_engine(
-        settings.database_url.replace("sqlite:///", "sqlite+aiosqlite:///"),
-        echo=settings.debug,
-        future=True,
-        connect_args={"check_same_thread": False},
-    )
-else:
-    # For PostgreSQL
-    async_engine = create_async_engine(
-        settings.database_url.replace("postgresql://", "postgresql+asyncpg://"),
-        echo=settings.debug,
-        future=True,
-    )
+async_engine = _create_async_engine(settings.database_url, pool_metrics)
+
+# Optional read replica for read-only service methods
+read_engine: Optional[AsyncEngine] = None
+if settings.database_read_url:
+    read_engine = _create_async_engine(settings.database_read_url)
+
+# Until when (time.monotonic()) the current task's reads use the primary.
+# Set when it writes, so its reads see its own writes while the replica
+# catches up; long-lived tasks such as the notification loop return to
+# the replica afterwards.
+_pinned_until: ContextVar[float] = ContextVar("pinned_until", default=0.0)
+
+
+def _pinned_to_primary() -> bool:
+    return _pinned_until.get() > time.monotonic()
+
+
+class UnitOfWorkSession(AsyncSession):
+    """Async session shared by every service call in one unit of work.
+
+    Only the outermost ``get_async_session()`` scope owns the transaction;
+    commits issued from joined scopes just flush so the work stays in a
+    single transaction on a single connection.
+    """
+
+    @property
+    def scope_depth(self) -> int:
+        """Number of ``get_async_session()`` scopes currently using this session."""
+        return self.info.get("scope_depth", 0)
 
-# Create async session maker
+    @property
+    def read_only(self) -> bool:
+        """Whether this session reads from the replica."""
+        return self.info.get("read_only", False)
+
+    async def commit(self) -> None:
+        """Commit, or only flush when called from a joined scope."""
+        if self.scope_depth > 1:
+            await self.flush()
+        else:
+            await super().commit()
+            if read_engine is not None and not self.read_only:
+                pinned_until = (
+                    time.monotonic() + settings.database_read_your_writes_seconds
+                )
+                _pinned_until.set(max(_pinned_until.get(), pinned_until))
+
+
+# Let result caches notice committed writes (see utils.change_tracking)
+install_change_tracking(UnitOfWorkSession.sync_session_class)
+
+# Create async session makers
 AsyncSessionLocal = async_sessionmaker(
-    async_engine, class_=AsyncSession, expire_on_commit=False
+    async_engine, class_=UnitOfWorkSession, expire_on_commit=False
+)
+AsyncReadSessionLocal: Optional[async_sessionmaker[UnitOfWorkSession]] = None
+if read_engine is not None:
+    AsyncReadSessionLocal = async_sessionmaker(
+        read_engine, class_=UnitOfWorkSession, expire_on_commit=False
+    )
+
+# Session of the unit of work active in the current task, if any
+_current_session: ContextVar[Optional[UnitOfWorkSession]] = ContextVar(
+    "current_session", default=None
 )
 
 # Sync engine for migrations and initial setup
@@ -41,22 +161,67 @@ if settings.database_url.startswith("sqlite"):
         echo=settings.debug,
         connect_args={"check_same_thread": False},
     )
+    install_sqlite_pragmas(sync_engine, _sqlite_pragmas(settings.database_url))
 else:
     sync_engine = create_engine(settings.database_url, echo=settings.debug)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
 
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get async database session."""
-    async with AsyncSessionLocal() as session:
+@asynccontextmanager
+async def get_async_session(
+    read_only: bool = False,
+) -> AsyncIterator[UnitOfWorkSession]:
+    """Get async database session, joining the active unit of work if any.
+
+    With ``read_only=True`` the session is served by the read replica when
+    one is configured, unless the current task wrote recently (its reads
+    are then pinned to the primary to see its own writes).
+    """
+    session = _current_session.get()
+    # Writes never join a replica session; reads join whatever is active
+    if session is not None and (read_only or not session.read_only):
+        session.info["scope_depth"] += 1
+        try:
+            yield session
+        finally:
+            session.info["scope_depth"] -= 1
+        return
+
+    use_replica = (
+        read_only and AsyncReadSessionLocal is not None and not _pinned_to_primary()
+    )
+    session_factory = AsyncReadSessionLocal if use_replica else AsyncSessionLocal
+
+    async with session_factory() as session:
+        session.info["scope_depth"] = 1
+        session.info["read_only"] = use_replica
+        token = _current_session.set(session)
         try:
             yield session
         except Exception:
             await session.rollback()
             raise
         finally:
-            await session.close()
+            _current_session.reset(token)
+
+
+@asynccontextmanager
+async def use_primary() -> AsyncIterator[None]:
+    """Route all reads inside the block to the primary database."""
+    token = _pinned_until.set(math.inf)
+    try:
+        yield
+    finally:
+        _pinned_until.reset(token)
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[UnitOfWorkSession]:
+    """Run several service calls in one session and commit them together."""
+    async with get_async_session() as session:
+        yield session
+        await session.commit()
 
 
 def get_sync_session():
@@ -68,6 +233,11 @@ def get_sync_session():
         db.close()
 
 
+def get_pool_stats() -> Dict[str, Any]:
+    """Get connection pool occupancy and checkout wait statistics."""
+    return pool_metrics.snapshot(async_engine.pool)
+
+
 async def init_database():
     """Initialize database tables."""
     try:
@@ -82,4 +252,6 @@ async def init_database():
 async def close_database():
     """Close database connections."""
     await async_engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
     logger.info("Database connections closed")
@@ -0,0 +1,68 @@
+"""Cache of rendered task embeds.
+
+Building a task embed formats dates, mentions and emoji on every view,
+button press and summary. The result only depends on the task and on a
+few rendering inputs, so its serialized payload (``Embed.to_dict()``) is
+cached under a key made by :func:`task_embed_key` and turned back into
+an ``Embed`` for each caller.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import discord
+
+from config.settings import settings
+from utils.cache import LRUCache
+
+# Embed key -> serialized embed payload
+task_embed_cache: LRUCache[Tuple, Dict[str, Any]] = LRUCache(
+    settings.embed_cache_size, settings.embed_cache_ttl
+)
+
+# Payload parts discord.Embed.from_dict adopts without copying
+_NESTED_PARTS = ("footer", "thumbnail", "image", "author", "video", "provider")
+
+
+def task_embed_key(task: Any, *variant: Hashable) -> Tuple:
+    """Cache key of the embed of ``task``.
+
+    ``version`` and ``updated_at`` change with every update of the task
+    row; assignees, project and creator are related rows that can change
+    without touching it, so the values the embeds show are part of the
+    key too. ``variant`` names the renderer and anything else its output
+    depends on besides the task.
+    """
+    project = getattr(task, "project", None)
+    creator = getattr(task, "creator", None)
+    return (
+        task.id,
+        getattr(task, "version", None),
+        getattr(task, "updated_at", None),
+        tuple(getattr(user, "discord_id", None) for user in task.assignees or ()),
+        getattr(project, "name", None),
+        getattr(creator, "discord_id", None),
+        *variant,
+    )
+
+
+def cached_embed(key: Tuple, build: Callable[[], discord.Embed]) -> discord.Embed:
+    """Embed cached under ``key``, calling ``build`` to render it on a miss.
+
+    Every call returns a new ``Embed``, so callers may add fields to it
+    without changing the cached payload.
+    """
+    payload = task_embed_cache.get(key)
+    if payload is None:
+        payload = build().to_dict()
+        task_embed_cache.set(key, payload)
+    return _embed_from_payload(payload)
+
+
+def _embed_from_payload(payload: Dict[str, Any]) -> discord.Embed:
+    data = dict(payload)
+    if "fields" in data:
+        data["fields"] = [dict(field) for field in data["fields"]]
+    for part in _NESTED_PARTS:
+        if part in data:
+            data[part] = dict(data[part])
+    return discord.Embed.from_dict(data)
@@ -0,0 +1,108 @@
+"""Keyset (cursor) pagination on ``(created_at, id)`` or ``(score, id)``."""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Callable, Iterable, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.sql.elements import ColumnElement
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class Page(List[T]):
+    """One page of results plus the cursor of the next page, if any.
+
+    A plain list otherwise, so callers that only need the items can keep
+    treating it as one.
+    """
+
+    def __init__(self, items: Iterable[T] = (), next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """Opaque token pointing just past the item with this sort key."""
+    raw = f"{created_at.isoformat()}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Sort key ``(created_at, id)`` encoded in a cursor from :func:`encode_cursor`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, item_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+
+def encode_score_cursor(score: float, item_id: int) -> str:
+    """Opaque token pointing just past the item with this relevance score."""
+    raw = f"score:{score!r}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_score_cursor(cursor: str) -> Tuple[float, int]:
+    """Sort key ``(score, id)`` encoded by :func:`encode_score_cursor`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        prefix, _, key = raw.partition(":")
+        if prefix != "score":
+            raise ValueError(raw)
+        score, item_id = key.rsplit("|", 1)
+        return float(score), int(item_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+
+def keyset_before(
+    created_at_column: Any, id_column: Any, created_at: datetime, item_id: int
+) -> ColumnElement:
+    """Rows sorting after ``(created_at, item_id)`` in ``created_at DESC, id DESC``.
+
+    The cursor row's stored ``created_at`` is compared when it still exists,
+    since databases like SQLite may store timestamps in a different text
+    form than the bound parameter would render.
+    """
+    cursor_created_at = func.coalesce(
+        select(created_at_column).where(id_column == item_id).scalar_subquery(),
+        created_at,
+    )
+    return or_(
+        created_at_column < cursor_created_at,
+        and_(created_at_column == cursor_created_at, id_column < item_id),
+    )
+
+
+def keyset_below(
+    score_column: Any, id_column: Any, score: float, item_id: int
+) -> ColumnElement:
+    """Rows sorting after ``(score, item_id)`` in ``score DESC, id DESC``."""
+    return or_(score_column < score, and_(score_column == score, id_column < item_id))
+
+
+def _created_at_cursor(item: Any) -> str:
+    return encode_cursor(item.created_at, item.id)
+
+
+def build_page(
+    rows: List[Any],
+    limit: int,
+    make_cursor: Callable[[Any], str] = _created_at_cursor,
+) -> Page:
+    """Page from ``limit + 1`` fetched rows.
+
+    The next cursor is built from the last row of the page, by default from
+    its ``created_at`` and ``id``.
+    """
+    if len(rows) <= limit:
+        return Page(rows)
+    items = rows[:limit]
+    return Page(items, make_cursor(items[-1]))
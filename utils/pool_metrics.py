@@ -0,0 +1,138 @@
+"""Connection pool instrumentation."""
+
+import bisect
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import exc
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    Pool,
+    PoolProxiedConnection,
+)
+from sqlalchemy.util.queue import AsyncAdaptedQueue
+
+# Upper bounds (in milliseconds) of the checkout wait histogram buckets
+DEFAULT_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """Counters and a wait-time histogram for connection checkouts."""
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_WAIT_BUCKETS_MS):
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all collected measurements."""
+        # One extra slot for waits longer than the last bucket
+        self.wait_counts: List[int] = [0] * (len(self.buckets_ms) + 1)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def observe_wait(self, wait_ms: float) -> None:
+        """Record how long a checkout waited for a connection."""
+        self.checkouts += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        self.wait_counts[bisect.bisect_left(self.buckets_ms, wait_ms)] += 1
+
+    def observe_timeout(self) -> None:
+        """Record a checkout that gave up after ``pool_timeout``."""
+        self.timeouts += 1
+
+    def histogram(self) -> Dict[str, int]:
+        """Return the wait histogram as ``{bucket label: count}``."""
+        labels = [f"<={bound:g}ms" for bound in self.buckets_ms]
+        labels.append(f">{self.buckets_ms[-1]:g}ms")
+        return dict(zip(labels, self.wait_counts))
+
+    def snapshot(self, pool: Optional[Pool] = None) -> Dict[str, Any]:
+        """Return current pool occupancy together with collected metrics."""
+        stats: Dict[str, Any] = {
+            "pool_class": type(pool).__name__ if pool is not None else None,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": (
+                self.total_wait_ms / self.checkouts if self.checkouts else 0.0
+            ),
+            "max_wait_ms": self.max_wait_ms,
+            "wait_histogram": self.histogram(),
+        }
+
+        # Only queue-style pools expose sizing information
+        for name in ("size", "checkedout", "checkedin", "overflow"):
+            method = getattr(pool, name, None)
+            stats[name] = method() if callable(method) else None
+
+        # QueuePool counts overflow from -pool_size while the pool is filling
+        if stats["overflow"] is not None:
+            stats["overflow"] = max(stats["overflow"], 0)
+
+        return stats
+
+
+class _MeteredQueue(AsyncAdaptedQueue):
+    """Pool queue that reports how long each ``get`` waited for a connection."""
+
+    observe: Optional[Callable[[float], None]] = None
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        started = time.perf_counter()
+        entry = super().get(block, timeout)
+        if self.observe is not None:
+            self.observe((time.perf_counter() - started) * 1000)
+        return entry
+
+
+class MeteredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long checkouts wait in its queue.
+
+    Only the time spent waiting for a pooled connection is measured.
+    Opening a new connection, reconnecting and pre-ping happen after the
+    wait and are left out, so the histogram shows pool contention rather
+    than database latency.
+    """
+
+    _queue_class = _MeteredQueue
+    metrics: Optional[PoolMetrics] = None
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._pool.observe = self._observe_wait
+
+    def _observe_wait(self, wait_ms: float) -> None:
+        if self.metrics is not None:
+            self.metrics.observe_wait(wait_ms)
+
+    def _create_connection(self) -> ConnectionPoolEntry:
+        """Open a new connection; the checkout did not wait in the queue."""
+        entry = super()._create_connection()
+        self._observe_wait(0.0)
+        return entry
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, counting checkouts that time out."""
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.observe_timeout()
+            raise
+
+    def dispose(self) -> None:
+        """Close pooled connections without recording their removal as waits."""
+        self._pool.observe = None
+        try:
+            super().dispose()
+        finally:
+            self._pool.observe = self._observe_wait
+
+    def recreate(self) -> "MeteredAsyncQueuePool":
+        """Recreate the pool, carrying the metrics over to the new instance."""
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
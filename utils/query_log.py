@@ -0,0 +1,152 @@
+"""Slow-query logging and per-interaction statement counts."""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Engine, event
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_REPEATED_VALUE_LISTS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement so that executions differing only in values match.
+
+    Literals and bind parameters become ``?``, ``IN``/``VALUES`` lists collapse
+    to ``(...)`` and whitespace is squeezed.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(...)", normalized)
+    normalized = _REPEATED_VALUE_LISTS.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class InteractionQueryStats:
+    """Statements issued while handling one interaction."""
+
+    def __init__(self, command_name: str):
+        self.command_name = command_name
+        self.statement_count = 0
+        self.total_ms = 0.0
+        self.fingerprints: Counter = Counter()
+        self.started_at = time.perf_counter()
+
+    def record(self, statement_fingerprint: str, duration_ms: float) -> None:
+        """Count one executed statement."""
+        self.statement_count += 1
+        self.total_ms += duration_ms
+        self.fingerprints[statement_fingerprint] += 1
+
+    def repeated(self, minimum: int = 2) -> List[Tuple[str, int]]:
+        """Statements issued at least ``minimum`` times, most frequent first."""
+        return [
+            (statement, count)
+            for statement, count in self.fingerprints.most_common()
+            if count >= minimum
+        ]
+
+
+# Stats of the interaction handled by the current task, if any
+_current_stats: ContextVar[Optional[InteractionQueryStats]] = ContextVar(
+    "interaction_query_stats", default=None
+)
+
+
+def current_command_name() -> Optional[str]:
+    """Name of the slash command being handled by the current task, if any."""
+    stats = _current_stats.get()
+    return stats.command_name if stats else None
+
+
+def start_interaction(command_name: str) -> InteractionQueryStats:
+    """Start counting statements for the interaction handled by the current task.
+
+    Statements issued later in the same task (and in tasks it spawns) are
+    attributed to ``command_name`` until the task ends.
+    """
+    stats = InteractionQueryStats(command_name)
+    _current_stats.set(stats)
+    return stats
+
+
+def finish_interaction(stats: InteractionQueryStats) -> None:
+    """Log the statement count of a finished interaction."""
+    elapsed_ms = (time.perf_counter() - stats.started_at) * 1000
+    message = (
+        f"/{stats.command_name} issued {stats.statement_count} statements "
+        f"({stats.total_ms:.1f} ms in database, {elapsed_ms:.1f} ms total)"
+    )
+    if stats.statement_count < settings.interaction_query_warning_count:
+        logger.debug(message)
+        return
+
+    repeated = stats.repeated()
+    if repeated:
+        statement, count = repeated[0]
+        message += f"; most repeated ({count}x): {statement}"
+    logger.warning(message)
+
+
+@contextmanager
+def track_interaction(command_name: str) -> Iterator[InteractionQueryStats]:
+    """Count statements issued inside the block and log them at the end."""
+    stats = InteractionQueryStats(command_name)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        finish_interaction(stats)
+
+
+def install_query_logging(engine: Engine) -> None:
+    """Time every statement on ``engine`` and log those over the threshold."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        conn: Any, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        conn: Any, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        duration_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        statement_fingerprint = fingerprint(statement)
+
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement_fingerprint, duration_ms)
+
+        if duration_ms >= settings.slow_query_threshold_ms:
+            command = f"/{stats.command_name}" if stats else "background"
+            logger.warning(
+                f"Slow query ({duration_ms:.1f} ms) in {command}: "
+                f"{statement_fingerprint}"
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context: Any) -> None:
+        # Failed statements never reach after_cursor_execute
+        connection = context.connection
+        start_times = connection.info.get("query_start_time") if connection else None
+        if start_times and context.statement is not None:
+            start_times.pop()
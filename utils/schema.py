@@ -0,0 +1,150 @@
+"""Startup check of the database schema version against the Alembic head."""
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import DBAPIError
+
+from config.settings import settings
+from models import Base
+from utils.database import async_engine
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+
+# Revision of the schema that ``create_all`` built before the bot checked
+# revisions; such databases have these tables but no ``alembic_version``
+BASELINE_REVISION = "47a6552f8abd"
+BASELINE_TABLES = frozenset({"users", "projects", "tasks", "time_entries"})
+
+
+class SchemaVersionError(RuntimeError):
+    """Raised when the database schema does not match the packaged migrations."""
+
+
+def _alembic_config() -> Config:
+    """Alembic config for the packaged migrations.
+
+    Built without alembic.ini so running migrations in-process does not
+    reconfigure the bot's logging.
+    """
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    return config
+
+
+@lru_cache(maxsize=1)
+def packaged_head() -> str:
+    """Head revision of the migrations shipped with this code."""
+    return ScriptDirectory.from_config(_alembic_config()).get_current_head()
+
+
+async def get_database_revision() -> Optional[str]:
+    """Revision stored in ``alembic_version``, or None if it was never stamped."""
+    try:
+        async with async_engine.connect() as conn:
+            return await conn.scalar(text("SELECT version_num FROM alembic_version"))
+    except DBAPIError:
+        # No alembic_version table yet
+        return None
+
+
+def _has_tables(sync_conn) -> bool:
+    return bool(inspect(sync_conn).get_table_names())
+
+
+def _is_baseline_schema(sync_conn) -> bool:
+    """Whether the tables are those of :data:`BASELINE_REVISION`.
+
+    The recurrence columns arrived with the baseline revision and
+    ``tasks.version`` with a later one.
+    """
+    inspector = inspect(sync_conn)
+    if not BASELINE_TABLES <= set(inspector.get_table_names()):
+        return False
+    columns = {column["name"] for column in inspector.get_columns("tasks")}
+    return "is_recurring" in columns and "version" not in columns
+
+
+def _stamp_baseline(sync_conn) -> None:
+    MigrationContext.configure(sync_conn).stamp(
+        ScriptDirectory.from_config(_alembic_config()), BASELINE_REVISION
+    )
+
+
+def _create_and_stamp(sync_conn) -> None:
+    Base.metadata.create_all(sync_conn)
+    MigrationContext.configure(sync_conn).stamp(
+        ScriptDirectory.from_config(_alembic_config()), "head"
+    )
+
+
+def _upgrade(sync_conn) -> None:
+    config = _alembic_config()
+    config.attributes["connection"] = sync_conn
+    command.upgrade(config, "head")
+
+
+async def ensure_schema(mode: Optional[str] = None) -> None:
+    """Make sure the database schema is at the packaged Alembic head.
+
+    The common case costs a single ``SELECT`` on ``alembic_version``. What
+    happens otherwise depends on ``mode`` (``settings.database_schema_mode``
+    by default):
+
+    - ``check``: raise :class:`SchemaVersionError`
+    - ``upgrade``: run the pending migrations, or create and stamp the
+      schema on an empty database. Unversioned databases built by
+      ``create_all`` before revisions were checked are stamped at
+      :data:`BASELINE_REVISION` first.
+    - ``create``: dev/test only, run ``create_all`` and stamp the head
+    """
+    mode = mode or settings.database_schema_mode
+    head = packaged_head()
+
+    if mode == "create":
+        async with async_engine.begin() as conn:
+            await conn.run_sync(_create_and_stamp)
+        logger.info(f"Created database tables and stamped revision {head}")
+        return
+
+    revision = await get_database_revision()
+    if revision == head:
+        logger.info(f"Database schema is at head revision {head}")
+        return
+
+    if mode != "upgrade":
+        raise SchemaVersionError(
+            f"Database schema is at revision {revision}, expected {head}. "
+            f"Run `alembic upgrade head` or set DATABASE_SCHEMA_MODE=upgrade. "
+            f"Databases created before migrations were checked need a one-time "
+            f"`alembic stamp {BASELINE_REVISION}` first."
+        )
+
+    async with async_engine.begin() as conn:
+        if revision is None and await conn.run_sync(_is_baseline_schema):
+            await conn.run_sync(_stamp_baseline)
+            logger.info(f"Stamped unversioned database at {BASELINE_REVISION}")
+            revision = BASELINE_REVISION
+        elif revision is None:
+            if await conn.run_sync(_has_tables):
+                raise SchemaVersionError(
+                    "Database has tables but no Alembic revision. Run "
+                    "`alembic stamp <revision>` for the schema it has (usually "
+                    f"`alembic stamp {BASELINE_REVISION}` for databases created "
+                    "before migrations were checked), then restart."
+                )
+            await conn.run_sync(_create_and_stamp)
+            logger.info(f"Created database schema at revision {head}")
+            return
+
+        await conn.run_sync(_upgrade)
+    logger.info(f"Upgraded database schema from {revision} to {head}")
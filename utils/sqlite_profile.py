@@ -0,0 +1,44 @@
+"""SQLite connection profiles applied through engine events."""
+
+import logging
+from typing import Any, Dict, Union
+
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+PragmaValue = Union[str, int]
+
+# Tuned for a bot process with one writer and many concurrent readers:
+# WAL lets readers proceed while a write is in progress, NORMAL sync is
+# durable across application crashes in WAL mode, and busy_timeout makes
+# writers queue for the lock instead of failing with "database is locked".
+PRODUCTION_PRAGMAS: Dict[str, PragmaValue] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,  # milliseconds
+    "mmap_size": 256 * 1024 * 1024,  # bytes
+    "cache_size": -64 * 1024,  # negative means KiB, i.e. 64 MiB
+}
+
+SQLITE_PROFILES: Dict[str, Dict[str, PragmaValue]] = {
+    "production": PRODUCTION_PRAGMAS,
+    "default": {},
+}
+
+
+def install_sqlite_pragmas(engine: Engine, pragmas: Dict[str, PragmaValue]) -> None:
+    """Run ``PRAGMA name=value`` for every new connection of ``engine``."""
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    logger.debug(f"Installed SQLite pragmas on {engine.url}: {pragmas}")